@@ -1 +1,11 @@
-from .api import Inpost
+__all__ = ["Inpost"]
+
+
+def __getattr__(name: str):
+    # `Inpost` pulls in aiohttp, import it on first access so `inpost.static` stays cheap to import
+    if name == "Inpost":
+        from .api import Inpost
+
+        return Inpost
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,25 @@
+import asyncio
 import logging
-from typing import List
+import random
+from typing import AsyncIterator, Callable, Iterable, List, Tuple
 
 from aiohttp import ClientResponse, ClientSession
 from aiohttp.typedefs import StrOrURL
 
+from inpost.points import PointCache
+from inpost.sessions import CollectSession
 from inpost.static import (
+    CollectResult,
+    CompartmentActualStatus,
     CompartmentExpectedStatus,
+    CompartmentStatusTimeoutError,
     DeliveryType,
     Friend,
     MissingParamsError,
     NoParcelError,
     NotAuthenticatedError,
     NotFoundError,
+    Notification,
     Parcel,
     ParcelCarrierSize,
     ParcelLockerSize,
@@ -22,6 +30,7 @@ from inpost.static import (
     ParcelTypeError,
     PhoneNumberError,
     Point,
+    PointRegistry,
     ReAuthenticationError,
     Receiver,
     RefreshTokenError,
@@ -30,6 +39,7 @@ from inpost.static import (
     SentParcel,
     SingleParamError,
     SmsCodeError,
+    StepTimings,
     UnauthorizedError,
     UnidentifiedAPIError,
     appjson,
@@ -38,6 +48,7 @@ from inpost.static import (
     compartment_open_url,
     compartment_reopen_url,
     compartment_status_url,
+    confirm_sent_url,
     confirm_sms_code_url,
     create_blik_url,
     create_url,
@@ -45,6 +56,7 @@ from inpost.static import (
     logout_url,
     multi_url,
     open_sent_url,
+    parcel_notifications_url,
     parcel_points_url,
     parcel_prices_url,
     refresh_token_url,
@@ -71,6 +83,7 @@ class Inpost:
         sms_code=None,
         auth_token=None,
         refr_token=None,
+        point_cache: PointCache | None = None,
     ):
         """Constructor method
         :param prefix: country code
@@ -83,6 +96,8 @@ class Inpost:
         :type auth_token: str
         :param refr_token: refresh token from inpost
         :type refr_token: str
+        :param point_cache: cache answering repeated `get_parcel_points` calls locally, disabled if None
+        :type point_cache: PointCache | None
         :raises PhoneNumberError: Wrong phone number format or is not digit
         """
 
@@ -100,6 +115,8 @@ class Inpost:
         self.sms_code: str | None = sms_code
         self.auth_token: str | None = auth_token
         self.refr_token: str | None = refr_token
+        self.point_cache: PointCache | None = point_cache
+        self.point_registry: PointRegistry = PointRegistry()
         self.sess: ClientSession = ClientSession()
         self._log = logging.getLogger(f"{self.__class__.__name__}.{phone_number}")
 
@@ -405,16 +422,7 @@ class Inpost:
 
         if resp.status == 200:
             self._log.debug(f"parcel with shipment number {shipment_number} received")
-            match parcel_type:
-                case ParcelType.TRACKED:
-                    return await resp.json() if not parse else Parcel(await resp.json(), logger=self._log)
-                case ParcelType.SENT:
-                    return await resp.json() if not parse else SentParcel(await resp.json(), logger=self._log)
-                case ParcelType.RETURNS:
-                    return await resp.json() if not parse else ReturnParcel(await resp.json(), logger=self._log)
-                case _:
-                    self._log.error(f"wrong parcel type {parcel_type}")
-                    raise ParcelTypeError(reason=f"Unknown parcel type: {parcel_type}")
+            return await resp.json() if not parse else self._parse_parcel(await resp.json(), parcel_type)
 
         raise UnidentifiedAPIError(reason=resp)
 
@@ -453,6 +461,81 @@ class Inpost:
             self._log.error("authorization token missing")
             raise NotAuthenticatedError(reason="Not logged in")
 
+        _, _parcels = await self._fetch_parcels(parcel_type=parcel_type)
+        _parcels = self._filter_parcels(
+            parcels=_parcels, status=status, pickup_point=pickup_point, shipment_type=shipment_type
+        )
+
+        return (
+            list(_parcels)
+            if not parse
+            else [Parcel(parcel_data=data, logger=self._log, point_registry=self.point_registry) for data in _parcels]
+        )
+
+    async def iter_parcels(
+        self,
+        parcel_type: ParcelType | List[ParcelType] | None = None,
+        status: ParcelStatus | List[ParcelStatus] | None = None,
+        pickup_point: str | List[str] | None = None,
+        shipment_type: ParcelShipmentType | List[ParcelShipmentType] | None = None,
+        parse: bool = False,
+    ) -> AsyncIterator[dict | Parcel | SentParcel | ReturnParcel]:
+        """Fetches parcels of all requested types concurrently and yields them as soon as each response arrives
+
+        :param parcel_type: Parcel types to fetch, defaults to tracked, sent and returned parcels
+        :type parcel_type: ParcelType | list[ParcelType] | None
+        :param status: status that each fetched parcels has to be in
+        :type status: ParcelStatus | list[ParcelStatus] | None
+        :param pickup_point: Fetched parcels have to be picked from this pickup point (e.g. `GXO05M`)
+        :type pickup_point: str | list[str] | None
+        :param shipment_type: Fetched parcels have to be shipped that way
+        :type shipment_type: ParcelShipmentType | list[ParcelShipmentType] | None
+        :param parse: if set to True method will yield parsed parcels matching their type else :class:`dict`
+        :type parse: bool
+        :return: async iterator over fetched parcels
+        :rtype: AsyncIterator[dict | Parcel | SentParcel | ReturnParcel]
+        :raises NotAuthenticatedError: User not authenticated in inpost service
+        :raises ParcelTypeError: Unknown parcel type selected
+        :raises UnauthorizedError: Unauthorized access to inpost services,
+        :raises NotFoundError: Phone number not found
+        :raises UnidentifiedAPIError: Unexpected thing happened
+        """
+
+        self._log.info("iterating over parcels")
+
+        if not self.auth_token:
+            self._log.error("authorization token missing")
+            raise NotAuthenticatedError(reason="Not logged in")
+
+        if parcel_type is None:
+            parcel_type = [ParcelType.TRACKED, ParcelType.SENT, ParcelType.RETURNS]
+        elif isinstance(parcel_type, ParcelType):
+            parcel_type = [parcel_type]
+
+        tasks = [asyncio.create_task(self._fetch_parcels(parcel_type=type_)) for type_ in parcel_type]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                type_, _parcels = await next_done
+                for data in self._filter_parcels(
+                    parcels=_parcels, status=status, pickup_point=pickup_point, shipment_type=shipment_type
+                ):
+                    yield data if not parse else self._parse_parcel(parcel_data=data, parcel_type=type_)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_parcels(self, parcel_type: ParcelType) -> Tuple[ParcelType, List[dict]]:
+        """Fetches raw parcels list of given type
+
+        :param parcel_type: Parcel type (e.g. received, sent, returned)
+        :type parcel_type: ParcelType
+        :return: requested parcel type along with fetched parcels data
+        :rtype: tuple[ParcelType, list[dict]]
+        :raises ParcelTypeError: Unknown parcel type selected
+        :raises UnidentifiedAPIError: Unexpected thing happened
+        """
+
         match parcel_type:
             case ParcelType.TRACKED:
                 self._log.debug(f"getting parcel type {parcel_type}")
@@ -475,31 +558,73 @@ class Inpost:
                 raise UnidentifiedAPIError(reason=resp)
 
             self._log.debug(f"received {parcel_type} parcels")
-            _parcels = (await resp.json())["parcels"]
+            return parcel_type, (await resp.json())["parcels"]
+
+    @staticmethod
+    def _filter_parcels(
+        parcels: Iterable[dict],
+        status: ParcelStatus | List[ParcelStatus] | None = None,
+        pickup_point: str | List[str] | None = None,
+        shipment_type: ParcelShipmentType | List[ParcelShipmentType] | None = None,
+    ) -> Iterable[dict]:
+        """Lazily filters raw parcels data
+
+        :param parcels: raw parcels data
+        :type parcels: Iterable[dict]
+        :param status: status that each parcel has to be in
+        :type status: ParcelStatus | list[ParcelStatus] | None
+        :param pickup_point: parcels have to be picked from this pickup point (e.g. `GXO05M`)
+        :type pickup_point: str | list[str] | None
+        :param shipment_type: parcels have to be shipped that way
+        :type shipment_type: ParcelShipmentType | list[ParcelShipmentType] | None
+        :return: filtered parcels data
+        :rtype: Iterable[dict]
+        """
 
-            if status is not None:
-                if isinstance(status, ParcelStatus):
-                    status = [status]
+        if status is not None:
+            if isinstance(status, ParcelStatus):
+                status = [status]
 
-                _parcels = (_parcel for _parcel in _parcels if ParcelStatus[_parcel.get("status")] in status)
+            parcels = (_parcel for _parcel in parcels if ParcelStatus[_parcel.get("status")] in status)
 
-            if pickup_point is not None:
-                if isinstance(pickup_point, str):
-                    pickup_point = [pickup_point]
+        if pickup_point is not None:
+            if isinstance(pickup_point, str):
+                pickup_point = [pickup_point]
 
-                _parcels = (_parcel for _parcel in _parcels if _parcel["pickUpPoint"]["name"] in pickup_point)
+            parcels = (_parcel for _parcel in parcels if _parcel.get("pickUpPoint", {}).get("name") in pickup_point)
 
-            if shipment_type is not None:
-                if isinstance(shipment_type, ParcelShipmentType):
-                    shipment_type = [shipment_type]
+        if shipment_type is not None:
+            if isinstance(shipment_type, ParcelShipmentType):
+                shipment_type = [shipment_type]
 
-                _parcels = (
-                    _parcel
-                    for _parcel in _parcels
-                    if ParcelShipmentType[_parcel["shipmentType"]] in list(shipment_type)
-                )
+            parcels = (
+                _parcel for _parcel in parcels if ParcelShipmentType[_parcel.get("shipmentType")] in list(shipment_type)
+            )
 
-            return list(_parcels) if not parse else [Parcel(parcel_data=data, logger=self._log) for data in _parcels]
+        return parcels
+
+    def _parse_parcel(self, parcel_data: dict, parcel_type: ParcelType) -> Parcel | SentParcel | ReturnParcel:
+        """Parses raw parcel data into object matching its type
+
+        :param parcel_data: raw parcel data
+        :type parcel_data: dict
+        :param parcel_type: Parcel type (e.g. received, sent, returned)
+        :type parcel_type: ParcelType
+        :return: parsed parcel
+        :rtype: Parcel | SentParcel | ReturnParcel
+        :raises ParcelTypeError: Unknown parcel type selected
+        """
+
+        match parcel_type:
+            case ParcelType.TRACKED:
+                return Parcel(parcel_data, logger=self._log, point_registry=self.point_registry)
+            case ParcelType.SENT:
+                return SentParcel(parcel_data, logger=self._log, point_registry=self.point_registry)
+            case ParcelType.RETURNS:
+                return ReturnParcel(parcel_data, logger=self._log, point_registry=self.point_registry)
+            case _:
+                self._log.error(f"wrong parcel type {parcel_type}")
+                raise ParcelTypeError(reason=f"Unknown parcel type: {parcel_type}")
 
     async def get_multi_compartment(self, multi_uuid: str | int, parse: bool = False) -> dict | List[Parcel]:
         """Fetches all available parcels for set `Inpost.phone_number` and optionally filters them
@@ -533,7 +658,10 @@ class Inpost:
             return (
                 (await resp.json())["parcels"]
                 if not parse
-                else [Parcel(data, logger=self._log) for data in (await resp.json())["parcels"]]
+                else [
+                    Parcel(data, logger=self._log, point_registry=self.point_registry)
+                    for data in (await resp.json())["parcels"]
+                ]
             )
 
         raise UnidentifiedAPIError(reason=resp)
@@ -765,6 +893,338 @@ class Inpost:
 
         return None
 
+    async def collect_pipelined(
+        self, shipment_number: str | None = None, parcel_obj: Parcel | None = None, location: dict | None = None
+    ) -> CollectResult:
+        """Faster variant of :meth:`collect` for latency critical pickups, reports duration of every step.
+        Status check is sent right after compartment open request succeeds, while its response is still being read,
+        so the status request needs a second connection from the session pool. Every response is released as soon as
+        it is read, so its connection goes straight back to the pool and is reused by following requests.
+        Collect session is terminated when opening or status check fails after validation.
+
+        :param shipment_number: Parcel's shipment number, skip it if fresh `parcel_obj` is already held
+        :type shipment_number: int | str | None
+        :param parcel_obj: :class:`Parcel` object to obtain data from
+        :type parcel_obj: Parcel | None
+        :param location: Fetched parcels have to be picked from this pickup point (e.g. `GXO05M`)
+        :type location: dict | None
+        :return: parcel with compartment location and status set, with timings of `get_parcel` (if needed),
+            `validate`, `open` and `status` steps
+        :rtype: CollectResult
+        :raises SingleParamError: Fields shipment_number and parcel_obj filled in but only one of them is required
+        :raises NotAuthenticatedError: User not authenticated in inpost service
+        :raises NoParcelError: Could not get parcel object from provided data
+        :raises UnauthorizedError: Unauthorized access to inpost services,
+        :raises NotFoundError: Phone number not found
+        :raises UnidentifiedAPIError: Unexpected thing happened
+
+        .. warning:: you must fill in only one parameter - shipment_number or parcel_obj!
+        """
+
+        if shipment_number and parcel_obj:
+            self._log.error("shipment_number and parcel_obj filled in")
+            raise SingleParamError(reason="Fields shipment_number and parcel_obj filled! Choose one!")
+
+        if not self.auth_token:
+            self._log.error("authorization token missing")
+            raise NotAuthenticatedError(reason="Not logged in")
+
+        timings = StepTimings()
+        if shipment_number is not None and parcel_obj is None:
+            with timings.measure("get_parcel"):
+                parcel_obj = await self.get_parcel(shipment_number=shipment_number, parse=True)
+
+        if parcel_obj is None:
+            raise NoParcelError(reason="Could not obtain desired parcel!")
+
+        await self._collect_pipelined(parcel_obj=parcel_obj, location=location, timings=timings)
+        return CollectResult(parcel=parcel_obj, timings=timings)
+
+    async def _collect_pipelined(self, parcel_obj: Parcel, location: dict | None, timings: StepTimings) -> None:
+        self._log.info(f"collecting parcel with shipment number {parcel_obj.shipment_number} (pipelined)")
+
+        with timings.measure("validate"):
+            await self.collect_compartment_properties(parcel_obj=parcel_obj, location=location)
+
+        session_uuid = parcel_obj.compartment_properties.session_uuid
+        collected = False
+        try:
+            with timings.measure("open"):
+                resp = await self.request(
+                    method="post",
+                    action=f"open compartment for {parcel_obj.shipment_number}",
+                    url=compartment_open_url,
+                    auth=True,
+                    headers=None,
+                    data={"sessionUuid": session_uuid},
+                    autorefresh=True,
+                )
+
+            with timings.measure("status"):
+                # open response still holds its connection here, status request goes through another pooled one
+                status = asyncio.create_task(
+                    self._compartment_status(
+                        url=compartment_status_url,
+                        session_uuid=session_uuid,
+                        expected_status=CompartmentExpectedStatus.OPENED,
+                    )
+                )
+                try:
+                    parcel_obj.compartment_location = await self._read_json(resp)
+                    parcel_obj.compartment_status = await status
+                finally:
+                    status.cancel()
+
+            collected = True
+        finally:
+            if not collected:
+                # validated session must not be left hanging when opening fails
+                await self._terminate_quietly(parcel_obj)
+
+        self._log.debug(f"collected parcel {parcel_obj.shipment_number} in {timings}")
+
+    async def _terminate_quietly(self, parcel_obj: Parcel) -> None:
+        # cleanup must not replace error that caused it
+        try:
+            await self.terminate_collect_session(parcel_obj=parcel_obj)
+        except Exception as e:
+            self._log.warning(f"could not terminate collect session for {parcel_obj.shipment_number}: {e!r}")
+
+    def collect_session(
+        self,
+        shipment_number: str | None = None,
+        parcel_obj: Parcel | None = None,
+        location: dict | None = None,
+        timeout: float | None = 120.0,
+    ) -> CollectSession:
+        """Creates :class:`CollectSession` for parcel, use it as async context manager
+
+        :param shipment_number: Parcel's shipment number
+        :type shipment_number: str | None
+        :param parcel_obj: :class:`Parcel` object to obtain data from
+        :type parcel_obj: Parcel | None
+        :param location: Fake location of your mobile phone
+        :type location: dict | None
+        :param timeout: maximum duration of whole session in seconds, None disables it
+        :type timeout: float | None
+        :return: collect session, not validated yet
+        :rtype: CollectSession
+        :raises MissingParamsError: none of required params filled in
+        :raises SingleParamError: both shipment_number and parcel_obj filled in
+
+        .. warning:: you must fill in only one parameter - shipment_number or parcel_obj!
+        """
+
+        if shipment_number is None is parcel_obj:
+            self._log.error("none of shipment_number and parcel_obj filled in")
+            raise MissingParamsError(reason="None of params are filled (one required)")
+        elif shipment_number is not None is not parcel_obj:
+            self._log.error("shipment_number and parcel_obj filled in")
+            raise SingleParamError(reason="Fields shipment_number and parcel_obj filled in! Choose one!")
+
+        return CollectSession(
+            self, parcel_obj=parcel_obj, shipment_number=shipment_number, location=location, timeout=timeout
+        )
+
+    async def collect_many(
+        self,
+        multi_uuid: str | None = None,
+        parcels: List[Parcel] | None = None,
+        location: dict | None = None,
+        concurrency: int = 4,
+    ) -> List[CollectResult]:
+        """Collects many parcels at once (e.g. all parcels of multicompartment), compartments are validated,
+        opened and checked concurrently. Failure of one parcel does not stop the others,
+        collect session of parcel that fails after validation is terminated.
+
+        :param multi_uuid: multicompartment uuid, its parcels are fetched once with :meth:`get_multi_compartment`
+        :type multi_uuid: str | None
+        :param parcels: already fetched parcels to collect
+        :type parcels: List[Parcel] | None
+        :param location: Fetched parcels have to be picked from this pickup point (e.g. `GXO05M`)
+        :type location: dict | None
+        :param concurrency: maximum number of parcels collected at once
+        :type concurrency: int
+        :return: outcome of every parcel, in order of parcels; failed ones hold exception in `error`
+        :rtype: List[CollectResult]
+        :raises MissingParamsError: none of multi_uuid and parcels filled in
+        :raises SingleParamError: Fields multi_uuid and parcels filled in but only one of them is required
+        :raises NotAuthenticatedError: User not authenticated in inpost service
+        :raises UnidentifiedAPIError: Unexpected thing happened while fetching multicompartment
+
+        .. warning:: you must fill in only one parameter - multi_uuid or parcels!
+        """
+
+        if multi_uuid is None and parcels is None:
+            self._log.error("none of multi_uuid and parcels filled in")
+            raise MissingParamsError(reason="None of params are filled (one required)")
+
+        if multi_uuid is not None and parcels is not None:
+            self._log.error("multi_uuid and parcels filled in")
+            raise SingleParamError(reason="Fields multi_uuid and parcels filled! Choose one!")
+
+        if not self.auth_token:
+            self._log.error("authorization token missing")
+            raise NotAuthenticatedError(reason="Not logged in")
+
+        to_collect: List[Parcel] = parcels or []
+        if multi_uuid is not None:
+            fetched = await self.get_multi_compartment(multi_uuid=multi_uuid, parse=True)
+            if not isinstance(fetched, list):
+                raise UnidentifiedAPIError(reason=f"Unexpected multicompartment {multi_uuid}: {fetched!r}")
+            to_collect = fetched
+
+        self._log.info(f"collecting {len(to_collect)} parcels")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def collect_one(parcel_obj: Parcel) -> CollectResult:
+            timings = StepTimings()
+            async with semaphore:
+                try:
+                    await self._collect_pipelined(parcel_obj=parcel_obj, location=location, timings=timings)
+                except Exception as e:
+                    self._log.error(f"could not collect parcel {parcel_obj.shipment_number}: {e!r}")
+                    return CollectResult(parcel=parcel_obj, timings=timings, error=e)
+
+            return CollectResult(parcel=parcel_obj, timings=timings)
+
+        return list(await asyncio.gather(*(collect_one(parcel_obj) for parcel_obj in to_collect)))
+
+    @staticmethod
+    async def _read_json(resp: ClientResponse) -> dict:
+        try:
+            return await resp.json()
+        finally:
+            resp.release()
+
+    async def _compartment_status(self, url: str, session_uuid: str, expected_status: CompartmentExpectedStatus) -> str:
+        resp = await self.request(
+            method="post",
+            action="check compartment status",
+            url=url,
+            auth=True,
+            headers=None,
+            data={"sessionUuid": session_uuid, "expectedStatus": expected_status.name},
+            autorefresh=True,
+        )
+        return (await self._read_json(resp))["status"]
+
+    async def wait_for_compartment_status(
+        self,
+        parcel_obj: Parcel,
+        expected_status: CompartmentExpectedStatus = CompartmentExpectedStatus.CLOSED,
+        timeout: float = 120.0,
+        terminate: bool = True,
+    ) -> CompartmentActualStatus:
+        """Polls compartment status until it matches expected one. Polling starts fast and backs off
+        (see :meth:`_wait_for_status`), so closing is noticed quickly without flooding api with requests.
+        Collect session is terminated afterwards, also when waiting times out, fails or gets cancelled.
+
+        :param parcel_obj: Parcel object with opened compartment
+        :type parcel_obj: Parcel
+        :param expected_status: Compartment expected status, defaults to CLOSED
+        :type expected_status: CompartmentExpectedStatus
+        :param timeout: maximum waiting time in seconds, status requests included
+        :type timeout: float
+        :param terminate: terminate collect session when waiting is over
+        :type terminate: bool
+        :return: reached compartment status
+        :rtype: CompartmentActualStatus
+        :raises NotAuthenticatedError: User not authenticated in inpost service
+        :raises CompartmentStatusTimeoutError: Compartment did not reach expected status before timeout
+        :raises UnidentifiedAPIError: Unexpected thing happened
+        """
+
+        try:
+            return await self._wait_for_status(
+                url=compartment_status_url, parcel_obj=parcel_obj, expected_status=expected_status, timeout=timeout
+            )
+        finally:
+            if terminate:
+                await self._terminate_quietly(parcel_obj)
+
+    async def wait_for_send_compartment_status(
+        self,
+        parcel_obj: SentParcel,
+        expected_status: CompartmentExpectedStatus = CompartmentExpectedStatus.CLOSED,
+        timeout: float = 120.0,
+    ) -> CompartmentActualStatus:
+        """Polls send compartment status until it matches expected one, with the same schedule as
+        :meth:`wait_for_compartment_status`. Session is not terminated afterwards, :meth:`send` does it on failure.
+
+        :param parcel_obj: SentParcel object with opened compartment
+        :type parcel_obj: SentParcel
+        :param expected_status: Compartment expected status, defaults to CLOSED
+        :type expected_status: CompartmentExpectedStatus
+        :param timeout: maximum waiting time in seconds, status requests included
+        :type timeout: float
+        :return: reached compartment status
+        :rtype: CompartmentActualStatus
+        :raises NotAuthenticatedError: User not authenticated in inpost service
+        :raises CompartmentStatusTimeoutError: Compartment did not reach expected status before timeout
+        :raises UnidentifiedAPIError: Unexpected thing happened
+        """
+
+        return await self._wait_for_status(
+            url=status_sent_url, parcel_obj=parcel_obj, expected_status=expected_status, timeout=timeout
+        )
+
+    async def _wait_for_status(
+        self,
+        url: str,
+        parcel_obj: Parcel | SentParcel,
+        expected_status: CompartmentExpectedStatus,
+        timeout: float,
+        first_interval: float = 0.25,
+        max_interval: float = 2.0,
+        backoff: float = 1.5,
+        jitter: float = 0.2,
+    ) -> CompartmentActualStatus:
+        # user usually closes compartment within seconds, so poll often at first and then back off,
+        # jitter keeps many waiting clients from polling in lockstep
+        if not self.auth_token:
+            self._log.debug("authorization token missing")
+            raise NotAuthenticatedError(reason="Not logged in")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        interval, polls = first_interval, 0
+        self._log.info(f"waiting for compartment status {expected_status.name} of {parcel_obj.shipment_number}")
+
+        status: str | None = None
+        while True:
+            remaining = deadline - loop.time()
+            if status is not None and remaining <= 0:
+                self._log.error(f"compartment status {expected_status.name} not reached in {timeout}s")
+                raise CompartmentStatusTimeoutError(
+                    reason=f"Compartment status is {status} after {polls} polls, expected {expected_status.name}"
+                )
+
+            # single hung request must not outlive the deadline either
+            try:
+                status = await asyncio.wait_for(
+                    self._compartment_status(
+                        url=url,
+                        session_uuid=parcel_obj.compartment_properties.session_uuid,
+                        expected_status=expected_status,
+                    ),
+                    remaining,
+                )
+            except asyncio.TimeoutError:
+                self._log.error(f"compartment status request did not finish in {timeout}s")
+                raise CompartmentStatusTimeoutError(
+                    reason=f"Compartment status request timed out after {polls} polls, expected {expected_status.name}"
+                ) from None
+
+            polls += 1
+            parcel_obj.compartment_status = status
+            if status == expected_status.name:
+                self._log.debug(f"compartment status {status} reached after {polls} polls")
+                return CompartmentActualStatus[status]
+
+            await asyncio.sleep(max(min(deadline - loop.time(), interval * random.uniform(1 - jitter, 1 + jitter)), 0))
+            interval = min(max_interval, interval * backoff)
+
     async def close_compartment(self, parcel_obj: Parcel) -> bool:
         """Checks whether actual compartment status and expected one matches then notifies inpost api that
         compartment is closed. Should be invoked after collecting parcel
@@ -826,6 +1286,7 @@ class Inpost:
         per_page: int = 1000,
         operation: ParcelPointOperations = ParcelPointOperations.CREATE,
         parse: bool = True,
+        page: int | None = None,
     ) -> dict | List[Point]:
         """Fetches parcel points for inpost services
 
@@ -841,11 +1302,13 @@ class Inpost:
         :type operation: ParcelPointOperations
         :param parse: parse output or not, defaults to True
         :type parse: bool
+        :param page: number of results page (starting from 1), query and location are optional when provided
+        :type page: int | None
         :return: :class:`dict` of prices for inpost services
         :rtype: dict
         :raises NotAuthenticatedError: User not authenticated in inpost service
         :raises SingleParamError: query and location params filled, but only one is required
-        :raises MissingParamsError: none of required query and location params are filled
+        :raises MissingParamsError: none of required query, location and page params are filled
         :raises UnidentifiedAPIError: Unexpected thing happened
         """
 
@@ -865,9 +1328,24 @@ class Inpost:
             _params.update({"query": query})
         elif latitude is not None and longitude is not None:
             _params.update({"relative_point": f"{latitude},{longitude}"})
-        else:
+        elif page is None:
             raise MissingParamsError(reason="None of params are filled (one required)")
 
+        if page is not None:
+            _params.update({"page": page})
+
+        # paged results are not cached
+        point_cache = self.point_cache if page is None else None
+        cache_key = None
+        if point_cache is not None:
+            cache_key = point_cache.key(
+                query=query, latitude=latitude, longitude=longitude, per_page=per_page, operation=operation
+            )
+            cached = point_cache.get_points(cache_key, logger=self._log) if parse else point_cache.get(cache_key)
+            if cached is not None:
+                self._log.debug("got parcel points from cache")
+                return cached
+
         resp = await self.request(
             method="get",
             action="get parcel points",
@@ -880,6 +1358,12 @@ class Inpost:
         )
         if resp.status == 200:
             self._log.debug("got parcel prices")
+            if point_cache is not None and cache_key is not None:
+                point_cache.put(cache_key, await resp.json())
+                points = point_cache.get_points(cache_key, logger=self._log) if parse else None
+                if points is not None:
+                    return points
+
             return (
                 await resp.json()
                 if not parse
@@ -1205,6 +1689,176 @@ class Inpost:
 
         return False
 
+    async def confirm_send(self, parcel_obj: SentParcel) -> bool:
+        """Confirms that parcel was put into send compartment and compartment got closed
+
+        :param parcel_obj: SentParcel object
+        :type parcel_obj: SentParcel
+        :return: True if sending is confirmed
+        :rtype: bool
+        :raises NotAuthenticatedError: User not authenticated in inpost service
+        :raises UnauthorizedError: Unauthorized access to inpost services,
+        :raises NotFoundError: Phone number not found
+        :raises UnidentifiedAPIError: Unexpected thing happened
+        """
+
+        self._log.info(f"confirming send for {parcel_obj.shipment_number}")
+
+        if not self.auth_token:
+            self._log.debug("authorization token missing")
+            raise NotAuthenticatedError(reason="Not logged in")
+
+        resp = await self.request(
+            method="post",
+            action=f"confirm send for {parcel_obj.shipment_number}",
+            url=confirm_sent_url,
+            auth=True,
+            headers=None,
+            data={"sessionUuid": parcel_obj.compartment_properties.session_uuid},
+            autorefresh=True,
+        )
+
+        if resp.status == 200:
+            self._log.debug(f"confirmed send for {parcel_obj.shipment_number}")
+            resp.release()
+            return True
+
+        raise UnidentifiedAPIError(reason=resp)
+
+    async def send(
+        self,
+        drop_off_point: str,
+        shipment_number: str | None = None,
+        parcel_obj: SentParcel | None = None,
+        location: dict | None = None,
+        timeout: float = 120.0,
+    ) -> CollectResult:
+        """Drops off parcel in one call: validates send, opens compartment, waits until it gets closed
+        (see :meth:`wait_for_send_compartment_status`) and confirms sending. Whole flow is bound by `timeout`,
+        duration of every step is reported. Status polling starts as soon as compartment open request succeeds,
+        without reading its response. Send session that fails after validation (e.g. compartment is not closed
+        in time) is terminated, like compartment reopen it goes through collect session endpoint.
+
+        :param drop_off_point: parcel machine codename where you want to drop-off parcel
+        :type drop_off_point: str
+        :param shipment_number: sent parcel shipment number, skip it if fresh `parcel_obj` is already held
+        :type shipment_number: str | None
+        :param parcel_obj: sent parcel object
+        :type parcel_obj: SentParcel | None
+        :param location: Fake location of your mobile phone
+        :type location: dict | None
+        :param timeout: maximum duration of whole flow in seconds
+        :type timeout: float
+        :return: parcel with compartment properties and status set, with timings of `get_parcel` (if needed),
+            `validate`, `open`, `status` and `confirm` steps
+        :rtype: CollectResult
+        :raises SingleParamError: Fields shipment_number and parcel_obj filled in but only one of them is required
+        :raises MissingParamsError: None of required shipment number and parcel object params are filled
+        :raises NotAuthenticatedError: User not authenticated in inpost service
+        :raises NoParcelError: Could not get parcel object from provided data
+        :raises CompartmentStatusTimeoutError: Compartment did not get closed before timeout
+        :raises asyncio.TimeoutError: Request step did not finish before timeout
+        :raises UnidentifiedAPIError: Unexpected thing happened
+
+        .. warning:: you must fill in only one parameter - shipment_number or parcel_obj!
+        """
+
+        if shipment_number is None is parcel_obj:
+            self._log.error("none of shipment_number and parcel_obj filled in")
+            raise MissingParamsError(reason="None of params are filled (one required)")
+        elif shipment_number is not None is not parcel_obj:
+            self._log.error("shipment_number and parcel_obj filled in")
+            raise SingleParamError(reason="Fields shipment_number and parcel_obj filled in! Choose one!")
+
+        if not self.auth_token:
+            self._log.error("authorization token missing")
+            raise NotAuthenticatedError(reason="Not logged in")
+
+        loop = asyncio.get_running_loop()
+        deadline, timings = loop.time() + timeout, StepTimings()
+
+        def remaining() -> float:
+            return max(deadline - loop.time(), 0.0)
+
+        if parcel_obj is None and shipment_number is not None:
+            with timings.measure("get_parcel"):
+                fetched = await asyncio.wait_for(
+                    self.get_parcel(shipment_number=shipment_number, parcel_type=ParcelType.SENT, parse=True),
+                    remaining(),
+                )
+            parcel_obj = fetched if isinstance(fetched, SentParcel) else None
+
+        if parcel_obj is None:
+            raise NoParcelError(reason="Could not obtain desired parcel!")
+
+        self._log.info(f"sending parcel with shipment number {parcel_obj.shipment_number}")
+        with timings.measure("validate"):
+            await asyncio.wait_for(
+                self.validate_send(drop_off_point=drop_off_point, parcel_obj=parcel_obj, location=location),
+                remaining(),
+            )
+
+        sent = False
+        try:
+            await self._send_validated(parcel_obj=parcel_obj, timings=timings, remaining=remaining)
+            sent = True
+        finally:
+            if not sent:
+                await self._terminate_send_session(parcel_obj)
+
+        self._log.debug(f"sent parcel {parcel_obj.shipment_number} in {timings}")
+        return CollectResult(parcel=parcel_obj, timings=timings)
+
+    async def _send_validated(
+        self, parcel_obj: SentParcel, timings: StepTimings, remaining: Callable[[], float]
+    ) -> None:
+        with timings.measure("open"):
+            resp = await asyncio.wait_for(
+                self.request(
+                    method="post",
+                    action=f"open send compartment for {parcel_obj.shipment_number}",
+                    url=open_sent_url,
+                    auth=True,
+                    headers=None,
+                    data={"sessionUuid": parcel_obj.compartment_properties.session_uuid},
+                    autorefresh=True,
+                ),
+                remaining(),
+            )
+
+        if resp.status != 200:
+            raise UnidentifiedAPIError(reason=resp)
+
+        with timings.measure("status"):
+            # polling starts right away, open response body is not needed, so its connection goes back to pool
+            status = asyncio.create_task(
+                self.wait_for_send_compartment_status(parcel_obj=parcel_obj, timeout=remaining())
+            )
+            try:
+                resp.release()
+                await status
+            finally:
+                status.cancel()
+
+        with timings.measure("confirm"):
+            await asyncio.wait_for(self.confirm_send(parcel_obj=parcel_obj), remaining())
+
+    async def _terminate_send_session(self, parcel_obj: SentParcel) -> None:
+        # cleanup must not replace error that caused it
+        try:
+            resp = await self.request(
+                method="post",
+                action=f"terminate send session for {parcel_obj.shipment_number}",
+                url=terminate_collect_session_url,
+                auth=True,
+                headers=None,
+                data={"sessionUuid": parcel_obj.compartment_properties.session_uuid},
+                autorefresh=True,
+            )
+            resp.release()
+        except Exception as e:
+            self._log.warning(f"could not terminate send session for {parcel_obj.shipment_number}: {e!r}")
+
     async def get_prices(self) -> dict:
         """Fetches prices for inpost services
 
@@ -1237,6 +1891,48 @@ class Inpost:
 
         raise UnidentifiedAPIError(reason=resp)
 
+    async def get_notifications(self, parse: bool = False) -> List[dict] | List[Notification]:
+        """Fetches window of recent user notifications, see :class:`NotificationWatcher` for tracking new ones
+
+        :param parse: switch for parsing response
+        :type parse: bool
+        :return: list of notifications
+        :rtype: List[dict] | List[Notification]
+        :raises NotAuthenticatedError: User not authenticated in inpost service
+        :raises UnauthorizedError: Unauthorized access to inpost services,
+        :raises NotFoundError: Phone number not found
+        :raises UnidentifiedAPIError: Unexpected thing happened
+        """
+
+        self._log.info("getting notifications")
+
+        if not self.auth_token:
+            self._log.debug("authorization token missing")
+            raise NotAuthenticatedError(reason="Not logged in")
+
+        resp = await self.request(
+            method="get",
+            action="get notifications",
+            url=parcel_notifications_url,
+            auth=True,
+            headers=None,
+            data=None,
+            autorefresh=True,
+        )
+        if resp.status != 200:
+            raise UnidentifiedAPIError(reason=resp)
+
+        _notifications = await self._read_json(resp)
+        if isinstance(_notifications, dict):
+            _notifications = _notifications.get("notifications", [])
+
+        self._log.debug(f"got {len(_notifications)} notifications")
+        return (
+            _notifications
+            if not parse
+            else [Notification(notification_data=notification, logger=self._log) for notification in _notifications]
+        )
+
     async def get_friends(self, parse=False) -> dict | List[Friend]:
         """Fetches user friends for inpost services
 
@@ -0,0 +1,25 @@
+from .cache import PointCache
+from .database import PointDatabase, SyncDelta, content_hash
+from .geo import haversine
+from .hours import OpeningHours, OpeningHoursIndex, minute_of_week, parse_opening_hours
+from .index import PointIndex, point_filter
+from .search import PointSearchIndex, fold
+from .sync import PointSync, SyncReport
+
+__all__ = [
+    "OpeningHours",
+    "OpeningHoursIndex",
+    "PointCache",
+    "PointDatabase",
+    "PointIndex",
+    "PointSearchIndex",
+    "PointSync",
+    "SyncDelta",
+    "SyncReport",
+    "content_hash",
+    "fold",
+    "haversine",
+    "minute_of_week",
+    "parse_opening_hours",
+    "point_filter",
+]
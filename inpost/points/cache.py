@@ -0,0 +1,224 @@
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Tuple
+
+from inpost.static import ParcelPointOperations, Point
+
+
+class PointCache:
+    """Cache of parcel points search results, keyed by query or by coordinate tile.
+    Entries expire after `ttl` seconds, memory holds at most `max_entries` least recently used results,
+    and when `path` is provided every result is also persisted in SQLite database and survives restarts.
+
+    :param ttl: time in seconds after which cached result is considered stale, defaults to one day
+    :type ttl: float
+    :param max_entries: maximum number of results kept in memory
+    :type max_entries: int
+    :param tile_size: size of coordinate tile in degrees, locations in the same tile share result
+    :type tile_size: float
+    :param path: path of SQLite database used for persistence, memory only if None
+    :type path: str | None
+    """
+
+    def __init__(self, ttl: float = 24 * 60 * 60, max_entries: int = 256, tile_size: float = 0.01, path=None):
+        """Constructor method
+
+        :param ttl: time in seconds after which cached result is considered stale, defaults to one day
+        :type ttl: float
+        :param max_entries: maximum number of results kept in memory
+        :type max_entries: int
+        :param tile_size: size of coordinate tile in degrees, locations in the same tile share result
+        :type tile_size: float
+        :param path: path of SQLite database used for persistence, memory only if None
+        :type path: str | None
+        """
+
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self.tile_size: float = tile_size
+        self.hits: int = 0
+        self.misses: int = 0
+        # key -> [expires at, raw payload, parsed points or None]
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS point_cache (key TEXT PRIMARY KEY, expires REAL NOT NULL, payload TEXT)"
+            )
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(entries={len(self)}, ttl={self.ttl}, max_entries={self.max_entries}, "
+            f"persistent={self._db is not None}, hits={self.hits}, misses={self.misses})"
+        )
+
+    @property
+    def stats(self) -> dict:
+        """Returns cache statistics
+
+        :return: :class:`dict` with number of entries in memory, hits and misses
+        :rtype: dict
+        """
+
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+    def key(
+        self,
+        query: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        per_page: int = 1000,
+        operation: ParcelPointOperations = ParcelPointOperations.CREATE,
+    ) -> Tuple:
+        """Builds cache key of `Inpost.get_parcel_points` call. Queries are case and whitespace insensitive,
+        locations are snapped to tile of `tile_size` degrees.
+
+        :param query: parcel point search query (e.g. GXO05M)
+        :type query: str | None
+        :param latitude: latitude of searched location
+        :type latitude: float | None
+        :param longitude: longitude of searched location
+        :type longitude: float | None
+        :param per_page: number of requested parcel points
+        :type per_page: int
+        :param operation: requested operation (e.g. CREATE, SEND)
+        :type operation: ParcelPointOperations
+        :return: cache key
+        :rtype: Tuple
+        """
+
+        if query is not None:
+            return "query", operation.value, per_page, " ".join(query.lower().split())
+
+        return (
+            "tile",
+            operation.value,
+            per_page,
+            int(latitude // self.tile_size),  # type: ignore[operator]
+            int(longitude // self.tile_size),  # type: ignore[operator]
+        )
+
+    def get(self, key: Hashable) -> dict | None:
+        """Returns copy of cached raw `/v3/points` response, so callers may modify it without affecting cache
+
+        :param key: cache key (see :meth:`key`)
+        :type key: Hashable
+        :return: raw response or None if not cached or stale
+        :rtype: dict | None
+        """
+
+        entry = self._entry(key)
+        return copy.deepcopy(entry[1]) if entry is not None else None
+
+    def get_points(self, key: Hashable, logger: logging.Logger) -> List[Point] | None:
+        """Returns cached parcel points, parsed once per cached response
+
+        :param key: cache key (see :meth:`key`)
+        :type key: Hashable
+        :param logger: :class:`logging.Logger` parent instance of parsed points
+        :type logger: logging.Logger
+        :return: new list of (shared) parcel points or None if not cached or stale
+        :rtype: List[Point] | None
+        """
+
+        entry = self._entry(key)
+        if entry is None:
+            return None
+
+        if entry[2] is None:
+            entry[2] = [Point(point_data=point, logger=logger) for point in entry[1].get("points", [])]
+
+        return list(entry[2])
+
+    def put(self, key: Hashable, payload: dict) -> None:
+        """Caches raw `/v3/points` response
+
+        :param key: cache key (see :meth:`key`)
+        :type key: Hashable
+        :param payload: raw response
+        :type payload: dict
+        """
+
+        expires = time.time() + self.ttl
+        with self._lock:
+            self._store(key, [expires, payload, None])
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO point_cache VALUES (?, ?, ?)", (repr(key), expires, json.dumps(payload))
+                )
+                self._db.commit()
+
+    def purge_expired(self) -> int:
+        """Drops stale entries from memory and database
+
+        :return: number of entries dropped from memory
+        :rtype: int
+        """
+
+        now = time.time()
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[0] <= now]
+            for key in stale:
+                del self._entries[key]
+
+            if self._db is not None:
+                self._db.execute("DELETE FROM point_cache WHERE expires <= ?", (now,))
+                self._db.commit()
+
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drops all entries from memory and database and resets statistics"""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM point_cache")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Closes database connection, cache keeps working in memory"""
+
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _entry(self, key: Hashable) -> list | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT expires, payload FROM point_cache WHERE key = ?", (repr(key),)
+                ).fetchone()
+                if row is not None:
+                    entry = [row[0], json.loads(row[1]), None]
+                    self._store(key, entry)
+
+            if entry is None or entry[0] <= now:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _store(self, key: Hashable, entry: list) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
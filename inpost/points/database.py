@@ -0,0 +1,298 @@
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
+
+from inpost.points.geo import METERS_PER_DEGREE, haversine
+from inpost.points.sync import PointSync
+from inpost.static import Point
+
+if TYPE_CHECKING:
+    from inpost.api import Inpost
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS points (
+        name TEXT PRIMARY KEY,
+        hash TEXT NOT NULL,
+        city TEXT,
+        post_code TEXT,
+        latitude REAL,
+        longitude REAL,
+        data TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS points_city ON points (city)",
+    "CREATE INDEX IF NOT EXISTS points_post_code ON points (post_code)",
+    "CREATE INDEX IF NOT EXISTS points_location ON points (latitude, longitude)",
+)
+
+
+def content_hash(point: Point) -> Tuple[str, str]:
+    """Returns canonical JSON of point and its hash
+
+    :param point: parcel point
+    :type point: Point
+    :return: tuple of point JSON and its SHA-1 hex digest
+    :rtype: Tuple[str, str]
+    """
+
+    data = json.dumps(point.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return data, hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class SyncDelta:
+    """Changes applied by :class:`PointDatabase` sync
+
+    :param inserted: number of new points
+    :type inserted: int
+    :param updated: number of changed points
+    :type updated: int
+    :param deleted: number of points missing in synced dataset
+    :type deleted: int
+    :param unchanged: number of points left untouched
+    :type unchanged: int
+    """
+
+    def __init__(self, inserted: int = 0, updated: int = 0, deleted: int = 0, unchanged: int = 0):
+        """Constructor method
+
+        :param inserted: number of new points
+        :type inserted: int
+        :param updated: number of changed points
+        :type updated: int
+        :param deleted: number of points missing in synced dataset
+        :type deleted: int
+        :param unchanged: number of points left untouched
+        :type unchanged: int
+        """
+
+        self.inserted: int = inserted
+        self.updated: int = updated
+        self.deleted: int = deleted
+        self.unchanged: int = unchanged
+
+    def __repr__(self):
+        fields = tuple(f"{k}={v}" for k, v in self.__dict__.items())
+        return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
+
+    def __eq__(self, other):
+        return isinstance(other, SyncDelta) and self.__dict__ == other.__dict__
+
+
+class PointDatabase:
+    """Local SQLite mirror of parcel points, indexed by name, city, post code and location.
+    Sync is incremental: every point is stored with hash of its content, so only inserts, updates and deletes
+    are written to database.
+
+    :param path: path of SQLite database, `:memory:` keeps it in memory
+    :type path: str
+    :param logger: :class:`logging.Logger` parent instance
+    :type logger: logging.Logger
+    """
+
+    def __init__(self, path: str, logger: logging.Logger):
+        """Constructor method
+
+        :param path: path of SQLite database, `:memory:` keeps it in memory
+        :type path: str
+        :param logger: :class:`logging.Logger` parent instance
+        :type logger: logging.Logger
+        """
+
+        self.path: str = path
+        self._db = sqlite3.connect(path)
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._db.commit()
+
+        self._hashes: Dict[str, str] | None = None
+        self._seen: Set[str] = set()
+        self._delta: SyncDelta | None = None
+
+        self._log: logging.Logger = logger.getChild(self.__class__.__name__)
+        self._log.debug("created")
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM points").fetchone()[0]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path}, points={len(self)})"
+
+    def start_sync(self) -> None:
+        """Starts incremental sync, points are then passed with :meth:`add` and changes applied by :meth:`finish_sync`"""
+
+        self._hashes = dict(self._db.execute("SELECT name, hash FROM points"))
+        self._seen = set()
+        self._delta = SyncDelta()
+        self._log.debug(f"sync started, {len(self._hashes)} points stored")
+
+    def add(self, points: Iterable[Point]) -> None:
+        """Writes new and changed points of running sync, may be used as :meth:`PointSync.run` sink
+
+        :param points: synced points
+        :type points: Iterable[Point]
+        :raises RuntimeError: sync not started
+        """
+
+        if self._hashes is None or self._delta is None:
+            raise RuntimeError("Sync not started")
+
+        rows = []
+        for point in points:
+            if point.name is None or point.name in self._seen:
+                continue
+
+            self._seen.add(point.name)
+            data, digest = content_hash(point)
+            known = self._hashes.get(point.name)
+            if known == digest:
+                self._delta.unchanged += 1
+                continue
+
+            if known is None:
+                self._delta.inserted += 1
+            else:
+                self._delta.updated += 1
+
+            rows.append((point.name, digest, point.city, point.post_code, point.latitude, point.longitude, data))
+
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def finish_sync(self, delete: bool = True) -> SyncDelta:
+        """Deletes points missing in synced dataset and finishes sync
+
+        :param delete: delete missing points, should be False when synced dataset is not complete
+        :type delete: bool
+        :return: applied changes
+        :rtype: SyncDelta
+        :raises RuntimeError: sync not started
+        """
+
+        if self._hashes is None or self._delta is None:
+            raise RuntimeError("Sync not started")
+
+        missing = [(name,) for name in self._hashes.keys() - self._seen] if delete else []
+        with self._db:
+            self._db.executemany("DELETE FROM points WHERE name = ?", missing)
+
+        delta, self._delta, self._hashes, self._seen = self._delta, None, None, set()
+        delta.deleted = len(missing)
+        self._log.info(f"sync finished: {delta}")
+        return delta
+
+    def apply(self, points: Iterable[Point]) -> SyncDelta:
+        """Syncs database with complete points dataset
+
+        :param points: all parcel points
+        :type points: Iterable[Point]
+        :return: applied changes
+        :rtype: SyncDelta
+        """
+
+        self.start_sync()
+        self.add(points)
+        return self.finish_sync()
+
+    async def sync(self, inpost: "Inpost", **kwargs) -> SyncDelta:
+        """Downloads all parcel points with :class:`PointSync` and syncs database with them.
+        Nothing is deleted if download fails midway, nor when it resumes from checkpoint,
+        as points of pages fetched before interruption are not seen again.
+
+        :param inpost: authenticated :class:`Inpost` instance
+        :type inpost: Inpost
+        :param kwargs: options passed to :class:`PointSync`
+        :return: applied changes
+        :rtype: SyncDelta
+        """
+
+        point_sync = PointSync(inpost, **kwargs)
+        self.start_sync()
+        try:
+            await point_sync.run(self.add)
+        except BaseException:
+            self._hashes, self._delta, self._seen = None, None, set()
+            raise
+
+        if point_sync.skipped_pages:
+            self._log.warning(f"resumed sync skipped {point_sync.skipped_pages} pages, not deleting missing points")
+            return self.finish_sync(delete=False)
+
+        return self.finish_sync()
+
+    def _points(self, rows: Iterable[Tuple[str]]) -> List[Point]:
+        return [Point.from_dict(point_data=json.loads(data), logger=self._log) for (data,) in rows]
+
+    def get(self, name: str) -> Point | None:
+        """Returns point by name
+
+        :param name: point name (e.g. GXO05M)
+        :type name: str
+        :return: parcel point or None if not stored
+        :rtype: Point | None
+        """
+
+        points = self._points(self._db.execute("SELECT data FROM points WHERE name = ?", (name,)))
+        return points[0] if points else None
+
+    def by_city(self, city: str) -> List[Point]:
+        """Returns points in city
+
+        :param city: city name, exactly as returned by inpost api
+        :type city: str
+        :return: parcel points ordered by name
+        :rtype: List[Point]
+        """
+
+        return self._points(self._db.execute("SELECT data FROM points WHERE city = ? ORDER BY name", (city,)))
+
+    def by_post_code(self, post_code: str) -> List[Point]:
+        """Returns points with post code
+
+        :param post_code: post code (e.g. 00-624)
+        :type post_code: str
+        :return: parcel points ordered by name
+        :rtype: List[Point]
+        """
+
+        return self._points(self._db.execute("SELECT data FROM points WHERE post_code = ? ORDER BY name", (post_code,)))
+
+    def within(self, latitude: float, longitude: float, radius: float) -> List[Tuple[Point, float]]:
+        """Returns points within radius from location, bounding box is resolved with location index
+
+        :param latitude: latitude of location
+        :type latitude: float
+        :param longitude: longitude of location
+        :type longitude: float
+        :param radius: radius in meters
+        :type radius: float
+        :return: list of points and their distances in meters, nearest first
+        :rtype: List[Tuple[Point, float]]
+        """
+
+        span_latitude = radius / METERS_PER_DEGREE
+        span_longitude = span_latitude / math.cos(math.radians(min(89.9, abs(latitude) + span_latitude)))
+        rows = self._db.execute(
+            "SELECT latitude, longitude, data FROM points "
+            "WHERE latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?",
+            (
+                latitude - span_latitude,
+                latitude + span_latitude,
+                longitude - span_longitude,
+                longitude + span_longitude,
+            ),
+        )
+        found = []
+        for lat, lon, data in rows:
+            distance = haversine(latitude, longitude, lat, lon)
+            if distance <= radius:
+                found.append((distance, data))
+
+        found.sort(key=lambda item: item[0])
+        return [(self._points([(data,)])[0], distance) for distance, data in found]
+
+    def close(self) -> None:
+        """Closes database connection"""
+
+        self._db.close()
@@ -0,0 +1,174 @@
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("inpost.points.distance requires numpy, install it with `pip install inpost[numpy]`") from e
+
+from inpost.points.geo import EARTH_RADIUS
+from inpost.static import Point
+
+
+def haversine_matrix(
+    latitudes1: "np.ndarray", longitudes1: "np.ndarray", latitudes2: "np.ndarray", longitudes2: "np.ndarray"
+) -> "np.ndarray":
+    """Returns great-circle distances between every pair of locations, all coordinates in radians
+
+    :param latitudes1: latitudes of first locations, shape `(n,)`
+    :type latitudes1: np.ndarray
+    :param longitudes1: longitudes of first locations, shape `(n,)`
+    :type longitudes1: np.ndarray
+    :param latitudes2: latitudes of second locations, shape `(m,)`
+    :type latitudes2: np.ndarray
+    :param longitudes2: longitudes of second locations, shape `(m,)`
+    :type longitudes2: np.ndarray
+    :return: distances in meters, shape `(n, m)`
+    :rtype: np.ndarray
+    """
+
+    lat1, lon1 = latitudes1[:, None], longitudes1[:, None]
+    a = np.sin((latitudes2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(latitudes2) * np.sin((longitudes2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+class PointDistances:
+    """Vectorized distance ranking of parcel points. Coordinates are loaded into numpy arrays once,
+    distances to many points (or from many users) are then computed in bulk.
+    Points without location never match any query.
+
+    :param points: parcel points
+    :type points: Sequence[Point]
+    """
+
+    def __init__(self, points: Sequence[Point]):
+        """Constructor method
+
+        :param points: parcel points
+        :type points: Sequence[Point]
+        """
+
+        self.points: List[Point] = list(points)
+        coordinates = np.array(
+            [
+                (
+                    point.latitude if point.latitude is not None else np.nan,
+                    point.longitude if point.longitude is not None else np.nan,
+                )
+                for point in self.points
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        self.latitudes: np.ndarray = np.radians(coordinates[:, 0])
+        self.longitudes: np.ndarray = np.radians(coordinates[:, 1])
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(points={len(self)})"
+
+    def distances(self, latitude: float, longitude: float) -> "np.ndarray":
+        """Returns distances from location to every point
+
+        :param latitude: latitude of location
+        :type latitude: float
+        :param longitude: longitude of location
+        :type longitude: float
+        :return: distances in meters (NaN for points without location), shape `(len(points),)`
+        :rtype: np.ndarray
+        """
+
+        return self.matrix([latitude], [longitude])[0]
+
+    def matrix(self, latitudes: Sequence[float], longitudes: Sequence[float]) -> "np.ndarray":
+        """Returns distances from every location (e.g. users) to every point
+
+        :param latitudes: latitudes of locations
+        :type latitudes: Sequence[float]
+        :param longitudes: longitudes of locations
+        :type longitudes: Sequence[float]
+        :return: distances in meters, shape `(len(latitudes), len(points))`
+        :rtype: np.ndarray
+        """
+
+        return haversine_matrix(
+            np.radians(np.asarray(latitudes, dtype=np.float64)),
+            np.radians(np.asarray(longitudes, dtype=np.float64)),
+            self.latitudes,
+            self.longitudes,
+        )
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1) -> List[Tuple[Point, float]]:
+        """Returns `k` points nearest to location
+
+        :param latitude: latitude of location
+        :type latitude: float
+        :param longitude: longitude of location
+        :type longitude: float
+        :param k: number of points to return
+        :type k: int
+        :return: list of points and their distances in meters, nearest first
+        :rtype: List[Tuple[Point, float]]
+        """
+
+        distances = self.distances(latitude, longitude)
+        valid = np.count_nonzero(~np.isnan(distances))
+        k = min(k, valid)
+        if k <= 0:
+            return []
+
+        # NaN is sorted last by argpartition, so points without location are never among first `valid`
+        candidates = np.argpartition(distances, k - 1)[:k] if k < len(distances) else np.arange(len(distances))
+        order = candidates[np.argsort(distances[candidates], kind="stable")][:k]
+        return [(self.points[i], float(distances[i])) for i in order]
+
+    def within_mask(self, latitude: float, longitude: float, radius: float) -> "np.ndarray":
+        """Returns mask of points within radius from location
+
+        :param latitude: latitude of location
+        :type latitude: float
+        :param longitude: longitude of location
+        :type longitude: float
+        :param radius: radius in meters
+        :type radius: float
+        :return: boolean mask, shape `(len(points),)`
+        :rtype: np.ndarray
+        """
+
+        with np.errstate(invalid="ignore"):
+            return self.distances(latitude, longitude) <= radius
+
+    def within(self, latitude: float, longitude: float, radius: float) -> List[Tuple[Point, float]]:
+        """Returns points within radius from location
+
+        :param latitude: latitude of location
+        :type latitude: float
+        :param longitude: longitude of location
+        :type longitude: float
+        :param radius: radius in meters
+        :type radius: float
+        :return: list of points and their distances in meters, nearest first
+        :rtype: List[Tuple[Point, float]]
+        """
+
+        distances = self.distances(latitude, longitude)
+        with np.errstate(invalid="ignore"):
+            (indices,) = np.nonzero(distances <= radius)
+
+        order = indices[np.argsort(distances[indices], kind="stable")]
+        return [(self.points[i], float(distances[i])) for i in order]
+
+    def assign(self, latitudes: Sequence[float], longitudes: Sequence[float]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Assigns every location (e.g. user) to its nearest point
+
+        :param latitudes: latitudes of locations
+        :type latitudes: Sequence[float]
+        :param longitudes: longitudes of locations
+        :type longitudes: Sequence[float]
+        :return: tuple of nearest point indices and distances in meters, both shaped `(len(latitudes),)`
+        :rtype: Tuple[np.ndarray, np.ndarray]
+        """
+
+        distances = np.nan_to_num(self.matrix(latitudes, longitudes), nan=np.inf)
+        indices = np.argmin(distances, axis=1)
+        return indices, distances[np.arange(len(indices)), indices]
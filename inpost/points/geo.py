@@ -0,0 +1,27 @@
+import math
+
+EARTH_RADIUS: float = 6_371_008.8  # mean earth radius in meters
+METERS_PER_DEGREE: float = EARTH_RADIUS * math.pi / 180
+
+
+def haversine(latitude1: float, longitude1: float, latitude2: float, longitude2: float) -> float:
+    """Returns great-circle distance between two locations
+
+    :param latitude1: latitude of first location
+    :type latitude1: float
+    :param longitude1: longitude of first location
+    :type longitude1: float
+    :param latitude2: latitude of second location
+    :type latitude2: float
+    :param longitude2: longitude of second location
+    :type longitude2: float
+    :return: distance in meters
+    :rtype: float
+    """
+
+    phi1, phi2 = math.radians(latitude1), math.radians(latitude2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(longitude2 - longitude1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
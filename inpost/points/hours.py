@@ -0,0 +1,266 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from inpost.points.search import fold
+from inpost.static import Point
+
+MINUTES_PER_DAY: int = 24 * 60
+MINUTES_PER_WEEK: int = 7 * MINUTES_PER_DAY
+TIMEZONE: str = "Europe/Warsaw"  # opening hours are given in local time of points
+
+_DAYS: Dict[str, int] = {
+    "pn": 0,
+    "pon": 0,
+    "mon": 0,
+    "wt": 1,
+    "wto": 1,
+    "tue": 1,
+    "sr": 2,
+    "sro": 2,
+    "wed": 2,
+    "cz": 3,
+    "czw": 3,
+    "thu": 3,
+    "pt": 4,
+    "pia": 4,
+    "fri": 4,
+    "sb": 5,
+    "so": 5,
+    "sob": 5,
+    "sat": 5,
+    "nd": 6,
+    "n": 6,
+    "nie": 6,
+    "niedz": 6,
+    "sun": 6,
+}
+_CLOSED = ("nieczynne", "zamkniete", "closed")
+_TOKEN = re.compile(
+    r"(?P<time>(?P<h1>\d{1,2})(?::(?P<m1>\d{2}))?\s*-\s*(?P<h2>\d{1,2})(?::(?P<m2>\d{2}))?)"
+    r"|(?P<closed>" + "|".join(_CLOSED) + r")"
+    r"|(?P<day>[a-z]+)\.?(?:\s*-\s*(?P<last>[a-z]+)\.?)?"
+)
+
+
+class OpeningHours:
+    """Opening hours of point as sorted, non-overlapping intervals of minutes since Monday 00:00
+
+    :param intervals: `(start, end)` minutes of week, end exclusive
+    :type intervals: Sequence[Tuple[int, int]]
+    :param always: point is open round the clock
+    :type always: bool
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[int, int]], always: bool = False):
+        """Constructor method
+
+        :param intervals: `(start, end)` minutes of week, end exclusive
+        :type intervals: Sequence[Tuple[int, int]]
+        :param always: point is open round the clock
+        :type always: bool
+        """
+
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        self.always: bool = always or merged == [(0, MINUTES_PER_WEEK)]
+        self.intervals: Tuple[Tuple[int, int], ...] = ((0, MINUTES_PER_WEEK),) if self.always else tuple(merged)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(always={self.always}, intervals={self.intervals})"
+
+    def __eq__(self, other):
+        return isinstance(other, OpeningHours) and self.intervals == other.intervals
+
+    def __hash__(self):
+        return hash(self.intervals)
+
+    def is_open(self, minute: int) -> bool:
+        """Checks if point is open at minute of week
+
+        :param minute: minutes since Monday 00:00 (see :func:`minute_of_week`)
+        :type minute: int
+        :return: True if open
+        :rtype: bool
+        """
+
+        return self.always or any(start <= minute < end for start, end in self.intervals)
+
+
+def minute_of_week(when: datetime) -> int:
+    """Converts date to minutes since Monday 00:00 of points local time. Naive dates are taken as local time.
+
+    :param when: date to convert
+    :type when: datetime
+    :return: minute of week
+    :rtype: int
+    """
+
+    if when.tzinfo is not None:
+        from zoneinfo import ZoneInfo
+
+        when = when.astimezone(ZoneInfo(TIMEZONE))
+
+    return when.weekday() * MINUTES_PER_DAY + when.hour * 60 + when.minute
+
+
+def _day_intervals(days: Iterable[int], start: int, end: int) -> Iterable[Tuple[int, int]]:
+    if end <= start:
+        end += MINUTES_PER_DAY
+
+    for day in days:
+        begin, finish = day * MINUTES_PER_DAY + start, day * MINUTES_PER_DAY + end
+        if finish > MINUTES_PER_WEEK:
+            yield 0, finish - MINUTES_PER_WEEK
+            finish = MINUTES_PER_WEEK
+        yield begin, finish
+
+
+@lru_cache(maxsize=4096)
+def parse_opening_hours(text: str | None) -> OpeningHours | None:
+    """Parses opening hours as given by inpost api (e.g. `24/7`, `pn-pt 08:00-20:00, sb 09:00-14:00`,
+    `Pn-Pt: 7-22; Sb: 8-16; Nd: nieczynne`). Ranges ending after midnight continue on the next day.
+    Results are cached, as many points share the same opening hours.
+
+    :param text: opening hours
+    :type text: str | None
+    :return: parsed opening hours or None if text is missing or not understood
+    :rtype: OpeningHours | None
+    """
+
+    if not text:
+        return None
+
+    folded = fold(text)
+    if folded.replace(" ", "") in ("24/7", "24h", "calodobowo", "czynnecalodobowo"):
+        return OpeningHours([], always=True)
+
+    intervals: List[Tuple[int, int]] = []
+    days: List[int] = []
+    group_done = False  # days were already given hours, next day token starts new group
+    for match in _TOKEN.finditer(folded):
+        if match["day"]:
+            first, last = _DAYS.get(match["day"]), _DAYS.get(match["last"] or match["day"])
+            if first is None or last is None:
+                if match["last"]:
+                    return None
+                continue  # words like "godz" carry no information
+            if group_done:
+                days, group_done = [], False
+            days.extend((first + offset) % 7 for offset in range((last - first) % 7 + 1))
+        elif match["closed"]:
+            group_done = True
+        else:
+            start = int(match["h1"]) * 60 + int(match["m1"] or 0)
+            end = int(match["h2"]) * 60 + int(match["m2"] or 0)
+            if start > MINUTES_PER_DAY or end > MINUTES_PER_DAY:
+                return None
+            intervals.extend(_day_intervals(days or range(7), start, end))
+            group_done = True
+
+    if not intervals and not group_done:
+        return None
+
+    return OpeningHours(intervals)
+
+
+class OpeningHoursIndex:
+    """Answers "which points are open at given time" for many points at once. Opening hours are parsed once,
+    intervals are bucketed by hour of week, so query only checks intervals overlapping the requested hour.
+    Points open round the clock (`location_round_the_clock` or `24/7`) skip interval checks entirely.
+
+    :param points: parcel points
+    :type points: Iterable[Point]
+    """
+
+    def __init__(self, points: Iterable[Point]):
+        """Constructor method
+
+        :param points: parcel points
+        :type points: Iterable[Point]
+        """
+
+        self.points: List[Point] = list(points)
+        self.hours: List[OpeningHours | None] = []
+        self.round_the_clock: List[int] = []
+        self.unknown: List[int] = []
+        self._buckets: List[List[Tuple[int, int, int]]] = [[] for _ in range(MINUTES_PER_WEEK // 60)]
+
+        for i, point in enumerate(self.points):
+            hours = (
+                OpeningHours([], always=True)
+                if point.location_round_the_clock
+                else parse_opening_hours(point.opening_hours)
+            )
+            self.hours.append(hours)
+            if hours is None:
+                self.unknown.append(i)
+            elif hours.always:
+                self.round_the_clock.append(i)
+            else:
+                for start, end in hours.intervals:
+                    for bucket in range(start // 60, (end - 1) // 60 + 1):
+                        self._buckets[bucket].append((start, end, i))
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(points={len(self)}, round_the_clock={len(self.round_the_clock)}, "
+            f"unknown={len(self.unknown)})"
+        )
+
+    def open_indices(self, when: datetime | int, include_unknown: bool = False) -> List[int]:
+        """Returns positions of points open at given time
+
+        :param when: date or minute of week (see :func:`minute_of_week`)
+        :type when: datetime | int
+        :param include_unknown: treat points with missing or not understood opening hours as open
+        :type include_unknown: bool
+        :return: sorted positions of open points
+        :rtype: List[int]
+        """
+
+        minute = minute_of_week(when) if isinstance(when, datetime) else when % MINUTES_PER_WEEK
+        result = self.round_the_clock + [i for start, end, i in self._buckets[minute // 60] if start <= minute < end]
+        if include_unknown:
+            result += self.unknown
+
+        return sorted(result)
+
+    def open_at(self, when: datetime | int, include_unknown: bool = False) -> List[Point]:
+        """Returns points open at given time
+
+        :param when: date or minute of week (see :func:`minute_of_week`)
+        :type when: datetime | int
+        :param include_unknown: treat points with missing or not understood opening hours as open
+        :type include_unknown: bool
+        :return: open points
+        :rtype: List[Point]
+        """
+
+        return [self.points[i] for i in self.open_indices(when, include_unknown=include_unknown)]
+
+    def open_mask(self, when: datetime | int, include_unknown: bool = False) -> List[bool]:
+        """Returns mask of points open at given time, aligned with `points`
+
+        :param when: date or minute of week (see :func:`minute_of_week`)
+        :type when: datetime | int
+        :param include_unknown: treat points with missing or not understood opening hours as open
+        :type include_unknown: bool
+        :return: list with True for every open point
+        :rtype: List[bool]
+        """
+
+        mask = [False] * len(self.points)
+        for i in self.open_indices(when, include_unknown=include_unknown):
+            mask[i] = True
+
+        return mask
@@ -0,0 +1,214 @@
+import logging
+import math
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from inpost.points.geo import METERS_PER_DEGREE, haversine
+from inpost.static import ParcelDeliveryType, PaymentType, Point, PointType
+from inpost.static.statuses import ParcelBase
+
+
+def _names(values) -> set | None:
+    if values is None:
+        return None
+    if isinstance(values, (str, ParcelBase)):
+        values = [values]
+
+    return {value.name if isinstance(value, ParcelBase) else value for value in values}
+
+
+def point_filter(
+    point_type: PointType | str | Iterable | None = None,
+    delivery_type: ParcelDeliveryType | str | Iterable | None = None,
+    payment_type: PaymentType | str | Iterable | None = None,
+    round_the_clock: bool | None = None,
+    easy_access_zone: bool | None = None,
+) -> Callable[[Point], bool]:
+    """Builds predicate matching points against all provided conditions, None means any
+
+    :param point_type: accepted point types (e.g. :class:`PointType.PL`)
+    :type point_type: PointType | str | Iterable | None
+    :param delivery_type: point must support any of delivery types (e.g. :class:`ParcelDeliveryType.parcel_locker`)
+    :type delivery_type: ParcelDeliveryType | str | Iterable | None
+    :param payment_type: point must support any of payment types (e.g. :class:`PaymentType.BY_CARD_IN_MACHINE`)
+    :type payment_type: PaymentType | str | Iterable | None
+    :param round_the_clock: required value of `location_round_the_clock`
+    :type round_the_clock: bool | None
+    :param easy_access_zone: required value of `easy_access_zone`
+    :type easy_access_zone: bool | None
+    :return: predicate returning True for matching points
+    :rtype: Callable[[Point], bool]
+    """
+
+    point_types, delivery_types, payment_types = _names(point_type), _names(delivery_type), _names(payment_type)
+
+    def matches(point: Point) -> bool:
+        if point_types is not None and (point.point_type is None or point.point_type.name not in point_types):
+            return False
+        if delivery_types is not None and not any(t.name in delivery_types for t in point.type or ()):
+            return False
+        if payment_types is not None and not any(t.name in payment_types for t in point.payment_type or ()):
+            return False
+        if round_the_clock is not None and bool(point.location_round_the_clock) != round_the_clock:
+            return False
+        if easy_access_zone is not None and bool(point.easy_access_zone) != easy_access_zone:
+            return False
+
+        return True
+
+    return matches
+
+
+class PointIndex:
+    """Offline spatial index of parcel points. Points are bucketed into square grid cells of `cell_size` degrees,
+    nearest and radius queries only visit cells around searched location.
+
+    :param points: parcel points to index, points without location are skipped
+    :type points: Iterable[Point]
+    :param cell_size: size of grid cell in degrees, defaults to 0.05 (roughly 5 km)
+    :type cell_size: float
+    """
+
+    def __init__(self, points: Iterable[Point], cell_size: float = 0.05):
+        """Constructor method
+
+        :param points: parcel points to index, points without location are skipped
+        :type points: Iterable[Point]
+        :param cell_size: size of grid cell in degrees, defaults to 0.05 (roughly 5 km)
+        :type cell_size: float
+        """
+
+        self.cell_size: float = cell_size
+        self.points: List[Point] = [p for p in points if p.latitude is not None and p.longitude is not None]
+        self._cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, point in enumerate(self.points):
+            self._cells[self._cell(point.latitude, point.longitude)].append(i)
+
+        self._cells = dict(self._cells)
+        self._extent: Tuple[int, int, int, int] | None = (
+            (
+                min(row for row, _ in self._cells),
+                max(row for row, _ in self._cells),
+                min(col for _, col in self._cells),
+                max(col for _, col in self._cells),
+            )
+            if self._cells
+            else None
+        )
+
+    @classmethod
+    def from_payload(cls, payload: dict, logger: logging.Logger, cell_size: float = 0.05) -> "PointIndex":
+        """`Classmethod` to build index straight from raw `/v3/points` response (e.g. cached by :class:`PointCache`)
+
+        :param payload: raw parcel points response
+        :type payload: dict
+        :param logger: :class:`logging.Logger` parent instance of parsed points
+        :type logger: logging.Logger
+        :param cell_size: size of grid cell in degrees
+        :type cell_size: float
+        :return: spatial index
+        :rtype: PointIndex
+        """
+
+        return cls((Point(point_data=data, logger=logger) for data in payload.get("points", [])), cell_size=cell_size)
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(points={len(self)}, cells={len(self._cells)}, cell_size={self.cell_size})"
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return math.floor(latitude / self.cell_size), math.floor(longitude / self.cell_size)
+
+    def _ring(self, row: int, col: int, radius: int) -> Iterable[int]:
+        if radius == 0:
+            yield from self._cells.get((row, col), ())
+            return
+
+        for r in range(row - radius, row + radius + 1):
+            step = 1 if r in (row - radius, row + radius) else 2 * radius
+            for c in range(col - radius, col + radius + 1, step):
+                yield from self._cells.get((r, c), ())
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int = 1, max_distance: float | None = None, **filters
+    ) -> List[Tuple[Point, float]]:
+        """Returns `k` points nearest to location. Grid rings around location are searched outwards
+        until no unvisited cell can contain closer point.
+
+        :param latitude: latitude of location
+        :type latitude: float
+        :param longitude: longitude of location
+        :type longitude: float
+        :param k: number of points to return
+        :type k: int
+        :param max_distance: skip points further than this many meters
+        :type max_distance: float | None
+        :param filters: conditions passed to :func:`point_filter`
+        :return: list of points and their distances in meters, nearest first
+        :rtype: List[Tuple[Point, float]]
+        """
+
+        if self._extent is None or k <= 0:
+            return []
+
+        matches = point_filter(**filters)
+        row, col = self._cell(latitude, longitude)
+        min_row, max_row, min_col, max_col = self._extent
+        last_ring = max(row - min_row, max_row - row, col - min_col, max_col - col)
+        found: List[Tuple[float, int]] = []
+
+        for radius in range(last_ring + 1):
+            for i in self._ring(row, col, radius):
+                point = self.points[i]
+                distance = haversine(latitude, longitude, point.latitude, point.longitude)
+                if (max_distance is None or distance <= max_distance) and matches(point):
+                    found.append((distance, i))
+
+            # anything outside visited rings is at least `radius` cells away, cells are narrowest at highest latitude
+            widest_latitude = min(90.0, abs(latitude) + (radius + 1) * self.cell_size)
+            bound = radius * self.cell_size * METERS_PER_DEGREE * math.cos(math.radians(widest_latitude))
+            if max_distance is not None and bound > max_distance:
+                break
+            if len(found) >= k:
+                found.sort()
+                del found[k:]
+                if found[-1][0] <= bound:
+                    break
+
+        found.sort()
+        return [(self.points[i], distance) for distance, i in found[:k]]
+
+    def within(self, latitude: float, longitude: float, radius: float, **filters) -> List[Tuple[Point, float]]:
+        """Returns points within radius from location
+
+        :param latitude: latitude of location
+        :type latitude: float
+        :param longitude: longitude of location
+        :type longitude: float
+        :param radius: radius in meters
+        :type radius: float
+        :param filters: conditions passed to :func:`point_filter`
+        :return: list of points and their distances in meters, nearest first
+        :rtype: List[Tuple[Point, float]]
+        """
+
+        matches = point_filter(**filters)
+        span_latitude = radius / METERS_PER_DEGREE
+        widest_latitude = min(89.9, abs(latitude) + span_latitude)
+        span_longitude = min(180.0, span_latitude / math.cos(math.radians(widest_latitude)))
+        low_row, low_col = self._cell(latitude - span_latitude, longitude - span_longitude)
+        high_row, high_col = self._cell(latitude + span_latitude, longitude + span_longitude)
+
+        found = []
+        for r in range(low_row, high_row + 1):
+            for c in range(low_col, high_col + 1):
+                for i in self._cells.get((r, c), ()):
+                    point = self.points[i]
+                    distance = haversine(latitude, longitude, point.latitude, point.longitude)
+                    if distance <= radius and matches(point):
+                        found.append((distance, i))
+
+        found.sort()
+        return [(self.points[i], distance) for distance, i in found]
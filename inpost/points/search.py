@@ -0,0 +1,196 @@
+import logging
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from inpost.points.geo import haversine
+from inpost.static import Point
+
+# letters that do not decompose in NFKD, but are expected to match their base letter
+_FOLD = str.maketrans({"ł": "l", "Ł": "l", "ø": "o", "đ": "d", "ß": "ss"})
+_TOKEN = re.compile(r"[0-9a-z]+")
+
+FIELD_WEIGHTS: Dict[str, float] = {"name": 5.0, "city": 3.0, "post_code": 3.0, "street": 2.0, "description": 1.0}
+PREFIX_FACTOR: float = 0.7  # score of prefix match relative to whole token match
+FUZZY_FACTOR: float = 0.5  # score of trigram match relative to whole token match
+FUZZY_THRESHOLD: float = 0.4  # minimal trigram similarity of fuzzy match
+
+
+def fold(text: str) -> str:
+    """Normalizes text for matching: lowercase, diacritics removed (e.g. `Łódź` -> `lodz`)
+
+    :param text: text to normalize
+    :type text: str
+    :return: normalized text
+    :rtype: str
+    """
+
+    decomposed = unicodedata.normalize("NFKD", text.translate(_FOLD).lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str | None) -> List[str]:
+    """Splits text into normalized alphanumeric tokens
+
+    :param text: text to tokenize
+    :type text: str | None
+    :return: list of tokens
+    :rtype: List[str]
+    """
+
+    return _TOKEN.findall(fold(text)) if text else []
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}  # noqa: E203
+
+
+class PointSearchIndex:
+    """Offline full-text index over parcel points for autocomplete. Tokens of `name`, `city`, `post_code`, `street`
+    and `description` are matched whole, by prefix (sorted token list) or, when nothing else matches, by trigram
+    similarity, so typos still find results. Matching is case and diacritic insensitive.
+
+    :param points: parcel points to index
+    :type points: Iterable[Point]
+    """
+
+    def __init__(self, points: Iterable[Point]):
+        """Constructor method
+
+        :param points: parcel points to index
+        :type points: Iterable[Point]
+        """
+
+        self.points: List[Point] = list(points)
+        postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        for doc, point in enumerate(self.points):
+            for field, weight in FIELD_WEIGHTS.items():
+                value = getattr(point, field)
+                tokens = tokenize(value)
+                if field == "post_code" and len(tokens) > 1:
+                    tokens.append("".join(tokens))
+                for token in tokens:
+                    if postings[token].get(doc, 0.0) < weight:
+                        postings[token][doc] = weight
+
+        self._postings: Dict[str, Dict[int, float]] = dict(postings)
+        self._tokens: List[str] = sorted(self._postings)
+        self._trigram_index: Dict[str, List[str]] = defaultdict(list)
+        for token in self._tokens:
+            for trigram in _trigrams(token):
+                self._trigram_index[trigram].append(token)
+
+    @classmethod
+    def from_payload(cls, payload: dict, logger: logging.Logger) -> "PointSearchIndex":
+        """`Classmethod` to build index straight from raw `/v3/points` response (e.g. cached by :class:`PointCache`)
+
+        :param payload: raw parcel points response
+        :type payload: dict
+        :param logger: :class:`logging.Logger` parent instance of parsed points
+        :type logger: logging.Logger
+        :return: search index
+        :rtype: PointSearchIndex
+        """
+
+        return cls(Point(point_data=data, logger=logger) for data in payload.get("points", []))
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(points={len(self)}, tokens={len(self._tokens)})"
+
+    def _match(self, term: str) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        start = bisect_left(self._tokens, term)
+        for i in range(start, len(self._tokens)):
+            token = self._tokens[i]
+            if not token.startswith(term):
+                break
+
+            factor = 1.0 if token == term else PREFIX_FACTOR
+            for doc, weight in self._postings[token].items():
+                if scores.get(doc, 0.0) < weight * factor:
+                    scores[doc] = weight * factor
+
+        if scores or len(term) < 3:
+            return scores
+
+        trigrams = _trigrams(term)
+        shared: Dict[str, int] = defaultdict(int)
+        for trigram in trigrams:
+            for token in self._trigram_index.get(trigram, ()):
+                shared[token] += 1
+
+        for token, count in shared.items():
+            similarity = count / len(trigrams | _trigrams(token))
+            if similarity < FUZZY_THRESHOLD:
+                continue
+
+            for doc, weight in self._postings[token].items():
+                score = weight * FUZZY_FACTOR * similarity
+                if scores.get(doc, 0.0) < score:
+                    scores[doc] = score
+
+        return scores
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        distance_scale: float = 5_000,
+    ) -> List[Tuple[Point, float]]:
+        """Searches points matching every term of query (e.g. `wroc swi`), best matches first.
+        When location is provided, score is divided by `1 + distance / distance_scale`, so nearby points rank higher.
+
+        :param query: search query, every term may be just a prefix
+        :type query: str
+        :param limit: maximum number of results
+        :type limit: int
+        :param latitude: latitude of user location
+        :type latitude: float | None
+        :param longitude: longitude of user location
+        :type longitude: float | None
+        :param distance_scale: distance in meters at which score is halved
+        :type distance_scale: float
+        :return: list of points and their scores
+        :rtype: List[Tuple[Point, float]]
+        """
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        scores: Dict[int, float] | None = None
+        for term in sorted(terms, key=len, reverse=True):
+            matched = self._match(term)
+            if scores is None:
+                scores = matched
+            else:
+                scores = {doc: score + matched[doc] for doc, score in scores.items() if doc in matched}
+            if not scores:
+                return []
+
+        results: Sequence[Tuple[float, int]]
+        if latitude is not None and longitude is not None:
+            results = [
+                (score / (1 + self._distance(doc, latitude, longitude) / distance_scale), doc)
+                for doc, score in scores.items()  # type: ignore[union-attr]
+            ]
+        else:
+            results = [(score, doc) for doc, score in scores.items()]  # type: ignore[union-attr]
+
+        results = sorted(results, key=lambda item: (-item[0], self.points[item[1]].name or ""))[:limit]
+        return [(self.points[doc], score) for score, doc in results]
+
+    def _distance(self, doc: int, latitude: float, longitude: float) -> float:
+        point = self.points[doc]
+        if point.latitude is None or point.longitude is None:
+            return float("inf")
+
+        return haversine(latitude, longitude, point.latitude, point.longitude)
@@ -0,0 +1,245 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Callable, List, Set, Tuple
+
+from inpost.static import ParcelPointOperations, Point, UnidentifiedAPIError
+
+if TYPE_CHECKING:
+    from inpost.api import Inpost
+
+
+class SyncReport:
+    """Summary of :class:`PointSync` run
+
+    :param pages: number of pages fetched in this run
+    :type pages: int
+    :param points: number of points fetched in this run
+    :type points: int
+    :param skipped_pages: number of pages skipped as already fetched before interruption
+    :type skipped_pages: int
+    :param elapsed: duration of run in seconds
+    :type elapsed: float
+    """
+
+    def __init__(self, pages: int, points: int, skipped_pages: int, elapsed: float):
+        """Constructor method
+
+        :param pages: number of pages fetched in this run
+        :type pages: int
+        :param points: number of points fetched in this run
+        :type points: int
+        :param skipped_pages: number of pages skipped as already fetched before interruption
+        :type skipped_pages: int
+        :param elapsed: duration of run in seconds
+        :type elapsed: float
+        """
+
+        self.pages: int = pages
+        self.points: int = points
+        self.skipped_pages: int = skipped_pages
+        self.elapsed: float = elapsed
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(pages={self.pages}, points={self.points}, skipped_pages={self.skipped_pages}, "
+            f"elapsed={self.elapsed:.3f}, points_per_second={self.points_per_second:.1f})"
+        )
+
+    @property
+    def points_per_second(self) -> float:
+        """Returns sync throughput
+
+        :return: points fetched per second
+        :rtype: float
+        """
+
+        return self.points / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        """Returns sync throughput
+
+        :return: pages fetched per second
+        :rtype: float
+        """
+
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+
+class PointSync:
+    """Mirrors whole parcel points network by walking all `/v3/points` pages concurrently.
+    Fetched points are streamed page by page, and with `checkpoint` set finished pages are recorded on disk,
+    so interrupted sync resumes from pages that are still missing.
+
+    :param inpost: authenticated :class:`Inpost` instance
+    :type inpost: Inpost
+    :param per_page: number of points per page
+    :type per_page: int
+    :param concurrency: maximum number of pages fetched at once
+    :type concurrency: int
+    :param checkpoint: path of JSON file recording finished pages, resume disabled if None
+    :type checkpoint: str | None
+    :param operation: operation points are synced for (e.g. CREATE, SEND)
+    :type operation: ParcelPointOperations
+    """
+
+    def __init__(
+        self,
+        inpost: "Inpost",
+        per_page: int = 1000,
+        concurrency: int = 4,
+        checkpoint: str | None = None,
+        operation: ParcelPointOperations = ParcelPointOperations.CREATE,
+    ):
+        """Constructor method
+
+        :param inpost: authenticated :class:`Inpost` instance
+        :type inpost: Inpost
+        :param per_page: number of points per page
+        :type per_page: int
+        :param concurrency: maximum number of pages fetched at once
+        :type concurrency: int
+        :param checkpoint: path of JSON file recording finished pages, resume disabled if None
+        :type checkpoint: str | None
+        :param operation: operation points are synced for (e.g. CREATE, SEND)
+        :type operation: ParcelPointOperations
+        """
+
+        self.inpost: "Inpost" = inpost
+        self.per_page: int = per_page
+        self.concurrency: int = concurrency
+        self.checkpoint: str | None = checkpoint
+        self.operation: ParcelPointOperations = operation
+        self.total_pages: int | None = None
+        self.done: Set[int] = set()
+        self.skipped_pages: int = 0
+
+        self._log: logging.Logger = inpost._log.getChild(self.__class__.__name__)
+        self._log.debug("created")
+
+    def __repr__(self):
+        fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k not in ("_log", "inpost", "done"))
+        return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
+
+    def _load_checkpoint(self) -> None:
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return
+
+        with open(self.checkpoint) as f:
+            state = json.load(f)
+
+        if state.get("per_page") != self.per_page or state.get("operation") != self.operation.name:
+            self._log.warning("checkpoint made with different settings, starting over")
+            return
+
+        self.total_pages = state.get("total_pages")
+        self.done = set(state.get("done", []))
+        self._log.debug(f"resuming, {len(self.done)} pages already fetched")
+
+    def _save_checkpoint(self) -> None:
+        if self.checkpoint is None:
+            return
+
+        state = {
+            "per_page": self.per_page,
+            "operation": self.operation.name,
+            "total_pages": self.total_pages,
+            "done": sorted(self.done),
+        }
+        with open(f"{self.checkpoint}.tmp", "w") as f:
+            json.dump(state, f)
+        os.replace(f"{self.checkpoint}.tmp", self.checkpoint)
+
+    async def _fetch(self, page: int, semaphore: asyncio.Semaphore) -> Tuple[int, dict]:
+        async with semaphore:
+            self._log.debug(f"fetching page {page}")
+            payload = await self.inpost.get_parcel_points(
+                per_page=self.per_page, operation=self.operation, parse=False, page=page
+            )
+
+        if not isinstance(payload, dict):
+            self._log.error(f"unexpected response for page {page}")
+            raise UnidentifiedAPIError(reason=f"Unexpected points page {page}: {payload!r}")
+
+        return page, payload
+
+    def _total_pages(self, payload: dict) -> int | None:
+        total = payload.get("totalPages", payload.get("total_pages"))
+        if total is None and payload.get("count") is not None:
+            total = -(-payload["count"] // self.per_page)
+
+        return total
+
+    async def stream(self) -> AsyncIterator[Tuple[int, List[Point]]]:
+        """Fetches all pages not fetched yet with bounded concurrency
+
+        :return: async iterator of page number and its points, in completion order
+        :rtype: AsyncIterator[Tuple[int, List[Point]]]
+        """
+
+        self._load_checkpoint()
+        self.skipped_pages = len(self.done)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        log = self.inpost._log
+
+        if self.total_pages is None and 1 not in self.done:
+            page, payload = await self._fetch(1, semaphore)
+            self.total_pages = self._total_pages(payload)
+            points = [Point(point_data=data, logger=log) for data in payload.get("points", [])]
+            self.done.add(page)
+            self._save_checkpoint()
+            yield page, points
+            if self.total_pages is None and len(points) < self.per_page:
+                self.total_pages = 1
+
+        next_page, exhausted = 1, False
+        while not exhausted:
+            # without known number of pages fetch waves of `concurrency` pages until short page is returned
+            last = self.total_pages if self.total_pages is not None else next_page + self.concurrency
+            pages = [p for p in range(next_page, last + 1) if p not in self.done]
+            next_page = last + 1
+            exhausted = self.total_pages is not None
+
+            tasks = [asyncio.create_task(self._fetch(page, semaphore)) for page in pages]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    page, payload = await task
+                    points = [Point(point_data=data, logger=log) for data in payload.get("points", [])]
+                    if len(points) < self.per_page and self.total_pages is None:
+                        exhausted = True
+                    self.done.add(page)
+                    self._save_checkpoint()
+                    yield page, points
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+    async def run(self, sink: Callable[[List[Point]], None]) -> SyncReport:
+        """Fetches all pages and passes their points to `sink` (e.g. `list.extend`)
+
+        :param sink: callable receiving points of every fetched page
+        :type sink: Callable[[List[Point]], None]
+        :return: sync summary
+        :rtype: SyncReport
+        """
+
+        start, pages, points = time.perf_counter(), 0, 0
+        async for _, page_points in self.stream():
+            sink(page_points)
+            pages += 1
+            points += len(page_points)
+
+        report = SyncReport(
+            pages=pages,
+            points=points,
+            skipped_pages=self.skipped_pages,
+            elapsed=time.perf_counter() - start,
+        )
+        self._log.info(f"synced {report}")
+        return report
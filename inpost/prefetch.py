@@ -0,0 +1,318 @@
+import asyncio
+import copy
+import logging
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from inpost.points.geo import haversine
+from inpost.sessions import TRANSITIONS, CollectSession
+from inpost.static import MissingParamsError, Parcel, ParcelStatus, SingleParamError
+
+if TYPE_CHECKING:
+    from inpost.api import Inpost
+
+
+class CompartmentPrefetcher:
+    """Opt-in prefetcher of collect sessions. Every time user location is updated, `READY_TO_PICKUP` parcels
+    whose pickup point is within `radius` get validated in advance, and their sessions are re-validated shortly
+    before `sessionExpirationTime` runs out, so opening compartment at locker is a single request.
+    Sessions of parcels user walked away from are terminated.
+
+    .. code-block:: python
+
+        async with CompartmentPrefetcher(inpost) as prefetcher:
+            await prefetcher.refresh_parcels()
+            await prefetcher.update_location(latitude=51.107, longitude=17.038)
+            ...
+            async with await prefetcher.open(shipment_number="...") as session:
+                await session.wait_closed()
+
+    :param inpost: authenticated :class:`Inpost` instance
+    :type inpost: Inpost
+    :param parcels: parcels to watch, only `READY_TO_PICKUP` ones with pickup point are kept
+    :type parcels: List[Parcel] | None
+    :param radius: distance from pickup point in meters at which session is prefetched
+    :type radius: float
+    :param refresh_margin: seconds before session expiry at which it is re-validated
+    :type refresh_margin: float
+    :param keep_warm: maximum time in seconds to keep re-validating session of single parcel
+    :type keep_warm: float
+    :param logger: :class:`logging.Logger` parent instance, defaults to inpost logger
+    :type logger: logging.Logger | None
+    """
+
+    def __init__(
+        self,
+        inpost: "Inpost",
+        parcels: List[Parcel] | None = None,
+        radius: float = 100.0,
+        refresh_margin: float = 5.0,
+        keep_warm: float = 300.0,
+        logger: logging.Logger | None = None,
+    ):
+        """Constructor method
+
+        :param inpost: authenticated :class:`Inpost` instance
+        :type inpost: Inpost
+        :param parcels: parcels to watch, only `READY_TO_PICKUP` ones with pickup point are kept
+        :type parcels: List[Parcel] | None
+        :param radius: distance from pickup point in meters at which session is prefetched
+        :type radius: float
+        :param refresh_margin: seconds before session expiry at which it is re-validated
+        :type refresh_margin: float
+        :param keep_warm: maximum time in seconds to keep re-validating session of single parcel
+        :type keep_warm: float
+        :param logger: :class:`logging.Logger` parent instance, defaults to inpost logger
+        :type logger: logging.Logger | None
+        """
+
+        self.inpost: "Inpost" = inpost
+        self.radius: float = radius
+        self.refresh_margin: float = refresh_margin
+        self.keep_warm: float = keep_warm
+        self.location: dict | None = None
+        self.parcels: Dict[str, Parcel] = {}
+        self.sessions: Dict[str, CollectSession] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._pending: Set[str] = set()
+
+        self._log: logging.Logger = (logger or inpost._log).getChild(self.__class__.__name__)
+        self.track(parcels or [])
+        self._log.debug("created")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(radius={self.radius}, parcels={list(self.parcels)}, "
+            f"sessions={list(self.sessions)})"
+        )
+
+    async def __aenter__(self) -> "CompartmentPrefetcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def track(self, parcels: List[Parcel]) -> None:
+        """Replaces watched parcels
+
+        :param parcels: parcels to watch, only `READY_TO_PICKUP` ones with pickup point are kept
+        :type parcels: List[Parcel]
+        """
+
+        self.parcels = {
+            parcel.shipment_number: parcel
+            for parcel in parcels
+            if parcel.status == ParcelStatus.READY_TO_PICKUP and parcel.pickup_point is not None
+        }
+        self._log.debug(f"tracking {len(self.parcels)} parcels")
+
+    async def refresh_parcels(self) -> List[Parcel]:
+        """Fetches `READY_TO_PICKUP` parcels and starts watching them
+
+        :return: watched parcels
+        :rtype: List[Parcel]
+        """
+
+        parcels = await self.inpost.get_parcels(status=ParcelStatus.READY_TO_PICKUP, parse=True)
+        self.track([parcel for parcel in parcels if isinstance(parcel, Parcel)])
+        return list(self.parcels.values())
+
+    def nearby(self, latitude: float, longitude: float) -> List[Parcel]:
+        """Returns watched parcels whose pickup point is within radius
+
+        :param latitude: user latitude
+        :type latitude: float
+        :param longitude: user longitude
+        :type longitude: float
+        :return: parcels waiting nearby
+        :rtype: List[Parcel]
+        """
+
+        return [parcel for parcel in self.parcels.values() if self._within(parcel, latitude, longitude)]
+
+    def _within(self, parcel: Parcel, latitude: float, longitude: float) -> bool:
+        point = parcel.pickup_point
+        return point is not None and haversine(latitude, longitude, point.latitude, point.longitude) <= self.radius
+
+    async def update_location(
+        self, latitude: float, longitude: float, accuracy: float = 5.0
+    ) -> Dict[str, CollectSession]:
+        """Updates user location, prefetches sessions of parcels that got within radius
+        and terminates sessions of parcels that are no longer in it
+
+        :param latitude: user latitude
+        :type latitude: float
+        :param longitude: user longitude
+        :type longitude: float
+        :param accuracy: location accuracy in meters
+        :type accuracy: float
+        :return: :class:`dict` of shipment number and prefetched session
+        :rtype: Dict[str, CollectSession]
+        """
+
+        self.location = {"latitude": latitude, "longitude": longitude, "accuracy": accuracy}
+        nearby = {
+            number: parcel for number, parcel in self.parcels.items() if self._within(parcel, latitude, longitude)
+        }
+
+        await asyncio.gather(*(self._drop(number) for number in list(self.sessions) if number not in nearby))
+        numbers = [number for number in nearby if number not in self.sessions and number not in self._pending]
+        # marked before any validation starts, so overlapping location updates do not validate the same parcel twice
+        self._pending.update(numbers)
+        try:
+            await asyncio.gather(*(self._prefetch(number, nearby[number]) for number in numbers))
+        finally:
+            self._pending.difference_update(numbers)
+
+        return dict(self.sessions)
+
+    def _wanted(self, number: str) -> bool:
+        # parcel may get opened, untracked or left behind while its session is being validated
+        parcel = self.parcels.get(number)
+        return (
+            parcel is not None
+            and self.location is not None
+            and self._within(parcel, self.location["latitude"], self.location["longitude"])
+        )
+
+    async def _prefetch(self, number: str, parcel: Parcel) -> None:
+        # every session gets own parcel copy, so validation does not overwrite session uuid of session it replaces
+        parcel_obj = copy.copy(parcel)
+        known = parcel_obj.compartment_properties
+        session = CollectSession(
+            self.inpost, parcel_obj=parcel_obj, location=self.location, timeout=None, logger=self._log
+        )
+        self._pending.add(number)
+        try:
+            await session.validate()
+        except asyncio.CancelledError:
+            # dropped while validating, session may be already started in inpost api
+            if parcel_obj.compartment_properties is not known:
+                await self._terminate_cancelled(parcel_obj)
+            raise
+        except Exception as e:
+            # prefetching is best effort, open() validates again
+            self._log.warning(f"could not prefetch session for {number}: {e!r}")
+            return
+        finally:
+            self._pending.discard(number)
+
+        if not self._wanted(number):
+            self._log.debug(f"session for {number} no longer needed")
+            await self._terminate(session)
+            return
+
+        self._log.debug(f"prefetched session for {number}")
+        replaced = self.sessions.get(number)
+        self.sessions[number] = session
+        if replaced is not None:
+            await self._terminate(replaced)
+
+        if number not in self._tasks:
+            self._tasks[number] = asyncio.create_task(self._keep_warm(number))
+
+    async def _keep_warm(self, shipment_number: str) -> None:
+        until = asyncio.get_running_loop().time() + self.keep_warm
+        while (session := self.sessions.get(shipment_number)) is not None and session.expires_in is not None:
+            await asyncio.sleep(max(session.expires_in - self.refresh_margin, 0.0))
+            if self.sessions.get(shipment_number) is not session:
+                return
+
+            parcel = self.parcels.get(shipment_number)
+            if parcel is None or asyncio.get_running_loop().time() >= until:
+                del self.sessions[shipment_number]
+                await self._terminate(session)
+                self._log.debug(f"stopped keeping session for {shipment_number} warm")
+                break
+
+            # expiring session stays usable until the new one replaces it
+            await self._prefetch(shipment_number, parcel)
+            if self.sessions.get(shipment_number) is session:
+                del self.sessions[shipment_number]
+                await self._terminate(session)
+
+        self._tasks.pop(shipment_number, None)
+
+    async def _terminate(self, session: CollectSession) -> None:
+        if session.state not in TRANSITIONS["terminate"]:
+            return
+
+        try:
+            await session.terminate()
+        except Exception as e:
+            self._log.warning(f"could not terminate prefetched session: {e!r}")
+
+    async def _terminate_cancelled(self, parcel_obj: Parcel) -> None:
+        try:
+            await self.inpost.terminate_collect_session(parcel_obj=parcel_obj)
+        except Exception as e:
+            self._log.warning(f"could not terminate session of cancelled prefetch: {e!r}")
+
+    async def _drop(self, shipment_number: str) -> None:
+        task = self._tasks.pop(shipment_number, None)
+        if task is not None:
+            task.cancel()
+
+        session = self.sessions.pop(shipment_number, None)
+        if session is not None:
+            await self._terminate(session)
+
+    async def open(self, shipment_number: str | None = None, parcel_obj: Parcel | None = None) -> CollectSession:
+        """Opens compartment using prefetched session if it is still valid, otherwise validates parcel first.
+        Returned session is owned by caller, use it as async context manager so it gets terminated.
+
+        :param shipment_number: Parcel's shipment number
+        :type shipment_number: str | None
+        :param parcel_obj: :class:`Parcel` object
+        :type parcel_obj: Parcel | None
+        :return: session with opened compartment
+        :rtype: CollectSession
+        :raises MissingParamsError: none of required params filled in
+        :raises SingleParamError: both shipment_number and parcel_obj filled in
+        """
+
+        if shipment_number is None is parcel_obj:
+            raise MissingParamsError(reason="None of params are filled (one required)")
+        elif shipment_number is not None is not parcel_obj:
+            raise SingleParamError(reason="Fields shipment_number and parcel_obj filled in! Choose one!")
+
+        number = str(shipment_number if parcel_obj is None else parcel_obj.shipment_number)
+        task = self._tasks.pop(number, None)
+        if task is not None:
+            task.cancel()
+
+        # untracked right away, so session still being prefetched for it gets terminated instead of kept
+        tracked = self.parcels.pop(number, None)
+        session = self.sessions.pop(number, None)
+        try:
+            if session is not None and session.expired:
+                await self._terminate(session)
+                session = None
+
+            if session is None:
+                self._log.debug(f"no warm session for {number}, validating")
+                parcel_obj = parcel_obj or tracked
+                session = CollectSession(
+                    self.inpost,
+                    parcel_obj=parcel_obj,
+                    shipment_number=number if parcel_obj is None else None,
+                    location=self.location,
+                    logger=self._log,
+                )
+                await session.validate()
+
+            await session.open()
+        except BaseException:
+            if session is not None:
+                await self._terminate(session)
+            if tracked is not None:
+                self.parcels[number] = tracked
+            raise
+
+        return session
+
+    async def close(self) -> None:
+        """Stops keeping sessions warm and terminates all prefetched sessions"""
+
+        # sessions still being validated are terminated once validated
+        self.location = None
+        await asyncio.gather(*(self._drop(number) for number in list(self.sessions) + list(self._tasks)))
@@ -0,0 +1,296 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Tuple, TypeVar
+
+from inpost.static import (
+    CollectSessionState,
+    CompartmentActualStatus,
+    CompartmentExpectedStatus,
+    Parcel,
+    SessionStateError,
+    StepTimings,
+)
+
+if TYPE_CHECKING:
+    from inpost.api import Inpost
+
+T = TypeVar("T")
+
+# states every step may be started from, anything else is refused before any request is sent
+TRANSITIONS: Dict[str, Tuple[CollectSessionState, ...]] = {
+    "validate": (CollectSessionState.NEW,),
+    "open": (CollectSessionState.VALIDATED,),
+    "reopen": (CollectSessionState.OPENED, CollectSessionState.CLOSED),
+    "status": (CollectSessionState.OPENED, CollectSessionState.CLOSED),
+    "terminate": (CollectSessionState.VALIDATED, CollectSessionState.OPENED, CollectSessionState.CLOSED),
+}
+
+
+class CollectSession:
+    """Async context manager wrapping compartment collect flow of single parcel into one object that tracks state.
+    Steps not allowed in current state (see :data:`TRANSITIONS`) raise :class:`SessionStateError` without
+    calling api, and session is always terminated on exit, also when the block raises or times out.
+
+    .. code-block:: python
+
+        async with CollectSession(inpost, parcel_obj=parcel) as session:
+            await session.validate()
+            await session.open()
+            await session.wait_closed()
+
+    :param inpost: authenticated :class:`Inpost` instance
+    :type inpost: Inpost
+    :param parcel_obj: parcel to collect, fetched on validation from `shipment_number` if not provided
+    :type parcel_obj: Parcel | None
+    :param shipment_number: shipment number of parcel to collect
+    :type shipment_number: str | None
+    :param location: user location sent on validation, mocked parcel location is used if not provided
+    :type location: dict | None
+    :param timeout: maximum duration of whole session in seconds, counted from entering context, None disables it
+    :type timeout: float | None
+    :param logger: :class:`logging.Logger` parent instance, defaults to inpost logger
+    :type logger: logging.Logger | None
+    """
+
+    def __init__(
+        self,
+        inpost: "Inpost",
+        parcel_obj: Parcel | None = None,
+        shipment_number: str | None = None,
+        location: dict | None = None,
+        timeout: float | None = 120.0,
+        logger: logging.Logger | None = None,
+    ):
+        """Constructor method
+
+        :param inpost: authenticated :class:`Inpost` instance
+        :type inpost: Inpost
+        :param parcel_obj: parcel to collect, fetched on validation from `shipment_number` if not provided
+        :type parcel_obj: Parcel | None
+        :param shipment_number: shipment number of parcel to collect
+        :type shipment_number: str | None
+        :param location: user location sent on validation, mocked parcel location is used if not provided
+        :type location: dict | None
+        :param timeout: maximum duration of whole session in seconds, counted from entering context, None disables it
+        :type timeout: float | None
+        :param logger: :class:`logging.Logger` parent instance, defaults to inpost logger
+        :type logger: logging.Logger | None
+        """
+
+        self.inpost: "Inpost" = inpost
+        self.parcel: Parcel | None = parcel_obj
+        self.shipment_number: str | None = shipment_number
+        self.location: dict | None = location
+        self.timeout: float | None = timeout
+        self.state: CollectSessionState = CollectSessionState.NEW
+        self.timings: StepTimings = StepTimings()
+        self._deadline: float | None = None
+        self._expires_at: float | None = None
+
+        self._log: logging.Logger = (logger or inpost._log).getChild(self.__class__.__name__)
+        self._log.debug("created")
+
+    def __repr__(self):
+        fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k not in ("_log", "inpost"))
+        return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
+
+    async def __aenter__(self) -> "CollectSession":
+        if self.timeout is not None:
+            self._deadline = asyncio.get_running_loop().time() + self.timeout
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.state not in TRANSITIONS["terminate"]:
+            return
+
+        try:
+            await self.terminate()
+        except Exception as e:
+            # do not replace error raised inside of context with cleanup failure
+            self._log.warning(f"could not terminate collect session: {e!r}")
+
+    @property
+    def expired(self) -> bool:
+        """Returns whether validated session outlived its `sessionExpirationTime` and can no longer be opened
+
+        :return: True if session expired
+        :rtype: bool
+        """
+
+        return self._expires_at is not None and asyncio.get_running_loop().time() >= self._expires_at
+
+    @property
+    def expires_in(self) -> float | None:
+        """Returns how long validated session can still be opened
+
+        :return: seconds left to session expiry, None if session is not validated or never expires
+        :rtype: float | None
+        """
+
+        if self._expires_at is None:
+            return None
+
+        return self._expires_at - asyncio.get_running_loop().time()
+
+    def _check(self, step: str) -> None:
+        if self.state not in TRANSITIONS[step]:
+            self._log.error(f"{step} not allowed in state {self.state.name}")
+            raise SessionStateError(reason=f"Cannot {step} collect session in state {self.state.name}")
+
+    async def _run(self, step: str, coro: Coroutine[Any, Any, T]) -> T:
+        with self.timings.measure(step):
+            if self._deadline is None:
+                return await coro
+
+            remaining = self._deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                coro.close()
+                raise asyncio.TimeoutError(f"collect session timed out before {step}")
+
+            return await asyncio.wait_for(coro, remaining)
+
+    @property
+    def _parcel(self) -> Parcel:
+        # set by validation, which every other step requires in its allowed states
+        if self.parcel is None:
+            raise SessionStateError(reason="Collect session has no parcel, validate it first")
+
+        return self.parcel
+
+    def _remaining(self, timeout: float) -> float:
+        if self._deadline is None:
+            return timeout
+
+        return min(timeout, self._deadline - asyncio.get_running_loop().time())
+
+    async def validate(self) -> Parcel:
+        """Collects compartment properties, which starts session in inpost api
+
+        :return: parcel with compartment properties set
+        :rtype: Parcel
+        :raises SessionStateError: session was already validated
+        :raises asyncio.TimeoutError: session timeout passed
+        """
+
+        self._check("validate")
+        parcel_obj = await self._run(
+            "validate",
+            self.inpost.collect_compartment_properties(
+                shipment_number=self.shipment_number if self.parcel is None else None,
+                parcel_obj=self.parcel,
+                location=self.location,
+            ),
+        )
+
+        self.parcel, self.state = parcel_obj, CollectSessionState.VALIDATED
+        lifetime = parcel_obj.compartment_properties.session_expiration_time
+        if lifetime:
+            self._expires_at = asyncio.get_running_loop().time() + lifetime / 1000
+
+        self._log.debug(f"validated session for {parcel_obj.shipment_number}")
+        return parcel_obj
+
+    async def open(self) -> Parcel:
+        """Opens compartment
+
+        :return: parcel with compartment location set
+        :rtype: Parcel
+        :raises SessionStateError: session is not validated, already opened or expired
+        :raises asyncio.TimeoutError: session timeout passed
+        """
+
+        self._check("open")
+        if self.expired:
+            self._log.error("session expired before opening compartment")
+            raise SessionStateError(reason="Collect session expired, validate parcel again")
+
+        parcel_obj = self._parcel
+        await self._run("open", self.inpost.open_compartment(parcel_obj=parcel_obj))
+        self.state = CollectSessionState.OPENED
+        return parcel_obj
+
+    async def reopen(self) -> bool:
+        """Reopens compartment
+
+        :return: True if compartment gets reopened
+        :rtype: bool
+        :raises SessionStateError: compartment was not opened before
+        :raises asyncio.TimeoutError: session timeout passed
+        """
+
+        self._check("reopen")
+        reopened = await self._run("reopen", self.inpost.reopen_compartment(parcel_obj=self._parcel))
+        self.state = CollectSessionState.OPENED
+        return reopened
+
+    async def status(
+        self, expected_status: CompartmentExpectedStatus = CompartmentExpectedStatus.CLOSED
+    ) -> CompartmentActualStatus:
+        """Checks compartment status once
+
+        :param expected_status: compartment expected status
+        :type expected_status: CompartmentExpectedStatus
+        :return: actual compartment status
+        :rtype: CompartmentActualStatus
+        :raises SessionStateError: compartment was not opened before
+        :raises asyncio.TimeoutError: session timeout passed
+        """
+
+        self._check("status")
+        await self._run(
+            "status", self.inpost.check_compartment_status(parcel_obj=self._parcel, expected_status=expected_status)
+        )
+        return self._update_state()
+
+    async def wait_closed(self, timeout: float = 60.0) -> CompartmentActualStatus:
+        """Waits until compartment gets closed, see :meth:`Inpost.wait_for_compartment_status`
+
+        :param timeout: maximum waiting time in seconds, shortened to session timeout
+        :type timeout: float
+        :return: actual compartment status
+        :rtype: CompartmentActualStatus
+        :raises SessionStateError: compartment was not opened before
+        :raises CompartmentStatusTimeoutError: compartment was not closed in time
+        """
+
+        self._check("status")
+        with self.timings.measure("status"):
+            await self.inpost.wait_for_compartment_status(
+                parcel_obj=self._parcel,
+                expected_status=CompartmentExpectedStatus.CLOSED,
+                timeout=max(self._remaining(timeout), 0.0),
+                terminate=False,
+            )
+        return self._update_state()
+
+    def _update_state(self) -> CompartmentActualStatus:
+        status = self._parcel.compartment_status
+        if status is None:
+            return CompartmentActualStatus.UNKNOWN
+
+        if status == CompartmentActualStatus.CLOSED:
+            self.state = CollectSessionState.CLOSED
+        elif status == CompartmentActualStatus.OPENED:
+            self.state = CollectSessionState.OPENED
+
+        return status
+
+    async def terminate(self) -> bool:
+        """Terminates session in inpost api, terminating already terminated session does nothing
+
+        :return: True if session gets terminated
+        :rtype: bool
+        :raises SessionStateError: session was never validated
+        """
+
+        if self.state == CollectSessionState.TERMINATED:
+            return True
+
+        self._check("terminate")
+        # cleanup is not bound by session timeout, it has to run exactly when the session ran out of time
+        with self.timings.measure("terminate"):
+            terminated = await self.inpost.terminate_collect_session(parcel_obj=self._parcel)
+
+        self.state = CollectSessionState.TERMINATED
+        return terminated
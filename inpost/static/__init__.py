@@ -31,6 +31,7 @@ from .endpoints import (
     validate_sent_url,
 )
 from .exceptions import (
+    CompartmentStatusTimeoutError,
     MissingParamsError,
     NoParcelError,
     NotAuthenticatedError,
@@ -39,6 +40,8 @@ from .exceptions import (
     PhoneNumberError,
     ReAuthenticationError,
     RefreshTokenError,
+    SerializationError,
+    SessionStateError,
     SingleParamError,
     SmsCodeError,
     UnauthorizedError,
@@ -57,8 +60,10 @@ from .parcels import (
     MultiCompartment,
     Operations,
     Parcel,
+    ParcelChanges,
     PickupPoint,
     Point,
+    PointRegistry,
     QRCode,
     Receiver,
     ReturnParcel,
@@ -66,7 +71,9 @@ from .parcels import (
     SentParcel,
     SharedTo,
 )
+from .results import CollectResult, StepTimings
 from .statuses import (
+    CollectSessionState,
     CompartmentActualStatus,
     CompartmentExpectedStatus,
     DeliveryType,
@@ -126,6 +133,9 @@ __all__ = [
     "PhoneNumberError",
     "ReAuthenticationError",
     "RefreshTokenError",
+    "SerializationError",
+    "CompartmentStatusTimeoutError",
+    "SessionStateError",
     "SingleParamError",
     "SmsCodeError",
     "UnauthorizedError",
@@ -141,14 +151,19 @@ __all__ = [
     "EventLog",
     "MultiCompartment",
     "Parcel",
+    "ParcelChanges",
     "PickupPoint",
     "Point",
+    "PointRegistry",
     "QRCode",
     "Receiver",
     "ReturnParcel",
     "Sender",
     "SentParcel",
     "SharedTo",
+    "CollectResult",
+    "StepTimings",
+    "CollectSessionState",
     "CompartmentActualStatus",
     "CompartmentExpectedStatus",
     "DeliveryType",
@@ -0,0 +1,16 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from arrow import Arrow
+
+
+def get(*args, **kwargs) -> "Arrow":
+    """Parses date with :func:`arrow.get`, arrow is imported on first call instead of at import time
+
+    :return: parsed date
+    :rtype: Arrow
+    """
+
+    from arrow import get as arrow_get
+
+    return arrow_get(*args, **kwargs)
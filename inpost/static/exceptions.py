@@ -52,6 +52,18 @@ class UnidentifiedParcelError(BaseInpostError):
     pass
 
 
+class CompartmentStatusTimeoutError(BaseInpostError):
+    """Is raised when compartment does not reach expected status before deadline"""
+
+    pass
+
+
+class SessionStateError(BaseInpostError):
+    """Is raised when compartment session step is not allowed in its current state"""
+
+    pass
+
+
 # ----------------- API ----------------- #
 class NotAuthenticatedError(BaseInpostError):
     """Is raised when `Inpost.auth_token` is missing"""
@@ -118,6 +130,12 @@ class MissingParamsError(BaseInpostError):
     pass
 
 
+class SerializationError(BaseInpostError):
+    """Is raised when serialized data cannot be decoded"""
+
+    pass
+
+
 class UnidentifiedError(BaseInpostError):
     """Is raised when no other error match"""
 
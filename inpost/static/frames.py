@@ -0,0 +1,371 @@
+import logging
+from array import array
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
+
+from inpost.static.dates import get
+from inpost.static.parcels import Parcel, PointRegistry
+from inpost.static.statuses import ParcelBase
+
+if TYPE_CHECKING:
+    from arrow import Arrow
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]  # pure python loops are used instead
+
+NAT: int = -(2**63)  # marks missing timestamps in int64 columns, same as numpy.datetime64("NaT")
+
+CATEGORICAL_COLUMNS = ("status", "shipment_type", "parcel_size", "pickup_point")
+TIMESTAMP_COLUMNS = ("stored_date", "expiry_date", "pickup_date")
+
+_SOURCES = {
+    "status": ("status",),
+    "shipment_type": ("shipmentType",),
+    "parcel_size": ("parcelSize",),
+    "pickup_point": ("pickUpPoint", "name"),
+    "stored_date": ("storedDate",),
+    "expiry_date": ("expiryDate",),
+    "pickup_date": ("pickUpDate",),
+}
+
+
+def to_epoch_ms(value: "str | datetime | Arrow | None") -> int:
+    """Converts date received from inpost api to epoch milliseconds
+
+    :param value: ISO 8601 date (e.g. `2022-11-30T06:55:08.000Z`) or already parsed date
+    :type value: str | datetime | Arrow | None
+    :return: epoch milliseconds or :data:`NAT` if date is missing
+    :rtype: int
+    """
+
+    if not value:
+        return NAT
+
+    if isinstance(value, str):
+        try:
+            date = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            # older pythons accept only 3 or 6 digits of fractional seconds, arrow parses any precision
+            date = get(value).datetime
+    else:
+        date = value if isinstance(value, datetime) else value.datetime
+
+    return int(date.replace(microsecond=0).timestamp()) * 1000 + date.microsecond // 1000
+
+
+def _lookup(data: dict, path: Sequence[str]):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+
+    return data
+
+
+def _view(column: array) -> "np.ndarray":
+    return np.frombuffer(column, dtype=column.typecode)
+
+
+def _names(values) -> set:
+    if values is None:
+        return set()
+    if isinstance(values, (str, ParcelBase)):
+        values = [values]
+
+    return {value.name if isinstance(value, ParcelBase) else value for value in values}
+
+
+class ParcelFrame:
+    """Columnar representation of many parcels for bulk analytics. Categorical columns (`status`, `shipment_type`,
+    `parcel_size`, `pickup_point`) are stored as codes into per-column categories, timestamps as int64 epoch
+    milliseconds. Every column is an :class:`array.array`, so it can be viewed without copying by numpy
+    (e.g. `numpy.frombuffer(frame.columns["stored_date"], dtype="int64")`). Filtering, counting and sorting
+    run on such views when numpy is installed and fall back to plain loops otherwise.
+
+    :param shipment_numbers: shipment numbers of parcels
+    :type shipment_numbers: List[str]
+    :param columns: :class:`dict` of column name and :class:`array.array` holding column values
+    :type columns: Dict[str, array]
+    :param categories: :class:`dict` of categorical column name and list of its categories
+    :type categories: Dict[str, List[str | None]]
+    :param payload: raw parcels data, used to build :class:`Parcel` objects on demand
+    :type payload: List[dict]
+    """
+
+    def __init__(
+        self,
+        shipment_numbers: List[str],
+        columns: Dict[str, array],
+        categories: Dict[str, List[str | None]],
+        payload: List[dict],
+    ):
+        """Constructor method
+
+        :param shipment_numbers: shipment numbers of parcels
+        :type shipment_numbers: List[str]
+        :param columns: :class:`dict` of column name and :class:`array.array` holding column values
+        :type columns: Dict[str, array]
+        :param categories: :class:`dict` of categorical column name and list of its categories
+        :type categories: Dict[str, List[str | None]]
+        :param payload: raw parcels data, used to build :class:`Parcel` objects on demand
+        :type payload: List[dict]
+        """
+
+        self.shipment_numbers: List[str] = shipment_numbers
+        self.columns: Dict[str, array] = columns
+        self.categories: Dict[str, List[str | None]] = categories
+        self._payload: List[dict] = payload
+
+    @classmethod
+    def from_payload(cls, parcels: Iterable[dict]) -> "ParcelFrame":
+        """`Classmethod` to build :class:`ParcelFrame` straight from `Inpost.get_parcels` payload
+
+        :param parcels: raw parcels data
+        :type parcels: Iterable[dict]
+        :return: frame holding provided parcels
+        :rtype: ParcelFrame
+        """
+
+        payload = list(parcels)
+        categories: Dict[str, List[str | None]] = {name: [] for name in CATEGORICAL_COLUMNS}
+        columns: Dict[str, array] = {name: array("I") for name in CATEGORICAL_COLUMNS}
+        columns |= {name: array("q") for name in TIMESTAMP_COLUMNS}
+
+        for name in CATEGORICAL_COLUMNS:
+            codes: Dict[str | None, int] = {}
+            for data in payload:
+                value = _lookup(data, _SOURCES[name])
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(codes)
+                columns[name].append(code)
+            categories[name] = list(codes)
+
+        for name in TIMESTAMP_COLUMNS:
+            columns[name].extend(to_epoch_ms(_lookup(data, _SOURCES[name])) for data in payload)
+
+        return cls(
+            shipment_numbers=[data.get("shipmentNumber") for data in payload],
+            columns=columns,
+            categories=categories,
+            payload=payload,
+        )
+
+    def __len__(self):
+        return len(self.shipment_numbers)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(parcels={len(self)}, columns={list(self.columns)})"
+
+    def column(self, name: str) -> list:
+        """Returns decoded values of column
+
+        :param name: column name
+        :type name: str
+        :return: values of categorical column as strings, timestamps as epoch milliseconds (:data:`NAT` if missing)
+        :rtype: list
+        :raises KeyError: unknown column
+        """
+
+        if name == "shipment_number":
+            return list(self.shipment_numbers)
+
+        if name in self.categories:
+            categories = self.categories[name]
+            return [categories[code] for code in self.columns[name]]
+
+        return self.columns[name].tolist()
+
+    def mask(
+        self,
+        status=None,
+        shipment_type=None,
+        parcel_size=None,
+        pickup_point=None,
+        **time_ranges: Sequence[int | None],
+    ) -> List[bool]:
+        """Builds boolean mask of parcels matching all provided conditions.
+        Categorical conditions are resolved to codes once and compared against code columns.
+
+        :param status: accepted statuses (:class:`ParcelStatus` or names)
+        :type status: ParcelStatus | str | Iterable | None
+        :param shipment_type: accepted shipment types (:class:`ParcelShipmentType` or names)
+        :type shipment_type: ParcelShipmentType | str | Iterable | None
+        :param parcel_size: accepted parcel sizes (e.g. `A`, :class:`ParcelLockerSize.B`)
+        :type parcel_size: ParcelLockerSize | ParcelCarrierSize | str | Iterable | None
+        :param pickup_point: accepted pickup point names (e.g. `GXO05M`)
+        :type pickup_point: str | Iterable[str] | None
+        :param time_ranges: timestamp column name mapped to `(since, until)` epoch milliseconds, either may be None
+        :type time_ranges: Sequence[int | None]
+        :return: list with True for every matching parcel
+        :rtype: List[bool]
+        :raises KeyError: unknown timestamp column
+        """
+
+        wanted, ranges = self._conditions(status, shipment_type, parcel_size, pickup_point, **time_ranges)
+        if np is not None:
+            return self._mask_array(wanted, ranges).tolist()
+
+        result = [True] * len(self)
+        for name, codes in wanted.items():
+            accepted = set(codes)
+            result = [keep and code in accepted for keep, code in zip(result, self.columns[name])]
+
+        for name, (low, high) in ranges.items():
+            result = [keep and low <= value <= high for keep, value in zip(result, self.columns[name])]
+
+        return result
+
+    def _conditions(
+        self, status=None, shipment_type=None, parcel_size=None, pickup_point=None, **time_ranges: Sequence[int | None]
+    ) -> Tuple[Dict[str, List[int]], Dict[str, Tuple[int, int]]]:
+        # resolves categorical conditions to accepted codes and time ranges to inclusive bounds
+        conditions = {
+            "status": status,
+            "shipment_type": shipment_type,
+            "parcel_size": parcel_size,
+            "pickup_point": pickup_point,
+        }
+        wanted = {}
+        for name, values in conditions.items():
+            if values is not None:
+                accepted = _names(values)
+                wanted[name] = [code for code, category in enumerate(self.categories[name]) if category in accepted]
+
+        ranges = {}
+        for name, (since, until) in time_ranges.items():
+            if name not in TIMESTAMP_COLUMNS:
+                raise KeyError(name)
+
+            ranges[name] = (since if since is not None else NAT + 1, until if until is not None else 2**63 - 1)
+
+        return wanted, ranges
+
+    def _mask_array(self, wanted: Dict[str, List[int]], ranges: Dict[str, Tuple[int, int]]) -> "np.ndarray":
+        result = np.ones(len(self), dtype=bool)
+        for name, codes in wanted.items():
+            result &= np.isin(_view(self.columns[name]), codes)
+
+        for name, (low, high) in ranges.items():
+            values = _view(self.columns[name])
+            result &= (values >= low) & (values <= high)
+
+        return result
+
+    def take(self, indices: "Sequence[int] | np.ndarray") -> "ParcelFrame":
+        """Returns new frame containing only parcels at provided positions, in provided order
+
+        :param indices: positions of parcels
+        :type indices: Sequence[int] | numpy.ndarray
+        :return: new frame
+        :rtype: ParcelFrame
+        """
+
+        if np is not None:
+            positions = np.asarray(indices, dtype=np.intp)
+            columns = {
+                name: array(column.typecode, _view(column)[positions].tobytes())
+                for name, column in self.columns.items()
+            }
+            indices = positions.tolist()
+        else:
+            columns = {
+                name: array(column.typecode, [column[i] for i in indices]) for name, column in self.columns.items()
+            }
+
+        return self.__class__(
+            shipment_numbers=[self.shipment_numbers[i] for i in indices],
+            columns=columns,
+            categories=self.categories,
+            payload=[self._payload[i] for i in indices],
+        )
+
+    def filter(self, mask: Sequence[bool] | None = None, **conditions) -> "ParcelFrame":
+        """Returns new frame containing only matching parcels
+
+        :param mask: precomputed mask (see :meth:`mask`)
+        :type mask: Sequence[bool] | None
+        :param conditions: conditions passed to :meth:`mask` if mask is not provided
+        :return: new frame
+        :rtype: ParcelFrame
+        """
+
+        if np is not None:
+            if mask is None:
+                return self.take(np.flatnonzero(self._mask_array(*self._conditions(**conditions))))
+
+            return self.take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+
+        if mask is None:
+            mask = self.mask(**conditions)
+
+        return self.take([i for i, keep in enumerate(mask) if keep])
+
+    def count_by(self, name: str) -> Dict[str | None, int]:
+        """Counts parcels grouped by categorical column
+
+        :param name: categorical column name
+        :type name: str
+        :return: :class:`dict` of category and number of parcels in it
+        :rtype: Dict[str | None, int]
+        :raises KeyError: unknown categorical column
+        """
+
+        categories = self.categories[name]
+        if np is not None:
+            counts = np.bincount(_view(self.columns[name]), minlength=len(categories)).tolist()
+        else:
+            counts = [0] * len(categories)
+            for code in self.columns[name]:
+                counts[code] += 1
+
+        return {category: count for category, count in zip(categories, counts) if count}
+
+    def sort(self, name: str, reverse: bool = False) -> "ParcelFrame":
+        """Returns new frame sorted by column. Missing timestamps are always placed last.
+
+        :param name: column name
+        :type name: str
+        :param reverse: sort descending
+        :type reverse: bool
+        :return: new sorted frame
+        :rtype: ParcelFrame
+        :raises KeyError: unknown column
+        """
+
+        if np is not None and name in self.columns:
+            keys = self._sort_keys(name)
+            present = np.flatnonzero(keys != NAT)
+            order = np.argsort(-keys[present] if reverse else keys[present], kind="stable")
+            return self.take(np.concatenate((present[order], np.flatnonzero(keys == NAT))))
+
+        values = self.column(name)
+        missing = NAT if name in TIMESTAMP_COLUMNS else None
+        present = sorted((i for i in range(len(self)) if values[i] != missing), key=values.__getitem__, reverse=reverse)
+        return self.take(present + [i for i in range(len(self)) if values[i] == missing])
+
+    def _sort_keys(self, name: str) -> "np.ndarray":
+        # timestamps sort by themselves, categorical codes are mapped to rank of their category, missing ones to NAT
+        values = _view(self.columns[name]).astype(np.int64, copy=False)
+        if name not in self.categories:
+            return values
+
+        categories = self.categories[name]
+        ranked = sorted(category for category in categories if category is not None)
+        ranks: Dict[str | None, int] = {category: rank for rank, category in enumerate(ranked)}
+        return np.array([ranks.get(category, NAT) for category in categories], dtype=np.int64)[values]
+
+    def to_parcels(self, logger: logging.Logger, point_registry: PointRegistry | None = None) -> List[Parcel]:
+        """Builds :class:`Parcel` objects for parcels in frame
+
+        :param logger: :class:`logging.Logger` parent instance
+        :type logger: logging.Logger
+        :param point_registry: registry sharing points between built parcels, points are not shared if None
+        :type point_registry: PointRegistry | None
+        :return: parsed parcels
+        :rtype: List[Parcel]
+        """
+
+        return [Parcel(parcel_data=data, logger=logger, point_registry=point_registry) for data in self._payload]
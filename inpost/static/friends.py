@@ -1,6 +1,10 @@
 import logging
+from typing import TYPE_CHECKING
 
-from arrow import Arrow, get
+from inpost.static.dates import get
+
+if TYPE_CHECKING:
+    from arrow import Arrow
 
 
 class Friend:
@@ -1,12 +1,15 @@
+import hashlib
+import json
 import logging
 import random
+import sys
+import weakref
 from io import BytesIO
-from typing import List, Tuple
-
-import qrcode
-from arrow import arrow, get
+from typing import TYPE_CHECKING, List, Tuple, Type
 
+from inpost.static.dates import get
 from inpost.static.exceptions import UnknownStatusError
+from inpost.static.qr import cached_compact_png, cached_png, matrix_to_svg, pack_matrix, render_matrix
 from inpost.static.statuses import (
     CompartmentActualStatus,
     ParcelCarrierSize,
@@ -21,6 +24,96 @@ from inpost.static.statuses import (
     ReturnsStatus,
 )
 
+if TYPE_CHECKING:
+    from arrow import arrow
+
+
+def _drop_none(data: dict) -> dict:
+    return {k: v for k, v in data.items() if v is not None}
+
+
+def _isoformat(date: "arrow.Arrow | None") -> str | None:
+    return date.isoformat() if date is not None else None
+
+
+def _name(member) -> str | None:
+    return member.name if member is not None else None
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _digest(data: dict) -> bytes:
+    return hashlib.blake2b(json.dumps(data, sort_keys=True, default=str).encode(), digest_size=16).digest()
+
+
+def _same(obj, data: dict | None) -> bool:
+    if obj is None or data is None:
+        return obj is None and data is None
+
+    return obj.to_dict() == _drop_none(data)
+
+
+class ParcelChanges:
+    """Object representation of changes applied to parcel by `update`
+
+    :param shipment_number: shipment number of updated parcel
+    :type shipment_number: str | None
+    """
+
+    def __init__(self, shipment_number: str | None):
+        """Constructor method
+
+        :param shipment_number: shipment number of updated parcel
+        :type shipment_number: str | None
+        """
+
+        self.shipment_number: str | None = shipment_number
+        self.fields: dict = {}
+        self.new_events: List[EventLog] = []
+        self.compartment_assigned: bool = False
+
+    def __repr__(self):
+        fields = tuple(f"{k}={v}" for k, v in self.__dict__.items())
+        return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
+
+    def __bool__(self):
+        return bool(self.fields) or bool(self.new_events) or self.compartment_assigned
+
+    def record(self, field: str, old, new) -> None:
+        """Records change of single field
+
+        :param field: name of changed attribute
+        :type field: str
+        :param old: value before update
+        :type old: typing.Any
+        :param new: value after update
+        :type new: typing.Any
+        """
+
+        self.fields[field] = (old, new)
+
+    @property
+    def status_changed(self) -> bool:
+        """Specifies if parcel status changed
+
+        :return: True if status changed
+        :rtype: bool
+        """
+
+        return "status" in self.fields
+
+    @property
+    def expiry_moved(self) -> bool:
+        """Specifies if parcel expiry date changed
+
+        :return: True if expiry date changed
+        :rtype: bool
+        """
+
+        return "expiry_date" in self.fields
+
 
 class BaseParcel:
     """Object representation of :class:`inpost.api.Inpost` parcel base. Gather things shared by all parcel types.
@@ -29,11 +122,17 @@ class BaseParcel:
     :type parcel_data: dict
     :param logger: :class:`logging.Logger` parent instance
     :type logger: logging.Logger
+    :param point_registry: registry sharing points between parcels of the same client, points are not shared if None
+    :type point_registry: PointRegistry | None
     """
 
-    def __init__(self, parcel_data: dict, logger: logging.Logger):
+    # set by subclasses that carry qr code
+    _qr_code: "QRCode | None"
+
+    def __init__(self, parcel_data: dict, logger: logging.Logger, point_registry: "PointRegistry | None" = None):
         self.shipment_number = parcel_data.get("shipmentNumber")
         self._log: logging.Logger = logger.getChild(f"{self.__class__.__name__}.{self.shipment_number}")
+        self._point_registry: PointRegistry | None = point_registry
         self.status: ParcelStatus = ParcelStatus[parcel_data.get("status")]
         self.expiry_date: arrow | None = get(parcel_data["expiryDate"]) if "expiryDate" in parcel_data else None
         self.operations: Operations = Operations(operations_data=parcel_data["operations"], logger=self._log)
@@ -41,6 +140,129 @@ class BaseParcel:
             EventLog(eventlog_data=event, logger=self._log) for event in parcel_data["eventLog"]
         ]
 
+    @classmethod
+    def from_dict(cls, parcel_data: dict, logger: logging.Logger, point_registry: "PointRegistry | None" = None):
+        """`Classmethod` to initialize parcel from :class:`dict` produced by `to_dict`.
+        Should be used when retrieving parcels from cache.
+
+        :param parcel_data: :class:`dict` containing all parcel data
+        :type parcel_data: dict
+        :param logger: :class:`logging.Logger` parent instance
+        :type logger: logging.Logger
+        :param point_registry: registry sharing points between parcels of the same client
+        :type point_registry: PointRegistry | None
+        :return: parcel object from provided data
+        :rtype: BaseParcel
+        """
+
+        return cls(parcel_data=parcel_data, logger=logger, point_registry=point_registry)
+
+    def __getstate__(self):
+        # registry belongs to client that built the parcel and holds weak references, which cannot be pickled
+        return {k: v for k, v in self.__dict__.items() if k != "_point_registry"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._point_registry = None
+
+    def _assign(self, changes: ParcelChanges, field: str, value) -> None:
+        old = getattr(self, field, None)
+        if old != value:
+            setattr(self, field, value)
+            changes.record(field, old, value)
+
+    def _assign_object(self, changes: ParcelChanges, field: str, data: dict | None, factory) -> None:
+        old = getattr(self, field, None)
+        if not _same(old, data):
+            new = factory(data) if data is not None else None
+            setattr(self, field, new)
+            changes.record(field, old, new)
+
+    def _assign_qr_code(self, changes: ParcelChanges, qr_code: str | None) -> None:
+        old = self._qr_code
+        if (old.payload if old is not None else None) != qr_code:
+            self._qr_code = QRCode(qrcode_data=qr_code, logger=self._log) if qr_code is not None else None
+            changes.record("_qr_code", old, self._qr_code)
+
+    def _point(self, point_class: Type["Point"], data: dict) -> "Point":
+        if self._point_registry is None:
+            return point_class(point_data=data, logger=self._log)
+
+        return self._point_registry.get(point_class, point_data=data, logger=self._log)
+
+    def _assign_point(self, changes: ParcelChanges, field: str, point_class: Type["Point"], data: dict | None) -> None:
+        if self._point_registry is None:
+            self._assign_object(changes, field, data, lambda point_data: point_class(point_data, logger=self._log))
+            return
+
+        # registry returns the very same object for unchanged point, so identity check is enough
+        point = self._point(point_class, data) if data is not None else None
+        old = getattr(self, field, None)
+        if point is not old:
+            setattr(self, field, point)
+            # deserialized parcels hold points that did not come from registry, their content decides
+            if not _same(old, data):
+                changes.record(field, old, point)
+
+    def update(self, parcel_data: dict) -> ParcelChanges:
+        """Updates parcel in place with newer data of the same parcel. Sub-trees that did not change
+        (e.g. already known events of `eventLog` or the same `pickUpPoint`) are not parsed again.
+
+        :param parcel_data: :class:`dict` containing all parcel data
+        :type parcel_data: dict
+        :return: changes applied to parcel
+        :rtype: ParcelChanges
+        """
+
+        changes = ParcelChanges(self.shipment_number)
+        self._apply(parcel_data, changes)
+
+        if changes:
+            self._log.debug(f"updated with {changes}")
+
+        return changes
+
+    def _apply(self, parcel_data: dict, changes: ParcelChanges) -> None:
+        self._assign(changes, "status", ParcelStatus[parcel_data.get("status")])
+        self._assign(changes, "expiry_date", get(parcel_data["expiryDate"]) if "expiryDate" in parcel_data else None)
+        self.operations = Operations(operations_data=parcel_data["operations"], logger=self._log)
+
+        event_log = parcel_data["eventLog"]
+        added = len(event_log) - len(self.event_log)
+        if added >= 0 and (
+            not self.event_log
+            or self._same_event(event_log[added], self.event_log[0])
+            and self._same_event(event_log[-1], self.event_log[-1])
+        ):
+            # event log is ordered from the newest event, so known events are its tail,
+            # both ends of the tail are checked, so history rewritten at its start is rebuilt too
+            changes.new_events = [EventLog(eventlog_data=event, logger=self._log) for event in event_log[:added]]
+            self.event_log = changes.new_events + self.event_log
+        else:
+            known = {str(event.to_dict()) for event in self.event_log}
+            self.event_log = [EventLog(eventlog_data=event, logger=self._log) for event in event_log]
+            changes.new_events = [event for event in self.event_log if str(event.to_dict()) not in known]
+
+    def _same_event(self, data: dict, event: "EventLog") -> bool:
+        return EventLog(eventlog_data=data, logger=self._log).to_dict() == event.to_dict()
+
+    def to_dict(self) -> dict:
+        """Returns parcel data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing all parcel data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "shipmentNumber": self.shipment_number,
+                "status": _name(self.status),
+                "expiryDate": _isoformat(self.expiry_date),
+                "operations": self.operations.to_dict(),
+                "eventLog": [event.to_dict() for event in self.event_log],
+            }
+        )
+
 
 class Parcel(BaseParcel):
     """Object representation of :class:`inpost.api.Inpost` incoming parcel
@@ -49,18 +271,22 @@ class Parcel(BaseParcel):
     :type parcel_data: dict
     :param logger: :class:`logging.Logger` parent instance
     :type logger: logging.Logger
+    :param point_registry: registry sharing points between parcels of the same client, points are not shared if None
+    :type point_registry: PointRegistry | None
     """
 
-    def __init__(self, parcel_data: dict, logger: logging.Logger):
+    def __init__(self, parcel_data: dict, logger: logging.Logger, point_registry: "PointRegistry | None" = None):
         """Constructor method
 
         :param parcel_data: dict containing parcel data
         :type parcel_data: dict
         :param logger: logger instance
         :type logger: logging.Logger
+        :param point_registry: registry sharing points between parcels of the same client
+        :type point_registry: PointRegistry | None
         """
 
-        super().__init__(parcel_data, logger)
+        super().__init__(parcel_data, logger, point_registry)
         self._log: logging.Logger = logger.getChild(f"{self.__class__.__name__}.{self.shipment_number}")
         self.shipment_type: ParcelShipmentType = ParcelShipmentType[parcel_data.get("shipmentType")]
         self._open_code: str | None = parcel_data.get("openCode", None)
@@ -81,9 +307,7 @@ class Parcel(BaseParcel):
             Sender(sender_data=parcel_data["sender"], logger=self._log) if "sender" in parcel_data else None
         )
         self.pickup_point: PickupPoint | None = (
-            PickupPoint(point_data=parcel_data["pickUpPoint"], logger=self._log)
-            if "pickUpPoint" in parcel_data
-            else None
+            self._point(PickupPoint, parcel_data["pickUpPoint"]) if "pickUpPoint" in parcel_data else None
         )
         self.multi_compartment: MultiCompartment | None = (
             MultiCompartment(parcel_data["multiCompartment"], logger=self._log)
@@ -119,7 +343,7 @@ class Parcel(BaseParcel):
             self._log.warning(f'unexpected ownership status: {parcel_data["ownershipStatus"]}')
 
     def __repr__(self):
-        fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
+        fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k not in ("_log", "_point_registry"))
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
     def __str__(self):
@@ -130,6 +354,88 @@ class Parcel(BaseParcel):
             f"Pickup point: {self.pickup_point}"
         )
 
+    def _apply(self, parcel_data: dict, changes: ParcelChanges) -> None:
+        super()._apply(parcel_data, changes)
+        had_compartment = self._open_code is not None or self._qr_code is not None
+
+        self._assign(changes, "shipment_type", ParcelShipmentType[parcel_data.get("shipmentType")])
+        self._assign(changes, "_open_code", parcel_data.get("openCode", None))
+        self._assign_qr_code(changes, parcel_data.get("qrCode"))
+        self._assign(changes, "stored_date", get(parcel_data["storedDate"]) if "storedDate" in parcel_data else None)
+        self._assign(changes, "pickup_date", get(parcel_data["pickUpDate"]) if "pickUpDate" in parcel_data else None)
+        self._assign(
+            changes,
+            "parcel_size",
+            (
+                ParcelLockerSize[parcel_data.get("parcelSize")]
+                if self.shipment_type == ParcelShipmentType.parcel
+                else ParcelCarrierSize[parcel_data.get("parcelSize")]
+            ),
+        )
+        self._assign_object(
+            changes,
+            "receiver",
+            parcel_data.get("receiver"),
+            lambda data: Receiver(receiver_data=data, logger=self._log),
+        )
+        self._assign_object(
+            changes, "sender", parcel_data.get("sender"), lambda data: Sender(sender_data=data, logger=self._log)
+        )
+        self._assign_point(changes, "pickup_point", PickupPoint, parcel_data.get("pickUpPoint"))
+        self._assign_object(
+            changes,
+            "multi_compartment",
+            parcel_data.get("multiCompartment"),
+            lambda data: MultiCompartment(data, logger=self._log),
+        )
+        self._assign(changes, "is_end_off_week_collection", parcel_data.get("endOfWeekCollection", None))
+        self._assign(changes, "avizo_transaction_status", parcel_data.get("avizoTransactionStatus", None))
+        if "sharedTo" not in parcel_data or [person.to_dict() for person in self.shared_to or []] != [
+            _drop_none(person) for person in parcel_data["sharedTo"]
+        ]:
+            self._assign(
+                changes,
+                "shared_to",
+                (
+                    [SharedTo(sharedto_data=person, logger=self._log) for person in parcel_data["sharedTo"]]
+                    if "sharedTo" in parcel_data
+                    else None
+                ),
+            )
+        self._assign(changes, "ownership_status", ParcelOwnership[parcel_data.get("ownershipStatus")])
+        self._assign(changes, "economy_parcel", parcel_data.get("economyParcel", None))
+
+        changes.compartment_assigned = not had_compartment and (
+            self._open_code is not None or self._qr_code is not None
+        )
+
+    def to_dict(self) -> dict:
+        """Returns parcel data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing all parcel data
+        :rtype: dict
+        """
+
+        return super().to_dict() | _drop_none(
+            {
+                "shipmentType": _name(self.shipment_type),
+                "openCode": self._open_code,
+                "qrCode": self._qr_code.payload if self._qr_code is not None else None,
+                "storedDate": _isoformat(self.stored_date),
+                "pickUpDate": _isoformat(self.pickup_date),
+                "parcelSize": _name(self.parcel_size),
+                "receiver": self.receiver.to_dict() if self.receiver is not None else None,
+                "sender": self.sender.to_dict() if self.sender is not None else None,
+                "pickUpPoint": self.pickup_point.to_dict() if self.pickup_point is not None else None,
+                "multiCompartment": self.multi_compartment.to_dict() if self.multi_compartment is not None else None,
+                "endOfWeekCollection": self.is_end_off_week_collection,
+                "avizoTransactionStatus": self.avizo_transaction_status,
+                "sharedTo": [person.to_dict() for person in self.shared_to] if self.shared_to is not None else None,
+                "ownershipStatus": _name(self.ownership_status),
+                "economyParcel": self.economy_parcel,
+            }
+        )
+
     @property
     def open_code(self) -> str | None:
         """Returns an open code for :class:`Parcel`
@@ -348,18 +654,22 @@ class ReturnParcel(BaseParcel):
     :type parcel_data: dict
     :param logger: :class:`logging.Logger` parent instance
     :type logger: logging.Logger
+    :param point_registry: registry sharing points between parcels of the same client, points are not shared if None
+    :type point_registry: PointRegistry | None
     """
 
-    def __init__(self, parcel_data: dict, logger: logging.Logger):
+    def __init__(self, parcel_data: dict, logger: logging.Logger, point_registry: "PointRegistry | None" = None):
         """Constructor method
 
         :param parcel_data: dict containing parcel data
         :type parcel_data: dict
         :param logger: logger instance
         :type logger: logging.Logger
+        :param point_registry: registry sharing points between parcels of the same client
+        :type point_registry: PointRegistry | None
         """
 
-        super().__init__(parcel_data, logger)
+        super().__init__(parcel_data, logger, point_registry)
         self.uuid: str = parcel_data.get("uuid")
         self.rma: str = parcel_data.get("rma")
         self.organization_name: str = parcel_data.get("organizationName")
@@ -371,6 +681,48 @@ class ReturnParcel(BaseParcel):
         self.order_number: str = parcel_data.get("orderNumber")
         self.form_type: str = parcel_data.get("formType")
 
+    def _apply(self, parcel_data: dict, changes: ParcelChanges) -> None:
+        super()._apply(parcel_data, changes)
+        for field, key in (
+            ("created_date", "createdDate"),
+            ("accepted_date", "acceptedDate"),
+            ("expiry_date", "expiryDate"),
+            ("sent_date", "sentDate"),
+            ("delivered_date", "deliveredDate"),
+        ):
+            self._assign(changes, field, get(parcel_data.get(key)))
+
+        for field, key in (
+            ("uuid", "uuid"),
+            ("rma", "rma"),
+            ("organization_name", "organizationName"),
+            ("order_number", "orderNumber"),
+            ("form_type", "formType"),
+        ):
+            self._assign(changes, field, parcel_data.get(key))
+
+    def to_dict(self) -> dict:
+        """Returns parcel data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing all parcel data
+        :rtype: dict
+        """
+
+        return super().to_dict() | _drop_none(
+            {
+                "uuid": self.uuid,
+                "rma": self.rma,
+                "organizationName": self.organization_name,
+                "createdDate": _isoformat(self.created_date),
+                "acceptedDate": _isoformat(self.accepted_date),
+                "expiryDate": _isoformat(self.expiry_date),
+                "sentDate": _isoformat(self.sent_date),
+                "deliveredDate": _isoformat(self.delivered_date),
+                "orderNumber": self.order_number,
+                "formType": self.form_type,
+            }
+        )
+
 
 class SentParcel(BaseParcel):
     # TODO: Recheck properties
@@ -380,18 +732,22 @@ class SentParcel(BaseParcel):
     :type parcel_data: dict
     :param logger: :class:`logging.Logger` parent instance
     :type logger: logging.Logger
+    :param point_registry: registry sharing points between parcels of the same client, points are not shared if None
+    :type point_registry: PointRegistry | None
     """
 
-    def __init__(self, parcel_data: dict, logger: logging.Logger):
+    def __init__(self, parcel_data: dict, logger: logging.Logger, point_registry: "PointRegistry | None" = None):
         """Constructor method
 
         :param parcel_data: dict containing parcel data
         :type parcel_data: dict
         :param logger: logger instance
         :type logger: logging.Logger
+        :param point_registry: registry sharing points between parcels of the same client
+        :type point_registry: PointRegistry | None
         """
 
-        super().__init__(parcel_data, logger)
+        super().__init__(parcel_data, logger, point_registry)
         self.origin_system: str | None = parcel_data.get("originSystem", None)
         self.quick_send_code: int | None = parcel_data.get("quickSendCode", None)
         self._qr_code: QRCode | None = (
@@ -411,17 +767,13 @@ class SentParcel(BaseParcel):
             Sender(sender_data=parcel_data["sender"], logger=self._log) if "sender" in parcel_data else None
         )
         self.pickup_point: PickupPoint | None = (
-            PickupPoint(point_data=parcel_data["pickUpPoint"], logger=self._log)
-            if "pickUpPoint" in parcel_data
-            else None
+            self._point(PickupPoint, parcel_data["pickUpPoint"]) if "pickUpPoint" in parcel_data else None
         )
         self.delivery_point: DeliveryPoint | None = (
             DeliveryPoint(parcel_data["deliveryPoint"], logger=self._log) if "deliveryPoint" in parcel_data else None
         )
         self.drop_off_point: DropOffPoint | None = (
-            DropOffPoint(point_data=parcel_data["dropOffPoint"], logger=self._log)
-            if "dropOffPoint" in parcel_data
-            else None
+            self._point(DropOffPoint, parcel_data["dropOffPoint"]) if "dropOffPoint" in parcel_data else None
         )
         self.payment: Payment | None = (
             Payment(payment_details=parcel_data["payment"], logger=self._log) if "payment" in parcel_data else None
@@ -431,6 +783,82 @@ class SentParcel(BaseParcel):
         self.status: ParcelStatus | None = ParcelStatus[parcel_data.get("status")]
         self._compartment_properties: CompartmentProperties | None = None
 
+    def _apply(self, parcel_data: dict, changes: ParcelChanges) -> None:
+        super()._apply(parcel_data, changes)
+        self._assign(changes, "origin_system", parcel_data.get("originSystem", None))
+        self._assign(changes, "quick_send_code", parcel_data.get("quickSendCode", None))
+        self._assign_qr_code(changes, parcel_data.get("qrCode"))
+        self._assign(changes, "confirmation_date", get(parcel_data.get("confirmationDate", None)))
+        self._assign(changes, "shipment_type", ParcelShipmentType[parcel_data["shipmentType"]])
+        self._assign(
+            changes,
+            "parcel_size",
+            (
+                ParcelLockerSize[parcel_data.get("parcelSize")]
+                if self.shipment_type == ParcelShipmentType.parcel
+                else ParcelCarrierSize[parcel_data.get("parcelSize")]
+            ),
+        )
+        self._assign_object(
+            changes,
+            "receiver",
+            parcel_data.get("receiver"),
+            lambda data: Receiver(receiver_data=data, logger=self._log),
+        )
+        self._assign_object(
+            changes, "sender", parcel_data.get("sender"), lambda data: Sender(sender_data=data, logger=self._log)
+        )
+        self._assign_point(changes, "pickup_point", PickupPoint, parcel_data.get("pickUpPoint"))
+        self._assign_object(
+            changes,
+            "delivery_point",
+            parcel_data.get("deliveryPoint"),
+            lambda data: DeliveryPoint(data, logger=self._log),
+        )
+        self._assign_point(changes, "drop_off_point", DropOffPoint, parcel_data.get("dropOffPoint"))
+        self._assign_object(
+            changes, "payment", parcel_data.get("payment"), lambda data: Payment(payment_details=data, logger=self._log)
+        )
+        self._assign(changes, "unlabeled", parcel_data.get("unlabeled", None))
+        self._assign(changes, "is_end_off_week_collection", parcel_data.get("endOfWeekCollection", None))
+
+    def to_dict(self) -> dict:
+        """Returns parcel data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing all parcel data
+        :rtype: dict
+        """
+
+        return super().to_dict() | _drop_none(
+            {
+                "originSystem": self.origin_system,
+                "quickSendCode": self.quick_send_code,
+                "qrCode": self._qr_code.payload if self._qr_code is not None else None,
+                "confirmationDate": _isoformat(self.confirmation_date),
+                "shipmentType": _name(self.shipment_type),
+                "parcelSize": _name(self.parcel_size),
+                "receiver": self.receiver.to_dict() if self.receiver is not None else None,
+                "sender": self.sender.to_dict() if self.sender is not None else None,
+                "pickUpPoint": self.pickup_point.to_dict() if self.pickup_point is not None else None,
+                "deliveryPoint": self.delivery_point.to_dict() if self.delivery_point is not None else None,
+                "dropOffPoint": self.drop_off_point.to_dict() if self.drop_off_point is not None else None,
+                "payment": self.payment.to_dict() if self.payment is not None else None,
+                "unlabeled": self.unlabeled,
+                "endOfWeekCollection": self.is_end_off_week_collection,
+            }
+        )
+
+    @property
+    def qr_code(self) -> "QRCode | None":
+        """Returns a quick send :class:`QRCode` of :class:`SentParcel`, e.g. for batch rendering with
+        :func:`inpost.static.qr.render_many`
+
+        :return: QR code or None if parcel has none
+        :rtype: QRCode | None
+        """
+
+        return self._qr_code
+
     @property
     def compartment_properties(self):
         """Returns a compartment properties for :class:`SentParcel`
@@ -590,6 +1018,21 @@ class Receiver:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    def to_dict(self) -> dict:
+        """Returns receiver data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing receiver data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "email": self.email,
+                "phoneNumber": self.phone_number,
+                "name": self.name,
+            }
+        )
+
 
 class Sender:
     """Object representation of :class:`BaseParcel` sender and it's subclasses
@@ -609,7 +1052,7 @@ class Sender:
         :type logger: logging.Logger
         """
 
-        self.sender_name: str | None = sender_data.get("name", None)
+        self.sender_name: str | None = _intern(sender_data.get("name", None))
         self.sender_email: str | None = sender_data.get("email", None)
         self._log: logging.Logger = logger.getChild(self.__class__.__name__)
 
@@ -619,6 +1062,20 @@ class Sender:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    def to_dict(self) -> dict:
+        """Returns sender data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing sender data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "name": self.sender_name,
+                "email": self.sender_email,
+            }
+        )
+
     def __str__(self) -> str:
         return self.sender_name or ""
 
@@ -643,15 +1100,15 @@ class Point:
 
         self._log: logging.Logger = logger.getChild(self.__class__.__name__)
 
-        self.name: str | None = point_data.get("name")
+        self.name: str | None = _intern(point_data.get("name"))
         self.latitude: float = point_data.get("location", {}).get("latitude")
         self.longitude: float = point_data.get("location", {}).get("longitude")
         self.description: str | None = point_data.get("locationDescription")
-        self.opening_hours: str | None = point_data.get("openingHours")
-        self.post_code: str | None = point_data.get("addressDetails", {}).get("postCode")
-        self.city: str | None = point_data.get("addressDetails", {}).get("city")
-        self.province: str | None = point_data.get("addressDetails", {}).get("province")
-        self.street: str | None = point_data.get("addressDetails", {}).get("street")
+        self.opening_hours: str | None = _intern(point_data.get("openingHours"))
+        self.post_code: str | None = _intern(point_data.get("addressDetails", {}).get("postCode"))
+        self.city: str | None = _intern(point_data.get("addressDetails", {}).get("city"))
+        self.province: str | None = _intern(point_data.get("addressDetails", {}).get("province"))
+        self.street: str | None = _intern(point_data.get("addressDetails", {}).get("street"))
         self.building_number: str | None = point_data.get("addressDetails", {}).get("buildingNumber")
 
         self.payment_type: List[PaymentType] | None = (
@@ -693,6 +1150,58 @@ class Point:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    @classmethod
+    def from_dict(cls, point_data: dict, logger: logging.Logger):
+        """`Classmethod` to initialize point from :class:`dict` produced by `to_dict`.
+        Should be used when retrieving points from cache.
+
+        :param point_data: :class:`dict` containing point data
+        :type point_data: dict
+        :param logger: :class:`logging.Logger` parent instance
+        :type logger: logging.Logger
+        :return: point object from provided data
+        :rtype: Point
+        """
+
+        return cls(point_data=point_data, logger=logger)
+
+    def to_dict(self) -> dict:
+        """Returns point data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing point data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "name": self.name,
+                "location": _drop_none({"latitude": self.latitude, "longitude": self.longitude}),
+                "locationDescription": self.description,
+                "openingHours": self.opening_hours,
+                "addressDetails": _drop_none(
+                    {
+                        "postCode": self.post_code,
+                        "city": self.city,
+                        "province": self.province,
+                        "street": self.street,
+                        "buildingNumber": self.building_number,
+                    }
+                ),
+                "paymentType": [pt.name for pt in self.payment_type] if self.payment_type is not None else None,
+                "virtual": self.virtual,
+                "pointType": _name(self.point_type),
+                "type": [data.name for data in self.type] if self.type is not None else None,
+                "location247": self.location_round_the_clock,
+                "doubled": self.doubled,
+                "imageUrl": self.image_url,
+                "easyAccessZone": self.easy_access_zone,
+                "airSensor": self.air_sensor,
+                "airSensorData": self.air_sensor_data.to_dict() if self.air_sensor_data is not None else None,
+                "remoteSend": self.remote_send,
+                "remoteReturn": self.remote_return,
+            }
+        )
+
     def __str__(self) -> str:
         return self.name or ""
 
@@ -749,6 +1258,65 @@ class DropOffPoint(Point):
         super().__init__(point_data, logger)
 
 
+class PointRegistry:
+    """Flyweight registry of :class:`Point` objects. Points with the same class, name and content are built once
+    and shared between all parcels referencing them, changed content results in a new point being built.
+    Points are held weakly, so the registry never outlives parcels that use them.
+    Every :class:`inpost.api.Inpost` instance owns its own registry, so points are never shared between clients.
+
+    .. warning:: shared points log through the logger of the parcel that created them first
+    """
+
+    def __init__(self):
+        """Constructor method"""
+
+        self._points: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # content digest instead of source data, so caller mutating its dict cannot make stale point look current
+        self._digests: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self):
+        return len(self._points)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(points={len(self)}, hits={self.hits}, misses={self.misses})"
+
+    def get(self, point_class: Type[Point], point_data: dict, logger: logging.Logger) -> Point:
+        """Returns shared point for provided data, builds it if there is no point with matching content yet.
+        Points are looked up by name, content is compared by digest of provided data.
+
+        :param point_class: :class:`Point` subclass to be built
+        :type point_class: Type[Point]
+        :param point_data: :class:`dict` containing point data
+        :type point_data: dict
+        :param logger: :class:`logging.Logger` parent instance used when point has to be built
+        :type logger: logging.Logger
+        :return: shared point object
+        :rtype: Point
+        """
+
+        key, digest = (point_class, point_data.get("name")), _digest(point_data)
+        point = self._points.get(key)
+        if point is not None and self._digests.get(point) == digest:
+            self.hits += 1
+            return point
+
+        self.misses += 1
+        point = point_class(point_data=point_data, logger=logger)
+        self._points[key] = point
+        self._digests[point] = digest
+        return point
+
+    def clear(self) -> None:
+        """Drops all registered points and resets statistics"""
+
+        self._points.clear()
+        self._digests.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class DeliveryPoint:
     """Object representation of :class:`BaseParcel` and it's subclasses delivery point
 
@@ -783,6 +1351,29 @@ class DeliveryPoint:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    def to_dict(self) -> dict:
+        """Returns delivery point data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing delivery point data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "name": self.name,
+                "companyName": self.company_name,
+                "address": _drop_none(
+                    {
+                        "postCode": self.post_code,
+                        "city": self.city,
+                        "street": self.street,
+                        "buildingNumber": self.building_number,
+                        "flatNumber": self.flat_numer,
+                    }
+                ),
+            }
+        )
+
 
 class Payment:
     """Object representation of :class:`BaseParcel` and it's subclasses payment
@@ -816,6 +1407,24 @@ class Payment:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    def to_dict(self) -> dict:
+        """Returns payment data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing payment data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "paid": self.paid,
+                "totalPrice": self.total_price,
+                "insurancePrice": self.insurance_price,
+                "endOfWeekCollectionPrice": self.end_of_week_collection_price,
+                "shipmentDiscounted": self.shipment_discounted,
+                "transactionStatus": self.transaction_status,
+            }
+        )
+
 
 class MultiCompartment:
     """Object representation of :class:`Parcel` `multicompartment`
@@ -846,6 +1455,22 @@ class MultiCompartment:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    def to_dict(self) -> dict:
+        """Returns multicompartment data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing multicompartment data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "uuid": self.uuid,
+                "shipmentNumbers": self.shipment_numbers,
+                "presentation": self.presentation,
+                "collected": self.collected,
+            }
+        )
+
 
 class Operations:
     """Object representation of :class:`Parcel` `operations`
@@ -889,6 +1514,32 @@ class Operations:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    def to_dict(self) -> dict:
+        """Returns operations data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing operations data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "manualArchive": self.manual_archive,
+                "autoArchivableSince": _isoformat(self.auto_archivable_since),
+                "delete": self.delete,
+                "payToSend": self.pay_to_send,
+                "collect": self.collect,
+                "expandAvizo": self.expand_avizo,
+                "highlight": self.highlight,
+                "refreshUntil": _isoformat(self.refresh_until),
+                "requestEasyAccessZone": self.request_easy_access_zone,
+                "voicebot": self.is_voicebot,
+                "canShareToObserve": self.can_share_to_observe,
+                "canShareOpenCode": self.can_share_open_code,
+                "canShareParcel": self.can_share_parcel,
+                "send": self.send,
+            }
+        )
+
 
 class EventLog:
     """Object representation of :class:`Parcel` single eventlog
@@ -909,7 +1560,7 @@ class EventLog:
         :raises UnknownStatusError: Unknown status in EventLog
         """
 
-        self.type: str = eventlog_data.get("type")
+        self.type: str = _intern(eventlog_data.get("type"))
         self.date: arrow = get(eventlog_data.get("date"))
         self.details: dict | None = eventlog_data.get("details")
         self._log: logging.Logger = logger.getChild(self.__class__.__name__)
@@ -933,6 +1584,22 @@ class EventLog:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    def to_dict(self) -> dict:
+        """Returns eventlog data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing eventlog data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "type": self.type,
+                "name": _name(self.name),
+                "date": _isoformat(self.date),
+                "details": self.details,
+            }
+        )
+
 
 class SharedTo:
     """Object representation of :class:`Parcel` single shared to
@@ -963,6 +1630,21 @@ class SharedTo:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    def to_dict(self) -> dict:
+        """Returns shared to data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing shared to data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "uuid": self.uuid,
+                "name": self.name,
+                "phoneNumber": self.phone_number,
+            }
+        )
+
 
 class QRCode:
     """Object representation of :class:`Parcel` QRCode
@@ -991,28 +1673,75 @@ class QRCode:
         fields = tuple(f"{k}={v}" for k, v in self.__dict__.items() if k != "_log")
         return self.__class__.__name__ + str(tuple(sorted(fields))).replace("'", "")
 
+    @property
+    def payload(self) -> str:
+        """Returns a raw data encoded in :class:`QRCode`
+
+        :return: QR Code data
+        :rtype: str
+        """
+
+        return self._qr_code
+
     @property
     def qr_image(self) -> BytesIO:
         """Returns a generated QR image for :class:`QRCode`
 
+        Images are rendered once per payload and served from :data:`inpost.static.qr.qr_cache` afterwards.
+
         :return: QR Code image
         :rtype: BytesIO"""
 
         self._log.debug("generating qr image")
-        qr = qrcode.QRCode(
-            version=3, error_correction=qrcode.constants.ERROR_CORRECT_H, box_size=20, border=4, mask_pattern=5
-        )
-
-        qr.add_data(self._qr_code)
-        qr.make(fit=False)
-        img1 = qr.make_image(fill_color="black", back_color="white")
-        bio = BytesIO()
-        bio.name = "qr.png"
-        img1.save(bio, "PNG")
-        bio.seek(0)
+        bio = cached_png(self._qr_code)
         self._log.debug("generated qr image")
         return bio
 
+    @property
+    def qr_matrix(self) -> List[List[bool]]:
+        """Returns modules of :class:`QRCode` (quiet zone included), same code as in :attr:`qr_image`
+
+        :return: square matrix, True for dark modules
+        :rtype: List[List[bool]]
+        """
+
+        return render_matrix(self._qr_code)
+
+    @property
+    def qr_bits(self) -> bytes:
+        """Returns modules of :class:`QRCode` packed eight per byte, each row starting at new byte
+
+        :return: packed QR matrix, 1 bits are dark modules
+        :rtype: bytes
+        """
+
+        return pack_matrix(self.qr_matrix)
+
+    def qr_svg(self, module_size: int = 4) -> str:
+        """Returns :class:`QRCode` as SVG document, no imaging library is needed
+
+        :param module_size: size of single module in pixels
+        :type module_size: int
+        :return: SVG document
+        :rtype: str
+        """
+
+        return matrix_to_svg(self.qr_matrix, module_size=module_size)
+
+    def qr_png(self, module_size: int = 4) -> BytesIO:
+        """Returns :class:`QRCode` as compact 1-bit PNG image, no imaging library is needed
+
+        :param module_size: size of single module in pixels
+        :type module_size: int
+        :return: QR Code image
+        :rtype: BytesIO
+        """
+
+        self._log.debug("generating compact qr image")
+        bio = cached_compact_png(self._qr_code, module_size=module_size)
+        self._log.debug("generated compact qr image")
+        return bio
+
 
 class CompartmentLocation:
     """Object representation of :class:`CompartmentProperties` compartment location
@@ -1087,6 +1816,16 @@ class CompartmentProperties:
         self._log.debug("getting session uuid")
         return self._session_uuid
 
+    @property
+    def session_expiration_time(self) -> int | None:
+        """Returns how long session stays valid after compartment properties are collected
+
+        :return: session lifetime in milliseconds
+        :rtype: int | None"""
+
+        self._log.debug("getting session expiration time")
+        return self._session_expiration_time
+
     @property
     def location(self):
         """Returns a compartment location for :class:`CompartmentProperties`
@@ -1161,3 +1900,24 @@ class AirSensorData:
 
         self._log: logging.Logger = logger.getChild(self.__class__.__name__)
         self._log.debug("created")
+
+    def to_dict(self) -> dict:
+        """Returns air sensor data in the same shape as it is received from inpost api
+
+        :return: :class:`dict` containing air sensor data
+        :rtype: dict
+        """
+
+        return _drop_none(
+            {
+                "updatedUntil": self.updated_until,
+                "airQuality": self.air_quality,
+                "temperature": self.temperature,
+                "humidity": self.humidity,
+                "pressure": self.pressure,
+                "pollutants": {
+                    "pm25": _drop_none({"value": self.pm25_value, "percent": self.pm25_percent}),
+                    "pm10": _drop_none({"value": self.pm10_value, "percent": self.pm10_percent}),
+                },
+            }
+        )
@@ -0,0 +1,675 @@
+import math
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Executor
+from functools import partial
+from io import BytesIO
+from typing import AsyncIterator, Callable, Hashable, Iterable, List, Sequence, Tuple
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+ERROR_CORRECT_H = 2  # same as `qrcode.constants.ERROR_CORRECT_H`, qrcode itself is imported on first render
+
+
+def render_png(
+    payload: str,
+    version: int = 3,
+    error_correction: int = ERROR_CORRECT_H,
+    box_size: int = 20,
+    border: int = 4,
+    mask_pattern: int = 5,
+) -> bytes:
+    """Renders QR code to PNG image using qrcode and Pillow, without Pillow installed (it is an optional
+    `pillow` extra) the same matrix is encoded with :func:`matrix_to_png` instead
+
+    :param payload: data to be encoded in QR code
+    :type payload: str
+    :param version: QR code version (size)
+    :type version: int
+    :param error_correction: error correction level (one of `qrcode.constants.ERROR_CORRECT_*`)
+    :type error_correction: int
+    :param box_size: size of single module in pixels
+    :type box_size: int
+    :param border: width of quiet zone in modules
+    :type border: int
+    :param mask_pattern: QR code mask pattern
+    :type mask_pattern: int
+    :return: PNG image
+    :rtype: bytes
+    """
+
+    try:
+        import PIL  # noqa: F401
+        import qrcode
+    except ImportError:  # pragma: no cover
+        matrix = render_matrix(
+            payload, version, error_correction=error_correction, border=border, mask_pattern=mask_pattern
+        )
+        return matrix_to_png(matrix, module_size=box_size)
+
+    qr = qrcode.QRCode(
+        version=version, error_correction=error_correction, box_size=box_size, border=border, mask_pattern=mask_pattern
+    )
+    qr.add_data(payload)
+    qr.make(fit=False)
+    bio = BytesIO()
+    qr.make_image(fill_color="black", back_color="white").save(bio, "PNG")
+    return bio.getvalue()
+
+
+# error correction codewords per block and number of blocks by level (L, M, Q, H) and version, index 0 is unused
+_ECC_CODEWORDS_PER_BLOCK = (
+    (0, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28,
+     28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (0, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26,
+     26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28),
+    (0, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30,
+     28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (0, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28,
+     30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+)  # fmt: skip
+_ECC_BLOCKS = (
+    (0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8,
+     8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25),
+    (0, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16,
+     17, 17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47, 49),
+    (0, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20,
+     23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68),
+    (0, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25,
+     25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81),
+)  # fmt: skip
+# `qrcode.constants.ERROR_CORRECT_*` values are format bits of the level, rows of tables above are ordered L, M, Q, H
+_ECC_ROWS = {1: 0, 0: 1, 3: 2, 2: 3}
+_MASKS: Tuple[Callable[[int, int], bool], ...] = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+
+def _gf_tables() -> Tuple[List[int], List[int]]:
+    # powers of generator 2 in GF(2^8) modulo x^8 + x^4 + x^3 + x^2 + 1 and their logarithms
+    exp, log, value = [0] * 510, [0] * 256, 1
+    for i in range(255):
+        exp[i] = exp[i + 255] = value
+        log[value] = i
+        value <<= 1
+        if value & 0x100:
+            value ^= 0x11D
+    return exp, log
+
+
+_GF_EXP, _GF_LOG = _gf_tables()
+
+
+def _gf_multiply(x: int, y: int) -> int:
+    return _GF_EXP[_GF_LOG[x] + _GF_LOG[y]] if x and y else 0
+
+
+def _rs_divisor(degree: int) -> List[int]:
+    divisor, root = [0] * (degree - 1) + [1], 1
+    for _ in range(degree):
+        for j in range(degree):
+            divisor[j] = _gf_multiply(divisor[j], root)
+            if j + 1 < degree:
+                divisor[j] ^= divisor[j + 1]
+        root = _gf_multiply(root, 0x02)
+    return divisor
+
+
+def _rs_remainder(data: Sequence[int], divisor: List[int]) -> List[int]:
+    remainder = [0] * len(divisor)
+    for byte in data:
+        factor = byte ^ remainder.pop(0)
+        remainder.append(0)
+        for i, coefficient in enumerate(divisor):
+            remainder[i] ^= _gf_multiply(coefficient, factor)
+    return remainder
+
+
+def _raw_modules(version: int) -> int:
+    # modules left for data and error correction once function patterns are drawn
+    modules = (16 * version + 128) * version + 64
+    if version >= 2:
+        alignments = version // 7 + 2
+        modules -= (25 * alignments - 10) * alignments - 55
+        if version >= 7:
+            modules -= 36
+    return modules
+
+
+def _alignment_positions(version: int) -> List[int]:
+    if version == 1:
+        return []
+
+    count, size = version // 7 + 2, version * 4 + 17
+    step = 26 if version == 32 else (version * 4 + count * 2 + 1) // (count * 2 - 2) * 2
+    return [6] + [size - 7 - i * step for i in reversed(range(count - 1))]
+
+
+def _codewords(payload: bytes, version: int, level: int) -> List[int]:
+    ecc_length, blocks = _ECC_CODEWORDS_PER_BLOCK[level][version], _ECC_BLOCKS[level][version]
+    raw = _raw_modules(version) // 8
+    capacity = raw - ecc_length * blocks
+
+    # byte mode indicator, character count and data, then terminator and alternating pad bytes
+    count_bits = 8 if version < 10 else 16
+    bits = f"0100{len(payload):0{count_bits}b}" + "".join(f"{byte:08b}" for byte in payload)
+    if len(payload) >= 1 << count_bits or len(bits) > capacity * 8:
+        raise ValueError(f"Payload of {len(payload)} bytes does not fit in QR code version {version}")
+
+    bits += "0" * min(4, capacity * 8 - len(bits))
+    bits += "0" * (-len(bits) % 8)
+    data = [int(bits[i : i + 8], 2) for i in range(0, len(bits), 8)]  # noqa: E203
+    data += [0xEC, 0x11] * ((capacity - len(data)) // 2) + [0xEC] * ((capacity - len(data)) % 2)
+
+    # blocks are split into short and one byte longer ones, their codewords are interleaved
+    short_blocks, short_length = blocks - raw % blocks, raw // blocks
+    divisor, split, start = _rs_divisor(ecc_length), [], 0
+    for i in range(blocks):
+        block = data[start : start + short_length - ecc_length + (0 if i < short_blocks else 1)]  # noqa: E203
+        start += len(block)
+        split.append((block, _rs_remainder(block, divisor)))
+
+    interleaved = [block[i] for i in range(short_length - ecc_length + 1) for block, _ in split if i < len(block)]
+    return interleaved + [ecc[i] for i in range(ecc_length) for _, ecc in split]
+
+
+def _format_bits(level_bits: int, mask_pattern: int) -> int:
+    data = level_bits << 3 | mask_pattern
+    remainder = data
+    for _ in range(10):
+        remainder = (remainder << 1) ^ ((remainder >> 9) * 0x537)
+    return (data << 10 | remainder) ^ 0x5412
+
+
+def _version_bits(version: int) -> int:
+    remainder = version
+    for _ in range(12):
+        remainder = (remainder << 1) ^ ((remainder >> 11) * 0x1F25)
+    return version << 12 | remainder
+
+
+def _put(modules: List[List[bool | None]], x: int, y: int, dark: bool) -> None:
+    if 0 <= x < len(modules) and 0 <= y < len(modules):
+        modules[y][x] = dark
+
+
+def _put_square(modules: List[List[bool | None]], cx: int, cy: int, radius: int, light: Tuple[int, ...]) -> None:
+    # finder and alignment patterns are concentric squares, `light` lists distances of light rings from center
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            _put(modules, cx + dx, cy + dy, max(abs(dx), abs(dy)) not in light)
+
+
+def _put_format(modules: List[List[bool | None]], level_bits: int, mask_pattern: int) -> None:
+    size, bits = len(modules), _format_bits(level_bits, mask_pattern)
+    dark = [(bits >> i) & 1 == 1 for i in range(15)]
+    # first copy around top left finder, second one split between the other two
+    for i in range(6):
+        _put(modules, 8, i, dark[i])
+    _put(modules, 8, 7, dark[6])
+    _put(modules, 8, 8, dark[7])
+    _put(modules, 7, 8, dark[8])
+    for i in range(9, 15):
+        _put(modules, 14 - i, 8, dark[i])
+    for i in range(8):
+        _put(modules, size - 1 - i, 8, dark[i])
+    for i in range(8, 15):
+        _put(modules, 8, size - 15 + i, dark[i])
+    _put(modules, 8, size - 8, True)
+
+
+def _put_version(modules: List[List[bool | None]], version: int) -> None:
+    size, bits = len(modules), _version_bits(version)
+    for i in range(18):
+        dark = (bits >> i) & 1 == 1
+        _put(modules, size - 11 + i % 3, i // 3, dark)
+        _put(modules, i // 3, size - 11 + i % 3, dark)
+
+
+def _function_patterns(version: int, level_bits: int, mask_pattern: int) -> List[List[bool | None]]:
+    # None marks modules left for codewords
+    size = version * 4 + 17
+    modules: List[List[bool | None]] = [[None] * size for _ in range(size)]
+
+    for i in range(size):
+        _put(modules, 6, i, i % 2 == 0)
+        _put(modules, i, 6, i % 2 == 0)
+
+    for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+        _put_square(modules, cx, cy, 4, (2, 4))
+
+    positions = _alignment_positions(version)
+    corners = ((0, 0), (0, len(positions) - 1), (len(positions) - 1, 0))
+    for i, cx in enumerate(positions):
+        for j, cy in enumerate(positions):
+            if (i, j) not in corners:
+                _put_square(modules, cx, cy, 2, (1,))
+
+    _put_format(modules, level_bits, mask_pattern)
+    if version >= 7:
+        _put_version(modules, version)
+
+    return modules
+
+
+def render_matrix(
+    payload: str,
+    version: int = 3,
+    error_correction: int = ERROR_CORRECT_H,
+    border: int = 4,
+    mask_pattern: int = 5,
+) -> List[List[bool]]:
+    """Renders QR code to matrix of modules. Payload is encoded in byte mode without qrcode or imaging library,
+    so neither of them gets imported.
+
+    :param payload: data to be encoded in QR code
+    :type payload: str
+    :param version: QR code version (size)
+    :type version: int
+    :param error_correction: error correction level (one of `qrcode.constants.ERROR_CORRECT_*`)
+    :type error_correction: int
+    :param border: width of quiet zone in modules
+    :type border: int
+    :param mask_pattern: QR code mask pattern
+    :type mask_pattern: int
+    :return: square matrix (quiet zone included), True for dark modules
+    :rtype: List[List[bool]]
+    :raises ValueError: payload does not fit in QR code of given version
+    """
+
+    level = _ECC_ROWS[error_correction]
+    modules = _function_patterns(version, error_correction, mask_pattern)
+    size, mask = len(modules), _MASKS[mask_pattern]
+    data = _codewords(payload.encode("utf-8"), version, level)
+
+    # codewords fill two module wide columns in zigzag from bottom right corner, vertical timing column is skipped
+    index, total = 0, len(data) * 8
+    for right in range(size - 1, 0, -2):
+        if right <= 6:
+            right -= 1
+        upward = (right + 1) & 2 == 0
+        for vertical in range(size):
+            y = size - 1 - vertical if upward else vertical
+            for x in (right, right - 1):
+                if modules[y][x] is None:
+                    dark = index < total and (data[index >> 3] >> (7 - (index & 7))) & 1 == 1
+                    modules[y][x] = dark != mask(x, y)
+                    index += 1
+
+    quiet = [[False] * (size + 2 * border) for _ in range(border)]
+    return (
+        quiet
+        + [[False] * border + [bool(module) for module in row] + [False] * border for row in modules]
+        + [list(row) for row in quiet]
+    )
+
+
+def _pack_row(row: List[bool], dark: str, light: str, scale: int = 1) -> bytes:
+    bits = "".join((dark if module else light) * scale for module in row)
+    bits += light * (-len(bits) % 8)
+    return int(bits, 2).to_bytes(len(bits) // 8, "big")
+
+
+def pack_matrix(matrix: List[List[bool]]) -> bytes:
+    """Packs QR matrix into bit array, eight modules per byte, most significant bit first.
+    Every row starts at new byte, so row `y` occupies bytes `y * ceil(size / 8)` onwards.
+
+    :param matrix: QR matrix (see :func:`render_matrix`)
+    :type matrix: List[List[bool]]
+    :return: packed matrix, 1 bits are dark modules
+    :rtype: bytes
+    """
+
+    return b"".join(_pack_row(row, "1", "0") for row in matrix)
+
+
+def matrix_to_svg(matrix: List[List[bool]], module_size: int = 4) -> str:
+    """Renders QR matrix to SVG, horizontal runs of dark modules are merged into single path segments
+
+    :param matrix: QR matrix (see :func:`render_matrix`)
+    :type matrix: List[List[bool]]
+    :param module_size: size of single module in pixels
+    :type module_size: int
+    :return: SVG document
+    :rtype: str
+    """
+
+    size = len(matrix)
+    segments = []
+    for y, row in enumerate(matrix):
+        x = 0
+        while x < size:
+            if not row[x]:
+                x += 1
+                continue
+
+            start = x
+            while x < size and row[x]:
+                x += 1
+            segments.append(f"M{start},{y}h{x - start}v1h-{x - start}z")
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}" width="{size * module_size}" '
+        f'height="{size * module_size}" shape-rendering="crispEdges">'
+        f'<rect width="{size}" height="{size}" fill="#fff"/><path d="{"".join(segments)}" fill="#000"/></svg>'
+    )
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def matrix_to_png(matrix: List[List[bool]], module_size: int = 4) -> bytes:
+    """Encodes QR matrix as 1-bit grayscale PNG using only :mod:`zlib`, no imaging library is needed
+
+    :param matrix: QR matrix (see :func:`render_matrix`)
+    :type matrix: List[List[bool]]
+    :param module_size: size of single module in pixels
+    :type module_size: int
+    :return: PNG image
+    :rtype: bytes
+    """
+
+    side = len(matrix) * module_size
+    scanlines = b"".join((b"\x00" + _pack_row(row, "0", "1", module_size)) * module_size for row in matrix)
+    return (
+        _PNG_SIGNATURE
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", side, side, 1, 0, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(scanlines, 9))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+class QRImageCache:
+    """Thread-safe LRU cache of rendered QR images, bounded by total size of cached images in bytes
+
+    :param max_bytes: maximum total size of cached images, defaults to 8 MiB
+    :type max_bytes: int
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        """Constructor method
+
+        :param max_bytes: maximum total size of cached images, defaults to 8 MiB
+        :type max_bytes: int
+        """
+
+        self.max_bytes: int = max_bytes
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._images: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._images)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(images={len(self)}, size={self.size}, max_bytes={self.max_bytes}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+    @property
+    def stats(self) -> dict:
+        """Returns cache statistics
+
+        :return: :class:`dict` with number of images, their total size, hits, misses and evictions
+        :rtype: dict
+        """
+
+        return {
+            "images": len(self),
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def get(self, key: Hashable, render: Callable[[], bytes]) -> bytes:
+        """Returns cached image, renders and caches it on miss
+
+        :param key: cache key, should contain QR payload and all render options
+        :type key: Hashable
+        :param render: callable rendering image on cache miss
+        :type render: Callable[[], bytes]
+        :return: rendered image
+        :rtype: bytes
+        """
+
+        image = self.peek(key)
+        if image is None:
+            image = render()
+            self.put(key, image)
+
+        return image
+
+    def peek(self, key: Hashable) -> bytes | None:
+        """Returns cached image without rendering on miss
+
+        :param key: cache key
+        :type key: Hashable
+        :return: cached image or None
+        :rtype: bytes | None
+        """
+
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: Hashable, image: bytes) -> None:
+        """Puts image into cache, evicting least recently used images if needed.
+        Images larger than `max_bytes` are not cached.
+
+        :param key: cache key
+        :type key: Hashable
+        :param image: rendered image
+        :type image: bytes
+        """
+
+        if len(image) > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._images.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+
+            self._images[key] = image
+            self.size += len(image)
+            while self.size > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drops all cached images and resets statistics"""
+
+        with self._lock:
+            self._images.clear()
+            self.size = self.hits = self.misses = self.evictions = 0
+
+
+qr_cache = QRImageCache()
+
+# smaller batches are rendered in threads, starting worker processes would cost more than rendering itself
+PROCESS_POOL_MIN_BATCH = 16
+_process_pool: Executor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def _shared_process_pool() -> Executor:
+    # created on first big batch and reused by every later one, workers exit with interpreter
+    global _process_pool
+
+    with _process_pool_lock:
+        if _process_pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            _process_pool = ProcessPoolExecutor()
+
+        return _process_pool
+
+
+def _cache_key(payload: str, compact: bool, module_size: int, options: dict) -> tuple:
+    if compact:
+        return "compact_png", payload, module_size, tuple(sorted(options.items()))
+
+    return "png", payload, tuple(sorted(options.items()))
+
+
+def _render(payload: str, compact: bool, module_size: int, options: dict) -> bytes:
+    if compact:
+        return matrix_to_png(render_matrix(payload, **options), module_size)
+
+    return render_png(payload, **options)
+
+
+def cached_png(payload: str, cache: QRImageCache | None = None, **options) -> BytesIO:
+    """Returns PNG image of QR code, rendered once per payload and options and then served from cache
+
+    :param payload: data to be encoded in QR code
+    :type payload: str
+    :param cache: cache to use, defaults to module-wide `qr_cache`
+    :type cache: QRImageCache | None
+    :param options: render options passed to :func:`render_png`
+    :return: fresh stream over PNG image
+    :rtype: BytesIO
+    """
+
+    cache = qr_cache if cache is None else cache
+    bio = BytesIO(cache.get(_cache_key(payload, False, 0, options), lambda: render_png(payload, **options)))
+    bio.name = "qr.png"
+    return bio
+
+
+def cached_compact_png(payload: str, module_size: int = 4, cache: QRImageCache | None = None, **options) -> BytesIO:
+    """Returns 1-bit PNG image of QR code rendered by :func:`matrix_to_png`, served from cache after first render
+
+    :param payload: data to be encoded in QR code
+    :type payload: str
+    :param module_size: size of single module in pixels
+    :type module_size: int
+    :param cache: cache to use, defaults to module-wide `qr_cache`
+    :type cache: QRImageCache | None
+    :param options: QR options passed to :func:`render_matrix`
+    :return: fresh stream over PNG image
+    :rtype: BytesIO
+    """
+
+    cache = qr_cache if cache is None else cache
+    key = _cache_key(payload, True, module_size, options)
+    bio = BytesIO(cache.get(key, lambda: matrix_to_png(render_matrix(payload, **options), module_size)))
+    bio.name = "qr.png"
+    return bio
+
+
+async def render_many(
+    payloads: Iterable,
+    executor: Executor | None = None,
+    compact: bool = False,
+    module_size: int = 4,
+    cache: QRImageCache | None = None,
+    **options,
+) -> AsyncIterator[Tuple[str, bytes]]:
+    """Renders many QR codes concurrently without blocking event loop, yielding images as soon as they are ready.
+    Cached images are yielded first, the rest is rendered in `executor` and put into cache.
+
+    :param payloads: QR payloads or objects exposing `payload` (e.g. :class:`QRCode`), duplicates are rendered once
+    :type payloads: Iterable
+    :param executor: executor to render in, defaults to event loop's thread pool for batches smaller than
+        :data:`PROCESS_POOL_MIN_BATCH` and to :class:`ProcessPoolExecutor` shared by all calls for bigger ones
+    :type executor: Executor | None
+    :param compact: render 1-bit PNG with :func:`matrix_to_png` instead of Pillow
+    :type compact: bool
+    :param module_size: size of single module in pixels, used when `compact` is set
+    :type module_size: int
+    :param cache: cache to use, defaults to module-wide `qr_cache`
+    :type cache: QRImageCache | None
+    :param options: QR options passed to :func:`render_png` or :func:`render_matrix`
+    :return: async iterator of payload and PNG image, in completion order
+    :rtype: AsyncIterator[Tuple[str, bytes]]
+    """
+
+    import asyncio
+
+    cache = qr_cache if cache is None else cache
+    pending = []
+    for payload in dict.fromkeys(item if isinstance(item, str) else item.payload for item in payloads):
+        key = _cache_key(payload, compact, module_size, options)
+        image = cache.peek(key)
+        if image is not None:
+            yield payload, image
+        else:
+            pending.append((payload, key))
+
+    if not pending:
+        return
+
+    if executor is None and len(pending) >= PROCESS_POOL_MIN_BATCH:
+        executor = _shared_process_pool()
+
+    loop = asyncio.get_running_loop()
+
+    async def render(payload: str, key: Hashable) -> Tuple[str, bytes]:
+        image = await loop.run_in_executor(executor, partial(_render, payload, compact, module_size, options))
+        cache.put(key, image)
+        return payload, image
+
+    tasks = [asyncio.create_task(render(payload, key)) for payload, key in pending]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def tile_sheet(images: Sequence[bytes], columns: int = 4, padding: int = 0) -> BytesIO:
+    """Tiles QR images into single sheet image (e.g. for printing many labels at once), requires Pillow.
+    Every image is placed in cell as big as the largest image, row by row.
+
+    :param images: PNG images
+    :type images: Sequence[bytes]
+    :param columns: number of images per row
+    :type columns: int
+    :param padding: white space between cells in pixels
+    :type padding: int
+    :return: PNG sheet image
+    :rtype: BytesIO
+    :raises ValueError: no images provided
+    """
+
+    from PIL import Image
+
+    if not images:
+        raise ValueError("No images to tile")
+
+    tiles = [Image.open(BytesIO(image)) for image in images]
+    columns = min(columns, len(tiles))
+    width = max(tile.width for tile in tiles) + padding
+    height = max(tile.height for tile in tiles) + padding
+    sheet = Image.new("1", (columns * width - padding, math.ceil(len(tiles) / columns) * height - padding), 1)
+    for index, tile in enumerate(tiles):
+        sheet.paste(tile.convert("1"), ((index % columns) * width, (index // columns) * height))
+
+    bio = BytesIO()
+    sheet.save(bio, "PNG")
+    bio.name = "sheet.png"
+    bio.seek(0)
+    return bio
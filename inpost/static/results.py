@@ -0,0 +1,96 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from inpost.static.statuses import CompartmentActualStatus
+
+
+class StepTimings:
+    """Wall-clock duration of every step of multi-request flow (e.g. collecting parcel), in execution order"""
+
+    def __init__(self):
+        """Constructor method"""
+
+        self.steps: Dict[str, float] = {}
+
+    def __repr__(self):
+        steps = ", ".join(f"{step}={duration * 1000:.1f}ms" for step, duration in self.steps.items())
+        return f"{self.__class__.__name__}({steps}, total={self.total * 1000:.1f}ms)"
+
+    @contextmanager
+    def measure(self, step: str) -> Iterator[None]:
+        """Measures duration of code block and records it as step, time of repeated step is summed up
+
+        :param step: step name (e.g. `open`)
+        :type step: str
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[step] = self.steps.get(step, 0.0) + time.perf_counter() - start
+
+    @property
+    def total(self) -> float:
+        """Returns total duration of all steps
+
+        :return: duration in seconds
+        :rtype: float
+        """
+
+        return sum(self.steps.values())
+
+
+class CollectResult:
+    """Outcome of compartment flow of single parcel
+
+    :param parcel: parcel the flow was run for (`Parcel` or `SentParcel`)
+    :type parcel: BaseParcel
+    :param timings: duration of every step
+    :type timings: StepTimings
+    :param error: exception which stopped the flow, None if it succeeded
+    :type error: BaseException | None
+    """
+
+    def __init__(self, parcel, timings: StepTimings, error: BaseException | None = None):
+        """Constructor method
+
+        :param parcel: parcel the flow was run for (`Parcel` or `SentParcel`)
+        :type parcel: BaseParcel
+        :param timings: duration of every step
+        :type timings: StepTimings
+        :param error: exception which stopped the flow, None if it succeeded
+        :type error: BaseException | None
+        """
+
+        self.parcel = parcel
+        self.timings: StepTimings = timings
+        self.error: BaseException | None = error
+
+    def __repr__(self):
+        shipment_number = self.parcel.shipment_number if self.parcel is not None else None
+        return (
+            f"{self.__class__.__name__}(shipment_number={shipment_number}, status={self.status}, "
+            f"error={self.error!r}, timings={self.timings})"
+        )
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether flow finished without error
+
+        :return: True if flow succeeded
+        :rtype: bool
+        """
+
+        return self.error is None
+
+    @property
+    def status(self) -> CompartmentActualStatus | None:
+        """Returns last known compartment status
+
+        :return: compartment status or None if it is unknown
+        :rtype: CompartmentActualStatus | None
+        """
+
+        return self.parcel.compartment_status if self.parcel is not None else None
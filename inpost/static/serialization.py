@@ -0,0 +1,286 @@
+import logging
+import struct
+import sys
+from datetime import datetime
+from enum import Enum
+from typing import Any, List
+
+from inpost.static import parcels, statuses
+from inpost.static.exceptions import SerializationError
+from inpost.static.parcels import BaseParcel, PointRegistry
+
+# Binary layout (all integers are unsigned LEB128 varints unless stated otherwise):
+#   MAGIC | VERSION | strings count | strings (length + utf-8 bytes) | root value
+# Every string (keys, statuses, point names, ...) is stored once in the strings table and referenced by index,
+# so repeated values across many parcels cost a couple of bytes each and are shared after decoding.
+# Parcels and their sub-objects are stored as class name, logger name and attributes, so decoding restores them
+# without running constructors (and parsing dates) again. Object referenced more than once (e.g. point shared
+# through :class:`PointRegistry`) is stored once and referenced by index of its first occurrence.
+MAGIC = b"IPB"
+VERSION = 2
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STR = 0x05
+_LIST = 0x06
+_DICT = 0x07
+_OBJECT = 0x08
+_REF = 0x09
+_ENUM = 0x0A
+_DATE = 0x0B
+
+_DOUBLE = struct.Struct("<d")
+# attributes rebuilt on decoding instead of being stored
+_SKIPPED = ("_log", "_point_registry")
+
+
+def _logger_suffix(obj) -> str:
+    # objects log through child of their parent's logger named after class, parcels also append shipment number
+    name, class_name = obj._log.name, obj.__class__.__name__
+    start = name.rfind(f".{class_name}")
+    return name[start + 1 :] if start != -1 else class_name  # noqa: E203
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+class _Encoder:
+    def __init__(self):
+        self.strings: dict = {}
+        self.objects: dict = {}
+        self.body = bytearray()
+        arrow = sys.modules.get("arrow")
+        # no date can be serialized before arrow got imported by parsing one
+        self.date_type = arrow.Arrow if arrow is not None else None
+
+    def string(self, value: str) -> None:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        _write_varint(self.body, index)
+
+    def value(self, value) -> None:
+        body = self.body
+        if value is None:
+            body.append(_NONE)
+        elif value is True:
+            body.append(_TRUE)
+        elif value is False:
+            body.append(_FALSE)
+        elif isinstance(value, int):
+            body.append(_INT)
+            _write_varint(body, value << 1 if value >= 0 else (~value << 1) | 1)
+        elif isinstance(value, float):
+            body.append(_FLOAT)
+            body += _DOUBLE.pack(value)
+        elif isinstance(value, str):
+            body.append(_STR)
+            self.string(value)
+        else:
+            self.compound(value)
+
+    def compound(self, value) -> None:
+        body = self.body
+        if isinstance(value, (list, tuple)):
+            body.append(_LIST)
+            _write_varint(body, len(value))
+            for item in value:
+                self.value(item)
+        elif isinstance(value, dict):
+            body.append(_DICT)
+            _write_varint(body, len(value))
+            for key, item in value.items():
+                self.string(key)
+                self.value(item)
+        elif isinstance(value, Enum) and type(value).__module__ == statuses.__name__:
+            body.append(_ENUM)
+            self.string(type(value).__name__)
+            self.string(value.name)
+        elif self.date_type is not None and isinstance(value, self.date_type):
+            body.append(_DATE)
+            self.string(value.isoformat())
+        elif type(value).__module__ == parcels.__name__ and hasattr(value, "_log"):
+            self.object(value)
+        else:
+            raise TypeError(f"Cannot serialize object of type {type(value).__name__}")
+
+    def object(self, value) -> None:
+        body = self.body
+        index = self.objects.get(id(value))
+        if index is not None:
+            body.append(_REF)
+            _write_varint(body, index)
+            return
+
+        self.objects[id(value)] = len(self.objects)
+        body.append(_OBJECT)
+        self.string(type(value).__name__)
+        self.string(_logger_suffix(value))
+        state = [(key, item) for key, item in value.__dict__.items() if key not in _SKIPPED]
+        _write_varint(body, len(state))
+        for key, item in state:
+            self.string(key)
+            self.value(item)
+
+    def getvalue(self) -> bytes:
+        header = bytearray(MAGIC)
+        header.append(VERSION)
+        _write_varint(header, len(self.strings))
+        for string in self.strings:
+            encoded = string.encode("utf-8")
+            _write_varint(header, len(encoded))
+            header += encoded
+
+        return bytes(header + self.body)
+
+
+class _Decoder:
+    def __init__(self, data: bytes, logger: logging.Logger, point_registry: PointRegistry | None = None):
+        self.data = memoryview(data)
+        self.pos = 0
+        self.logger = logger
+        self.point_registry = point_registry
+        self.objects: list = []
+        self.date_type: Any = None
+
+        if bytes(self.data[:3]) != MAGIC:
+            raise SerializationError("Not an inpost binary payload")
+
+        if self.data[3] != VERSION:
+            raise SerializationError(f"Unsupported binary payload version: {self.data[3]}")
+
+        self.pos = 4
+        self.strings: List[str] = []
+        for _ in range(self.varint()):
+            length = self.varint()
+            self.strings.append(str(self.data[self.pos : self.pos + length], "utf-8"))  # noqa: E203
+            self.pos += length
+
+    def varint(self) -> int:
+        data = self.data
+        result = shift = 0
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def value(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+
+        if tag == _NONE:
+            return None
+        if tag == _FALSE:
+            return False
+        if tag == _TRUE:
+            return True
+        if tag == _INT:
+            value = self.varint()
+            return ~(value >> 1) if value & 1 else value >> 1
+        if tag == _FLOAT:
+            (value,) = _DOUBLE.unpack_from(self.data, self.pos)
+            self.pos += _DOUBLE.size
+            return value
+        if tag == _STR:
+            return self.strings[self.varint()]
+
+        return self.compound(tag)
+
+    def compound(self, tag: int):
+        if tag == _LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == _DICT:
+            return {self.strings[self.varint()]: self.value() for _ in range(self.varint())}
+        if tag == _ENUM:
+            enum_class = self.cls(statuses, self.strings[self.varint()], Enum)
+            return enum_class[self.strings[self.varint()]]
+        if tag == _DATE:
+            return self.date(self.strings[self.varint()])
+        if tag == _OBJECT:
+            return self.object()
+        if tag == _REF:
+            return self.objects[self.varint()]
+
+        raise SerializationError(f"Unknown type tag {tag} at position {self.pos - 1}")
+
+    @staticmethod
+    def cls(module, name: str, base: type = object) -> Any:
+        cls = getattr(module, name, None)
+        if not isinstance(cls, type) or not issubclass(cls, base) or cls.__module__ != module.__name__:
+            raise SerializationError(f"Unknown class {name}")
+
+        return cls
+
+    def date(self, value: str):
+        if self.date_type is None:
+            from arrow import Arrow
+
+            self.date_type = Arrow
+
+        return self.date_type.fromdatetime(datetime.fromisoformat(value))
+
+    def object(self):
+        obj_class = self.cls(parcels, self.strings[self.varint()])
+        obj = obj_class.__new__(obj_class)
+        self.objects.append(obj)
+
+        parent = self.logger
+        self.logger = obj._log = parent.getChild(self.strings[self.varint()])
+        try:
+            obj.__dict__.update((self.strings[self.varint()], self.value()) for _ in range(self.varint()))
+        finally:
+            self.logger = parent
+
+        if isinstance(obj, BaseParcel):
+            obj._point_registry = self.point_registry
+
+        return obj
+
+
+def dumps(obj: BaseParcel | List[BaseParcel] | dict | list) -> bytes:
+    """Serializes parcels (or plain parcel data) into compact binary format.
+    Strings are interned in a single table shared by all serialized parcels, parcels are stored with their parsed
+    state, so :func:`loads` does not parse them again.
+
+    :param obj: parcel, list of parcels or plain data to serialize
+    :type obj: BaseParcel | List[BaseParcel] | dict | list
+    :return: serialized data
+    :rtype: bytes
+    """
+
+    encoder = _Encoder()
+    encoder.value(obj)
+    return encoder.getvalue()
+
+
+def loads(
+    data: bytes, logger: logging.Logger, point_registry: PointRegistry | None = None
+) -> BaseParcel | List[BaseParcel] | dict | list:
+    """Deserializes data produced by :func:`dumps`
+
+    :param data: serialized data
+    :type data: bytes
+    :param logger: :class:`logging.Logger` parent instance for recreated parcels
+    :type logger: logging.Logger
+    :param point_registry: registry used by recreated parcels on update, points shared by serialized parcels
+        are shared after decoding either way
+    :type point_registry: PointRegistry | None
+    :return: deserialized parcel, list of parcels or plain data
+    :rtype: BaseParcel | List[BaseParcel] | dict | list
+    :raises SerializationError: data is not a valid binary payload
+    """
+
+    try:
+        return _Decoder(data, logger, point_registry).value()
+    except (IndexError, KeyError, ValueError, struct.error) as e:
+        raise SerializationError("Truncated or corrupted binary payload") from e
@@ -226,6 +226,17 @@ class CompartmentActualStatus(ParcelBase):
     CLOSED = "Zamknięta"
 
 
+class CollectSessionState(ParcelBase):
+    """:class:`Enum` that holds collect session states"""
+
+    UNKNOWN = "UNKNOWN DATA"
+    NEW = "Not validated yet"
+    VALIDATED = "Validated, compartment not opened yet"
+    OPENED = "Compartment opened"
+    CLOSED = "Compartment closed"
+    TERMINATED = "Terminated"
+
+
 class PaymentType(ParcelBase):
     UNKNOWN = "UNKNOWN DATA"
     NOTSUPPORTED = "Payments are not supported"  # klucz 0
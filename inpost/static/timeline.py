@@ -0,0 +1,362 @@
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from inpost.static.frames import to_epoch_ms
+from inpost.static.parcels import BaseParcel
+from inpost.static.statuses import ParcelStatus
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]  # pure python loops are used instead
+
+STATUS_NAMES: List[str] = list(ParcelStatus.__members__)
+_STATUS_CODES: Dict[str, int] = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+
+def status_code(status: ParcelStatus | str | None) -> int:
+    """Returns compact code of parcel status, unexpected statuses are coded as `UNKNOWN`
+
+    :param status: parcel status or its name
+    :type status: ParcelStatus | str | None
+    :return: status code
+    :rtype: int
+    """
+
+    name = status.name if isinstance(status, ParcelStatus) else status
+    return _STATUS_CODES.get(name, _STATUS_CODES["UNKNOWN"])  # type: ignore[arg-type]
+
+
+def percentile(values: Sequence[int | float], q: float) -> float | None:
+    """Returns q-th percentile of values using linear interpolation between closest ranks
+
+    :param values: values to compute percentile of
+    :type values: Sequence[int | float]
+    :param q: percentile in range 0-100
+    :type q: float
+    :return: percentile or None if there are no values
+    :rtype: float | None
+    :raises ValueError: q out of 0-100 range
+    """
+
+    if not 0 <= q <= 100:
+        raise ValueError(f"Percentile out of range: {q}")
+
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class Timeline:
+    """Compact chronological representation of single parcel status history,
+    parallel arrays of status codes and epoch milliseconds
+
+    :param shipment_number: parcel shipment number
+    :type shipment_number: str | None
+    :param codes: status codes (see :func:`status_code`) in chronological order
+    :type codes: array
+    :param timestamps: epoch milliseconds of statuses
+    :type timestamps: array
+    """
+
+    def __init__(self, shipment_number: str | None, codes: array, timestamps: array):
+        """Constructor method
+
+        :param shipment_number: parcel shipment number
+        :type shipment_number: str | None
+        :param codes: status codes (see :func:`status_code`) in chronological order
+        :type codes: array
+        :param timestamps: epoch milliseconds of statuses
+        :type timestamps: array
+        """
+
+        self.shipment_number: str | None = shipment_number
+        self.codes: array = codes
+        self.timestamps: array = timestamps
+
+    @classmethod
+    def from_event_log(cls, event_log: Iterable[dict], shipment_number: str | None = None) -> "Timeline":
+        """`Classmethod` to build :class:`Timeline` from raw `eventLog` of parcel received from inpost api
+
+        :param event_log: raw parcel event log
+        :type event_log: Iterable[dict]
+        :param shipment_number: parcel shipment number
+        :type shipment_number: str | None
+        :return: parcel timeline
+        :rtype: Timeline
+        """
+
+        events = sorted(
+            (to_epoch_ms(event.get("date")), status_code(event.get("name")))
+            for event in event_log
+            if event.get("type") == "PARCEL_STATUS"
+        )
+        return cls(shipment_number, array("H", (code for _, code in events)), array("q", (ts for ts, _ in events)))
+
+    @classmethod
+    def from_parcel(cls, parcel: BaseParcel) -> "Timeline":
+        """`Classmethod` to build :class:`Timeline` from already parsed parcel
+
+        :param parcel: parsed parcel
+        :type parcel: BaseParcel
+        :return: parcel timeline
+        :rtype: Timeline
+        """
+
+        events = sorted(
+            (to_epoch_ms(event.date), status_code(event.name))
+            for event in parcel.event_log
+            if event.type == "PARCEL_STATUS"
+        )
+        return cls(
+            parcel.shipment_number, array("H", (code for _, code in events)), array("q", (ts for ts, _ in events))
+        )
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __repr__(self):
+        events = ", ".join(f"{STATUS_NAMES[code]}@{ts}" for code, ts in zip(self.codes, self.timestamps))
+        return f"{self.__class__.__name__}(shipment_number={self.shipment_number}, events=[{events}])"
+
+    @property
+    def statuses(self) -> List[ParcelStatus]:
+        """Returns statuses in chronological order
+
+        :return: list of parcel statuses
+        :rtype: List[ParcelStatus]
+        """
+
+        return [ParcelStatus[STATUS_NAMES[code]] for code in self.codes]
+
+
+class FleetTimeline:
+    """Flat representation of many parcels timelines. All events are kept in two parallel arrays,
+    `offsets` marks where each parcel events start, so parcel `i` owns events `offsets[i]:offsets[i + 1]`.
+    Metrics are computed with array operations over the whole fleet when numpy is installed,
+    with per parcel loops otherwise.
+
+    :param shipment_numbers: shipment numbers of parcels
+    :type shipment_numbers: List[str | None]
+    :param codes: status codes of all parcels
+    :type codes: array
+    :param timestamps: epoch milliseconds of all statuses
+    :type timestamps: array
+    :param offsets: start positions of each parcel events, followed by total number of events
+    :type offsets: array
+    """
+
+    def __init__(self, shipment_numbers: List[str | None], codes: array, timestamps: array, offsets: array):
+        """Constructor method
+
+        :param shipment_numbers: shipment numbers of parcels
+        :type shipment_numbers: List[str | None]
+        :param codes: status codes of all parcels
+        :type codes: array
+        :param timestamps: epoch milliseconds of all statuses
+        :type timestamps: array
+        :param offsets: start positions of each parcel events, followed by total number of events
+        :type offsets: array
+        """
+
+        self.shipment_numbers: List[str | None] = shipment_numbers
+        self.codes: array = codes
+        self.timestamps: array = timestamps
+        self.offsets: array = offsets
+
+    @classmethod
+    def from_timelines(cls, timelines: Iterable[Timeline]) -> "FleetTimeline":
+        """`Classmethod` to concatenate single parcel timelines
+
+        :param timelines: single parcel timelines
+        :type timelines: Iterable[Timeline]
+        :return: fleet timeline
+        :rtype: FleetTimeline
+        """
+
+        shipment_numbers, codes, timestamps, offsets = [], array("H"), array("q"), array("Q", [0])
+        for timeline in timelines:
+            shipment_numbers.append(timeline.shipment_number)
+            codes.extend(timeline.codes)
+            timestamps.extend(timeline.timestamps)
+            offsets.append(len(codes))
+
+        return cls(shipment_numbers, codes, timestamps, offsets)
+
+    @classmethod
+    def from_payload(cls, parcels: Iterable[dict]) -> "FleetTimeline":
+        """`Classmethod` to build :class:`FleetTimeline` straight from `Inpost.get_parcels` payload
+
+        :param parcels: raw parcels data
+        :type parcels: Iterable[dict]
+        :return: fleet timeline
+        :rtype: FleetTimeline
+        """
+
+        return cls.from_timelines(
+            Timeline.from_event_log(data.get("eventLog", []), shipment_number=data.get("shipmentNumber"))
+            for data in parcels
+        )
+
+    def __len__(self):
+        return len(self.shipment_numbers)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(parcels={len(self)}, events={len(self.codes)})"
+
+    def __getitem__(self, index: int) -> Timeline:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return Timeline(self.shipment_numbers[index], self.codes[start:end], self.timestamps[start:end])
+
+    def _spans(self) -> Iterable[Tuple[int, int]]:
+        offsets = self.offsets
+        return zip(offsets[:-1], offsets[1:])
+
+    def _arrays(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        # codes, timestamps and index of parcel owning every event
+        codes = np.frombuffer(self.codes, dtype=self.codes.typecode)
+        timestamps = np.frombuffer(self.timestamps, dtype=self.timestamps.typecode)
+        sizes = np.diff(np.frombuffer(self.offsets, dtype=self.offsets.typecode)).astype(np.intp)
+        owners = np.repeat(np.arange(len(self)), sizes)
+        return codes, timestamps, owners
+
+    def _steps(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        # status codes before and after every transition within single parcel and time spent before it
+        codes, timestamps, owners = self._arrays()
+        within = owners[:-1] == owners[1:]
+        return codes[:-1][within], codes[1:][within], np.diff(timestamps)[within]
+
+    def dwell_times(self, status: ParcelStatus | str) -> array:
+        """Returns how long parcels stayed in status, i.e. time from the status to the next event of the same parcel.
+        Statuses that are the latest event of parcel are skipped as they are still ongoing.
+
+        :param status: parcel status
+        :type status: ParcelStatus | str
+        :return: dwell times in milliseconds
+        :rtype: array
+        """
+
+        code, codes, timestamps = status_code(status), self.codes, self.timestamps
+        if np is not None:
+            before, _, spent = self._steps()
+            return array("q", spent[before == code].astype(np.int64).tobytes())
+
+        return array(
+            "q",
+            (
+                timestamps[i + 1] - timestamps[i]
+                for start, end in self._spans()
+                for i in range(start, end - 1)
+                if codes[i] == code
+            ),
+        )
+
+    def dwell_time_totals(self) -> Dict[str, int]:
+        """Returns total time all parcels spent in each status
+
+        :return: :class:`dict` of status and total dwell time in milliseconds
+        :rtype: Dict[str, int]
+        """
+
+        if np is not None:
+            before, _, spent = self._steps()
+            present = np.unique(before)
+            sums = np.zeros(len(STATUS_NAMES), dtype=np.int64)
+            np.add.at(sums, before, spent)
+            return {STATUS_NAMES[code]: int(sums[code]) for code in present.tolist()}
+
+        totals: Counter = Counter()
+        codes, timestamps = self.codes, self.timestamps
+        for start, end in self._spans():
+            for i in range(start, end - 1):
+                totals[codes[i]] += timestamps[i + 1] - timestamps[i]
+
+        return {STATUS_NAMES[code]: total for code, total in totals.items()}
+
+    def transition_counts(self) -> Dict[Tuple[str, str], int]:
+        """Counts status transitions across all parcels
+
+        :return: :class:`dict` of `(from status, to status)` names and number of such transitions
+        :rtype: Dict[Tuple[str, str], int]
+        """
+
+        if np is not None:
+            before, after, _ = self._steps()
+            pairs, totals = np.unique(before.astype(np.int64) * len(STATUS_NAMES) + after, return_counts=True)
+            return {
+                (STATUS_NAMES[pair // len(STATUS_NAMES)], STATUS_NAMES[pair % len(STATUS_NAMES)]): count
+                for pair, count in zip(pairs.tolist(), totals.tolist())
+            }
+
+        counts: Counter = Counter()
+        codes = self.codes
+        for start, end in self._spans():
+            counts.update(zip(codes[start : end - 1], codes[start + 1 : end]))  # noqa: E203
+
+        return {(STATUS_NAMES[a], STATUS_NAMES[b]): count for (a, b), count in counts.items()}
+
+    def latencies(self, since: ParcelStatus | str, until: ParcelStatus | str) -> array:
+        """Returns time from first `since` status to first following `until` status for every parcel that has both
+
+        :param since: status to measure from (e.g. `ADOPTED_AT_SOURCE_BRANCH`)
+        :type since: ParcelStatus | str
+        :param until: status to measure to (e.g. `READY_TO_PICKUP`)
+        :type until: ParcelStatus | str
+        :return: latencies in milliseconds
+        :rtype: array
+        """
+
+        since_code, until_code = status_code(since), status_code(until)
+        if np is not None:
+            return self._latencies_array(since_code, until_code)
+
+        codes, timestamps = self.codes, self.timestamps
+        result = array("q")
+        for start, end in self._spans():
+            begin = None
+            for i in range(start, end):
+                if begin is None and codes[i] == since_code:
+                    begin = timestamps[i]
+                elif begin is not None and codes[i] == until_code:
+                    result.append(timestamps[i] - begin)
+                    break
+
+        return result
+
+    def _latencies_array(self, since_code: int, until_code: int) -> array:
+        codes, timestamps, owners = self._arrays()
+        positions, missing = np.arange(len(codes)), len(codes)
+
+        # position of first `since` event of every parcel, then of first `until` event following it
+        first = np.full(len(self), missing)
+        np.minimum.at(first, owners[codes == since_code], positions[codes == since_code])
+        following = (codes == until_code) & (positions > first[owners])
+        last = np.full(len(self), missing)
+        np.minimum.at(last, owners[following], positions[following])
+
+        matched = last < missing
+        return array("q", (timestamps[last[matched]] - timestamps[first[matched]]).astype(np.int64).tobytes())
+
+    def latency_percentiles(
+        self, since: ParcelStatus | str, until: ParcelStatus | str, percentiles: Sequence[float] = (50, 90, 99)
+    ) -> Dict[float, float | None]:
+        """Returns percentiles of :meth:`latencies`
+
+        :param since: status to measure from
+        :type since: ParcelStatus | str
+        :param until: status to measure to
+        :type until: ParcelStatus | str
+        :param percentiles: percentiles to compute, in range 0-100
+        :type percentiles: Sequence[float]
+        :return: :class:`dict` of percentile and latency in milliseconds (None if no parcel matched)
+        :rtype: Dict[float, float | None]
+        """
+
+        values = self.latencies(since, until)
+        return {q: percentile(values, q) for q in percentiles}
@@ -0,0 +1,419 @@
+import asyncio
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, List, Set
+
+from inpost.static import ParcelChanges, ParcelStatus, ParcelType
+from inpost.static.parcels import BaseParcel
+
+if TYPE_CHECKING:
+    from inpost.api import Inpost
+
+# statuses a change is expected in minutes, e.g. parcel is about to be delivered or waits in locker
+FAST_STATUSES = (
+    ParcelStatus.OUT_FOR_DELIVERY,
+    ParcelStatus.OUT_FOR_DELIVERY_TO_ADDRESS,
+    ParcelStatus.READY_TO_PICKUP,
+    ParcelStatus.READY_TO_PICKUP_FROM_POK,
+    ParcelStatus.READY_TO_PICKUP_FROM_BRANCH,
+    ParcelStatus.PICKUP_REMINDER_SENT,
+    ParcelStatus.STACK_IN_BOX_MACHINE,
+    ParcelStatus.STACK_IN_CUSTOMER_SERVICE_POINT,
+    ParcelStatus.AVIZO,
+)
+# statuses parcel waits for sender in, usually for days
+SLOW_STATUSES = (
+    ParcelStatus.CREATED,
+    ParcelStatus.OFFERS_PREPARED,
+    ParcelStatus.OFFER_SELECTED,
+    ParcelStatus.CONFIRMED,
+)
+# statuses that never change again, parcels in them are not polled at all
+FINAL_STATUSES = (
+    ParcelStatus.DELIVERED,
+    ParcelStatus.CANCELED,
+    ParcelStatus.RETURNED_TO_SENDER,
+    ParcelStatus.CLAIMED,
+    ParcelStatus.CANCELED_REDIRECT_TO_BOX,
+)
+
+FAST_INTERVAL: float = 60.0
+DEFAULT_INTERVAL: float = 600.0
+SLOW_INTERVAL: float = 1800.0
+
+STATUS_INTERVALS: Dict[str, float | None] = (
+    {status.name: FAST_INTERVAL for status in FAST_STATUSES}
+    | {status.name: SLOW_INTERVAL for status in SLOW_STATUSES}
+    | {status.name: None for status in FINAL_STATUSES}
+)
+
+
+def parcel_interval(
+    parcel: BaseParcel, now: float, intervals: Dict[str, float | None] = STATUS_INTERVALS
+) -> float | None:
+    """Returns how soon parcel should be polled again. Parcels in final status or past their
+    `operations.refresh_until` are not polled, parcels about to expire are polled right after expiry.
+
+    :param parcel: parcel to schedule
+    :type parcel: BaseParcel
+    :param now: current epoch time in seconds
+    :type now: float
+    :param intervals: :class:`dict` of status name and poll interval in seconds (None disables polling),
+        statuses not in it use :data:`DEFAULT_INTERVAL`
+    :type intervals: Dict[str, float | None]
+    :return: poll interval in seconds or None if parcel does not need polling
+    :rtype: float | None
+    """
+
+    refresh_until = parcel.operations.refresh_until if parcel.operations is not None else None
+    if refresh_until is not None and refresh_until.timestamp() <= now:
+        return None
+
+    interval = intervals.get(parcel.status.name, DEFAULT_INTERVAL) if parcel.status is not None else DEFAULT_INTERVAL
+    if interval is None:
+        return None
+
+    if parcel.expiry_date is not None:
+        left = parcel.expiry_date.timestamp() - now
+        if 0 < left < interval:
+            interval = left
+
+    return interval
+
+
+class ParcelEvent:
+    """Change of watched parcel
+
+    :param kind: `added`, `changed` or `removed`
+    :type kind: str
+    :param parcel: parcel the event is about, already updated
+    :type parcel: BaseParcel
+    :param changes: changes applied to parcel, None for `added` and `removed`
+    :type changes: ParcelChanges | None
+    """
+
+    def __init__(self, kind: str, parcel: BaseParcel, changes: ParcelChanges | None = None):
+        """Constructor method
+
+        :param kind: `added`, `changed` or `removed`
+        :type kind: str
+        :param parcel: parcel the event is about, already updated
+        :type parcel: BaseParcel
+        :param changes: changes applied to parcel, None for `added` and `removed`
+        :type changes: ParcelChanges | None
+        """
+
+        self.kind: str = kind
+        self.parcel: BaseParcel = parcel
+        self.changes: ParcelChanges | None = changes
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(kind={self.kind}, shipment_number={self.parcel.shipment_number}, "
+            f"changes={self.changes})"
+        )
+
+
+class ParcelWatcher:
+    """Polls parcels of single account, scheduling every poll by statuses of watched parcels
+    (see :func:`parcel_interval`) instead of fixed interval. Accounts with parcels about to be delivered
+    are polled every minute, accounts with only delivered parcels rarely. Changes are detected with
+    :meth:`BaseParcel.update` and emitted to callbacks registered with :meth:`on_change`
+    and to async iterator of :meth:`events`.
+
+    .. code-block:: python
+
+        watcher = ParcelWatcher(inpost)
+        watcher.on_change(print)
+        await watcher.run()
+
+    :param inpost: authenticated :class:`Inpost` instance
+    :type inpost: Inpost
+    :param parcel_type: type of watched parcels
+    :type parcel_type: ParcelType
+    :param min_interval: shortest time between polls in seconds
+    :type min_interval: float
+    :param max_interval: longest time between polls in seconds, also used when nothing needs polling
+        so new parcels are still discovered
+    :type max_interval: float
+    :param intervals: poll intervals overriding :data:`STATUS_INTERVALS`
+    :type intervals: Dict[str, float | None] | None
+    :param logger: :class:`logging.Logger` parent instance, defaults to inpost logger
+    :type logger: logging.Logger | None
+    """
+
+    def __init__(
+        self,
+        inpost: "Inpost",
+        parcel_type: ParcelType = ParcelType.TRACKED,
+        min_interval: float = 30.0,
+        max_interval: float = 3600.0,
+        intervals: Dict[str, float | None] | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        """Constructor method
+
+        :param inpost: authenticated :class:`Inpost` instance
+        :type inpost: Inpost
+        :param parcel_type: type of watched parcels
+        :type parcel_type: ParcelType
+        :param min_interval: shortest time between polls in seconds
+        :type min_interval: float
+        :param max_interval: longest time between polls in seconds, also used when nothing needs polling
+            so new parcels are still discovered
+        :type max_interval: float
+        :param intervals: poll intervals overriding :data:`STATUS_INTERVALS`
+        :type intervals: Dict[str, float | None] | None
+        :param logger: :class:`logging.Logger` parent instance, defaults to inpost logger
+        :type logger: logging.Logger | None
+        """
+
+        self.inpost: "Inpost" = inpost
+        self.parcel_type: ParcelType = parcel_type
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.intervals: Dict[str, float | None] = STATUS_INTERVALS | (intervals or {})
+        self.parcels: Dict[str, BaseParcel] = {}
+        self.polls: int = 0
+        self._callbacks: List[Callable[[ParcelEvent], Awaitable[None] | None]] = []
+        self._stopped: asyncio.Event = asyncio.Event()
+
+        self._log: logging.Logger = (logger or inpost._log).getChild(self.__class__.__name__)
+        self._log.debug("created")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(parcel_type={self.parcel_type.name}, parcels={len(self.parcels)})"
+
+    def __aiter__(self) -> AsyncIterator[ParcelEvent]:
+        return self.events()
+
+    def on_change(self, callback: Callable[[ParcelEvent], Awaitable[None] | None]) -> None:
+        """Registers callback called with every :class:`ParcelEvent`, it may be coroutine function
+
+        :param callback: event callback
+        :type callback: Callable[[ParcelEvent], Awaitable[None] | None]
+        """
+
+        self._callbacks.append(callback)
+
+    def next_interval(self, now: float | None = None) -> float:
+        """Returns time to next poll, the shortest interval of watched parcels clamped to configured bounds
+
+        :param now: current epoch time in seconds, defaults to now
+        :type now: float | None
+        :return: interval in seconds
+        :rtype: float
+        """
+
+        now = time.time() if now is None else now
+        intervals = [
+            interval
+            for parcel in self.parcels.values()
+            if (interval := parcel_interval(parcel, now, self.intervals)) is not None
+        ]
+        return min(self.max_interval, max(self.min_interval, min(intervals, default=self.max_interval)))
+
+    async def poll(self) -> List[ParcelEvent]:
+        """Fetches parcels once, updates watched ones and emits events for every change
+
+        :return: events of this poll
+        :rtype: List[ParcelEvent]
+        """
+
+        self.polls += 1
+        fetched = await self.inpost.get_parcels(parcel_type=self.parcel_type, parse=False)
+        events = self._merge([data for data in fetched if isinstance(data, dict)])
+        await self._emit(events)
+        return events
+
+    def _merge(self, fetched: List[dict]) -> List[ParcelEvent]:
+        events, seen = [], set()
+        for data in fetched:
+            shipment_number = data.get("shipmentNumber")
+            if not isinstance(shipment_number, str):
+                self._log.warning(f"skipping parcel without shipment number: {data!r}")
+                continue
+
+            seen.add(shipment_number)
+            events.extend(self._apply(shipment_number, data))
+
+        for shipment_number in [number for number in self.parcels if number not in seen]:
+            events.append(ParcelEvent("removed", self.parcels.pop(shipment_number)))
+
+        return events
+
+    def _apply(self, shipment_number: str, data: dict) -> List[ParcelEvent]:
+        parcel = self.parcels.get(shipment_number)
+        if parcel is None:
+            parcel = self.parcels[shipment_number] = self.inpost._parse_parcel(data, self.parcel_type)
+            return [ParcelEvent("added", parcel)]
+
+        changes = parcel.update(data)
+        return [ParcelEvent("changed", parcel, changes)] if changes else []
+
+    async def _emit(self, events: List[ParcelEvent]) -> None:
+        for event in events:
+            self._log.debug(f"emitting {event}")
+            for callback in self._callbacks:
+                try:
+                    result = callback(event)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    # one broken consumer must not stop watching
+                    self._log.warning(f"callback failed for {event}: {e!r}")
+
+    async def events(self) -> AsyncIterator[ParcelEvent]:
+        """Polls until :meth:`stop` is called and yields every event
+
+        :return: async iterator over parcel events
+        :rtype: AsyncIterator[ParcelEvent]
+        """
+
+        try:
+            while not self._stopped.is_set():
+                try:
+                    events = await self.poll()
+                except Exception as e:
+                    self._log.warning(f"poll failed: {e!r}")
+                    events = []
+
+                for event in events:
+                    yield event
+
+                interval = self.next_interval()
+                self._log.debug(f"next poll in {interval:.1f}s")
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # stopped watcher can be started again
+            self._stopped.clear()
+
+    async def run(self) -> None:
+        """Polls until :meth:`stop` is called, events are delivered to callbacks only"""
+
+        async for _ in self.events():
+            pass
+
+    def stop(self) -> None:
+        """Stops polling after current poll, watcher stopped before it started does not poll at all"""
+
+        self._stopped.set()
+
+
+class NotificationWatcher(ParcelWatcher):
+    """:class:`ParcelWatcher` mode driven by notifications. Instead of fetching whole parcel list, every poll fetches
+    notifications (see :meth:`Inpost.get_notifications`) and refetches single parcels referenced by `shipmentNumber`
+    of ones that were not in previous window. Full parcel list is fetched on first poll and every `full_sync_interval`, to pick up
+    changes that came without notification (e.g. removed parcels).
+
+    :param inpost: authenticated :class:`Inpost` instance
+    :type inpost: Inpost
+    :param parcel_type: type of watched parcels
+    :type parcel_type: ParcelType
+    :param interval: time between notification polls in seconds
+    :type interval: float
+    :param full_sync_interval: time between full parcel list polls in seconds
+    :type full_sync_interval: float
+    :param logger: :class:`logging.Logger` parent instance, defaults to inpost logger
+    :type logger: logging.Logger | None
+    """
+
+    def __init__(
+        self,
+        inpost: "Inpost",
+        parcel_type: ParcelType = ParcelType.TRACKED,
+        interval: float = 60.0,
+        full_sync_interval: float = 21600.0,
+        logger: logging.Logger | None = None,
+    ):
+        """Constructor method
+
+        :param inpost: authenticated :class:`Inpost` instance
+        :type inpost: Inpost
+        :param parcel_type: type of watched parcels
+        :type parcel_type: ParcelType
+        :param interval: time between notification polls in seconds
+        :type interval: float
+        :param full_sync_interval: time between full parcel list polls in seconds
+        :type full_sync_interval: float
+        :param logger: :class:`logging.Logger` parent instance, defaults to inpost logger
+        :type logger: logging.Logger | None
+        """
+
+        super().__init__(inpost, parcel_type=parcel_type, min_interval=interval, max_interval=interval, logger=logger)
+        self.full_sync_interval: float = full_sync_interval
+        self._synced_at: float | None = None
+        self._seen: Set[str] = set()
+
+    def next_interval(self, now: float | None = None) -> float:
+        """Returns time to next poll, notifications are cheap to fetch so they are polled at constant interval
+
+        :param now: ignored, kept for compatibility with :meth:`ParcelWatcher.next_interval`
+        :type now: float | None
+        :return: interval in seconds
+        :rtype: float
+        """
+
+        return self.min_interval
+
+    async def poll(self) -> List[ParcelEvent]:
+        """Fetches new notifications, refetches parcels they reference (or all parcels when full sync is due)
+        and emits events for every change
+
+        :return: events of this poll
+        :rtype: List[ParcelEvent]
+        """
+
+        now = time.time()
+        if self._synced_at is None or now - self._synced_at >= self.full_sync_interval:
+            # mark current notifications as seen, full sync covers whatever they reference
+            await self._new_notifications()
+            self._synced_at = now
+            return await super().poll()
+
+        self.polls += 1
+        numbers = list(
+            dict.fromkeys(
+                number
+                for notification in await self._new_notifications()
+                if isinstance(number := notification.get("shipmentNumber"), str) and number
+            )
+        )
+        fetched = await asyncio.gather(
+            *(self.inpost.get_parcel(shipment_number=number, parcel_type=self.parcel_type) for number in numbers),
+            return_exceptions=True,
+        )
+
+        events = []
+        for number, data in zip(numbers, fetched):
+            if isinstance(data, BaseException):
+                self._log.warning(f"could not refetch parcel {number}: {data!r}")
+                continue
+
+            if isinstance(data, dict):
+                events.extend(self._apply(number, data))
+
+        await self._emit(events)
+        return events
+
+    async def _new_notifications(self) -> List[dict]:
+        notifications = [
+            notification for notification in await self.inpost.get_notifications() if isinstance(notification, dict)
+        ]
+        # api returns window of recent notifications, so whatever was not in previous window is new
+        keys = [self._key(notification) for notification in notifications]
+        new = [notification for notification, key in zip(notifications, keys) if key not in self._seen]
+        self._seen = set(keys)
+        return new
+
+    @staticmethod
+    def _key(notification: dict) -> str:
+        # notifications without id are told apart by content, so they do not collapse into one
+        if notification.get("id") is not None:
+            return f"id:{notification['id']}"
+
+        return json.dumps(notification, sort_keys=True, default=str)
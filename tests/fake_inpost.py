@@ -0,0 +1,92 @@
+import asyncio
+import copy
+
+from inpost import Inpost
+from inpost.static import UnidentifiedAPIError
+
+
+class FakeResponse:
+    def __init__(self, payload, events, name, body_delay=0.0):
+        self.status = 200
+        self.payload = payload
+        self.events = events
+        self.name = name
+        self.body_delay = body_delay
+        self.released = False
+
+    async def json(self):
+        await asyncio.sleep(self.body_delay)
+        self.events.append(f"read {self.name}")
+        return copy.deepcopy(self.payload)
+
+    def release(self):
+        self.released = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class FakeInpost(Inpost):
+    """`Inpost` with `request` answered by `routes`: url -> callable(params, data) returning payload or raising"""
+
+    def __init__(self, routes, body_delays=None):
+        super().__init__(prefix="+48", phone_number="524507211", auth_token="token")
+        self.routes = routes
+        self.body_delays = body_delays or {}
+        self.events = []
+        self.calls = []
+        self.responses = []
+
+    async def request(self, method, action, url, auth=True, headers=None, params=None, data=None, **kwargs):
+        await asyncio.sleep(0)
+        url = str(url)
+        handler = next((handler for prefix, handler in self.routes.items() if url.startswith(prefix)), None)
+        self.calls.append((url, params, data))
+        self.events.append(f"request {url}")
+        if handler is None:
+            raise UnidentifiedAPIError(reason=f"unexpected request {url}")
+
+        result = handler(params, data)
+        if asyncio.iscoroutine(result):
+            result = await result
+        response = FakeResponse(result, self.events, url, self.body_delays.get(url, 0.0))
+        self.responses.append(response)
+        return response
+
+    def count(self, url):
+        return sum(1 for called, _, _ in self.calls if called.startswith(url))
+
+
+class PointPages:
+    """Route of `/v3/points` serving `points` in pages of requested `perPage` size, fails once `fail_on` is requested"""
+
+    def __init__(self, points, total=True, fail_on=None):
+        self.points = points
+        self.total = total
+        self.fail_on = fail_on
+        self.requested = []
+
+    def __call__(self, params, data):
+        page, per_page = params["page"], params["perPage"]
+        if page == self.fail_on:
+            raise ConnectionError(page)
+
+        self.requested.append(page)
+        payload = {"points": self.points[(page - 1) * per_page : page * per_page]}  # noqa: E203
+        return payload | ({"totalPages": -(-len(self.points) // per_page)} if self.total else {})
+
+
+def run(scenario, routes, **kwargs):
+    """Runs `scenario(inpost)` coroutine against `FakeInpost` created inside event loop, returns both"""
+
+    async def main():
+        inpost = FakeInpost(routes, **kwargs)
+        try:
+            return inpost, await scenario(inpost)
+        finally:
+            await inpost.sess.close()
+
+    return asyncio.run(main())
@@ -0,0 +1,199 @@
+import asyncio
+import copy
+
+import pytest
+
+from inpost.static import (
+    CompartmentActualStatus,
+    CompartmentStatusTimeoutError,
+    MissingParamsError,
+    Parcel,
+    SentParcel,
+    SingleParamError,
+    UnidentifiedAPIError,
+    collect_url,
+    compartment_open_url,
+    compartment_status_url,
+    multi_url,
+    status_sent_url,
+    terminate_collect_session_url,
+    tracked_url,
+)
+from tests.fake_inpost import run
+from tests.test_data import parcel_locker, parcel_properties
+
+
+def ready_parcel(shipment_number="991798006092038618752844"):
+    return copy.deepcopy(parcel_locker) | {"status": "READY_TO_PICKUP", "shipmentNumber": shipment_number}
+
+
+def collect_routes(status="OPENED"):
+    return {
+        tracked_url: lambda params, data: ready_parcel(),
+        collect_url: lambda params, data: parcel_properties,
+        compartment_open_url: lambda params, data: parcel_properties,
+        compartment_status_url: lambda params, data: {"status": status},
+    }
+
+
+@pytest.mark.parametrize(
+    "fetch, steps", [(False, ["validate", "open", "status"]), (True, ["get_parcel", "validate", "open", "status"])]
+)
+def test_collect_pipelined(fetch, steps):
+    async def scenario(inpost):
+        if fetch:
+            return await inpost.collect_pipelined(shipment_number="991798006092038618752844")
+        return await inpost.collect_pipelined(parcel_obj=Parcel(ready_parcel(), inpost._log))
+
+    inpost, result = run(scenario, collect_routes())
+    assert result.ok and result.status == CompartmentActualStatus.OPENED, f"result: {result}"
+    assert list(result.timings.steps) == steps, f"steps: {list(result.timings.steps)}"
+    assert result.parcel.compartment_location.name == "3R1"
+    assert inpost.count(tracked_url) == int(fetch)
+
+
+def test_status_check_overlaps_open_response():
+    async def scenario(inpost):
+        return await inpost.collect_pipelined(parcel_obj=Parcel(ready_parcel(), inpost._log))
+
+    inpost, _ = run(scenario, collect_routes(), body_delays={compartment_open_url: 0.05})
+    events = inpost.events
+    assert events.index(f"request {compartment_status_url}") < events.index(f"read {compartment_open_url}"), events
+    assert all(response.released for response in inpost.responses[1:]), "open and status responses not released"
+
+
+def test_collect_many():
+    numbers = [f"99179800609203861875284{i}" for i in range(5)]
+    active, peak = 0, 0
+
+    async def validate(params, data):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if data["parcel"]["shipmentNumber"] == numbers[1]:
+            raise UnidentifiedAPIError(reason="compartment blocked")
+        return parcel_properties
+
+    routes = collect_routes() | {
+        multi_url: lambda params, data: {"parcels": [ready_parcel(number) for number in numbers]},
+        collect_url: validate,
+    }
+
+    inpost, results = run(lambda inpost: inpost.collect_many(multi_uuid="uuid", concurrency=2), routes)
+    assert [result.parcel.shipment_number for result in results] == numbers
+    assert [result.ok for result in results] == [True, False, True, True, True], f"results: {results}"
+    assert isinstance(results[1].error, UnidentifiedAPIError) and "open" not in results[1].timings.steps
+    assert peak == 2 and inpost.count(multi_url) == 1 and inpost.count(tracked_url) == 0
+
+
+def test_collect_many_terminates_failed_sessions():
+    numbers = [f"99179800609203861875284{i}" for i in range(3)]
+    terminated = []
+
+    def open_compartment(params, data):
+        if data["sessionUuid"] == "failing":
+            raise UnidentifiedAPIError(reason="compartment blocked")
+        return parcel_properties
+
+    def validate(params, data):
+        failing = data["parcel"]["shipmentNumber"] == numbers[1]
+        return parcel_properties | ({"sessionUuid": "failing"} if failing else {})
+
+    routes = collect_routes() | {
+        collect_url: validate,
+        compartment_open_url: open_compartment,
+        terminate_collect_session_url: lambda params, data: terminated.append(data["sessionUuid"]) or {},
+    }
+
+    async def scenario(inpost):
+        return await inpost.collect_many(parcels=[Parcel(ready_parcel(number), inpost._log) for number in numbers])
+
+    _, results = run(scenario, routes)
+    assert [result.ok for result in results] == [True, False, True], f"results: {results}"
+    assert terminated == ["failing"], f"terminated: {terminated}"
+
+
+@pytest.mark.parametrize(
+    "kwargs, error", [({}, MissingParamsError), ({"multi_uuid": "a", "parcels": []}, SingleParamError)]
+)
+def test_collect_many_params(kwargs, error):
+    with pytest.raises(error):
+        run(lambda inpost: inpost.collect_many(**kwargs), {})
+
+
+def opened_parcel(inpost, parcel_type=Parcel, **data):
+    parcel_obj = parcel_type(ready_parcel() | data, inpost._log)
+    parcel_obj.compartment_properties = parcel_properties
+    return parcel_obj
+
+
+def status_routes(url, statuses):
+    statuses = iter(statuses)
+    return {url: lambda params, data: {"status": next(statuses)}, terminate_collect_session_url: lambda p, d: {}}
+
+
+def test_wait_for_compartment_status():
+    async def scenario(inpost):
+        return await inpost.wait_for_compartment_status(parcel_obj=opened_parcel(inpost), timeout=5)
+
+    routes = status_routes(compartment_status_url, ["OPENED", "OPENED", "CLOSED"])
+    inpost, status = run(scenario, routes)
+    assert status == CompartmentActualStatus.CLOSED, f"status: {status}"
+    assert inpost.count(compartment_status_url) == 3 and inpost.count(terminate_collect_session_url) == 1
+
+
+def test_wait_for_compartment_status_timeout_terminates():
+    async def scenario(inpost):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        with pytest.raises(CompartmentStatusTimeoutError):
+            await inpost.wait_for_compartment_status(parcel_obj=opened_parcel(inpost), timeout=0.6)
+        return loop.time() - start
+
+    inpost, elapsed = run(scenario, status_routes(compartment_status_url, ["OPENED"] * 10))
+    assert 0.6 <= elapsed < 0.8, f"elapsed: {elapsed}"
+    # no poll is started once deadline passed, it would have no time left for its request
+    assert 1 < inpost.count(compartment_status_url) < 6, f"polls: {inpost.count(compartment_status_url)}"
+    assert inpost.count(terminate_collect_session_url) == 1
+
+
+def test_wait_for_compartment_status_stalled_request():
+    async def stall(params, data):
+        await asyncio.sleep(10)
+
+    async def scenario(inpost):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        with pytest.raises(CompartmentStatusTimeoutError):
+            await inpost.wait_for_compartment_status(parcel_obj=opened_parcel(inpost), timeout=0.3)
+        return loop.time() - start
+
+    inpost, elapsed = run(scenario, status_routes(compartment_status_url, []) | {compartment_status_url: stall})
+    assert 0.3 <= elapsed < 0.5, f"elapsed: {elapsed}"
+    assert inpost.count(terminate_collect_session_url) == 1
+
+
+def test_wait_for_compartment_status_cancelled_terminates():
+    async def scenario(inpost):
+        task = asyncio.create_task(inpost.wait_for_compartment_status(parcel_obj=opened_parcel(inpost)))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    inpost, _ = run(scenario, status_routes(compartment_status_url, ["OPENED"] * 10))
+    assert inpost.count(terminate_collect_session_url) == 1
+
+
+def test_wait_for_send_compartment_status():
+    async def scenario(inpost):
+        parcel_obj = opened_parcel(
+            inpost, SentParcel, confirmationDate="2022-11-29T12:00:00.000Z", shipmentType="parcel", parcelSize="A"
+        )
+        return await inpost.wait_for_send_compartment_status(parcel_obj=parcel_obj, timeout=5)
+
+    inpost, status = run(scenario, status_routes(status_sent_url, ["OPENED", "CLOSED"]))
+    assert status == CompartmentActualStatus.CLOSED, f"status: {status}"
+    assert inpost.count(status_sent_url) == 2 and inpost.count(terminate_collect_session_url) == 0
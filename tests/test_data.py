@@ -384,3 +384,102 @@ open_data_result = {
     "receiverPhoneNumber": "524507211",
     "shipmentNumber": "991798006092038618752844",
 }
+
+
+def _point(name, latitude, longitude, city, street, post_code, opening_hours, **extra):
+    return {
+        "name": name,
+        "location": {"latitude": latitude, "longitude": longitude},
+        "locationDescription": extra.pop("description", None),
+        "openingHours": opening_hours,
+        "addressDetails": {
+            "postCode": post_code,
+            "city": city,
+            "province": extra.pop("province", None),
+            "street": street,
+            "buildingNumber": extra.pop("building_number", "1"),
+        },
+        "virtual": 0,
+        "pointType": extra.pop("point_type", "PL"),
+        "type": extra.pop("type", ["parcel_locker"]),
+        "location247": opening_hours == "24/7",
+        "doubled": False,
+        "imageUrl": f"https://static.easypack24.net/points/pl/images/{name}.jpg",
+        "easyAccessZone": extra.pop("easy_access_zone", False),
+        "airSensor": False,
+        "paymentType": extra.pop("payment_type", ["BY_CARD_IN_MACHINE"]),
+        "remoteSend": True,
+        "remoteReturn": True,
+    }
+
+
+parcel_points = {
+    "points": [
+        parcel_locker["pickUpPoint"] | {"paymentType": ["BY_CARD_IN_MACHINE"]},
+        _point(
+            "WRO61M",
+            51.1167,
+            16.9900,
+            "Wrocław",
+            "Legnicka",
+            "54-203",
+            "24/7",
+            description="Przy stacji paliw",
+            province="dolnośląskie",
+            easy_access_zone=True,
+        ),
+        _point(
+            "WRO07BAPP",
+            51.1098,
+            17.0326,
+            "Wrocław",
+            "Świdnicka",
+            "50-066",
+            "pn-pt 08:00-20:00, sb 09:00-14:00",
+            description="Wewnątrz sklepu Żabka",
+            province="dolnośląskie",
+            point_type="POP",
+            type=["parcel_point"],
+            payment_type=["NOTSUPPORTED"],
+        ),
+        _point(
+            "WAW22A",
+            52.2297,
+            21.0122,
+            "Warszawa",
+            "Marszałkowska",
+            "00-624",
+            "24/7",
+            description="Obok wejścia do metra",
+            province="mazowieckie",
+        ),
+        _point(
+            "WAW104M",
+            52.2400,
+            21.0300,
+            "Warszawa",
+            "Zielna",
+            "00-108",
+            "Pn-Pt: 7-22; Sb: 8-16; Nd: nieczynne",
+            province="mazowieckie",
+            easy_access_zone=True,
+        ),
+        _point(
+            "KRA01N",
+            50.0614,
+            19.9366,
+            "Kraków",
+            "Łobzowska",
+            "31-139",
+            "pn-nd 06:00-23:00",
+            description="Łódź nie, Kraków tak",
+            province="małopolskie",
+            point_type="POK",
+            type=["parcel_locker", "parcel_point"],
+        ),
+    ],
+    "page": 1,
+    "perPage": 1000,
+    "totalPages": 1,
+    "count": 6,
+}
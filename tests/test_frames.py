@@ -0,0 +1,96 @@
+import logging
+
+import pytest
+
+from inpost.static import frames
+from inpost.static.frames import NAT, ParcelFrame, to_epoch_ms
+from inpost.static.statuses import ParcelShipmentType, ParcelStatus
+from tests.test_data import courier_parcel, parcel_locker, parcel_locker_multi, parcel_locker_multi_main
+
+payload = [parcel_locker, courier_parcel, parcel_locker_multi, parcel_locker_multi_main]
+
+
+@pytest.fixture(autouse=True, params=["numpy", "loops"])
+def backend(request, monkeypatch):
+    # every test runs against numpy views and against the pure python fallback
+    if request.param == "loops":
+        monkeypatch.setattr(frames, "np", None)
+
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
+        ("2022-11-30T06:55:08.000Z", 1669791308000),
+        ("2022-11-30T07:55:08+01:00", 1669791308000),
+        ("2022-11-30T06:55:08.12Z", 1669791308120),
+        ("2022-11-30T06:55:08.123456Z", 1669791308123),
+        (None, NAT),
+    ],
+)
+def test_to_epoch_ms(test_input, expected):
+    epoch = to_epoch_ms(test_input)
+    assert epoch == expected, f"epoch: {epoch} != expected: {expected}"
+
+
+def test_from_payload():
+    frame = ParcelFrame.from_payload(payload)
+    assert len(frame) == len(payload)
+    assert frame.column("shipment_number") == [data["shipmentNumber"] for data in payload]
+    assert frame.column("status") == [data["status"] for data in payload]
+    assert frame.column("stored_date")[1] == NAT
+
+
+@pytest.mark.parametrize(
+    "conditions,expected",
+    [
+        ({"shipment_type": ParcelShipmentType.courier}, [courier_parcel]),
+        ({"shipment_type": "parcel", "status": [ParcelStatus.DELIVERED, "READY_TO_PICKUP"]}, None),
+        ({"pickup_point": "NOWHERE"}, []),
+        ({"stored_date": (None, 0)}, []),
+    ],
+)
+def test_filter(conditions, expected):
+    frame = ParcelFrame.from_payload(payload).filter(**conditions)
+    if expected is None:
+        expected = [
+            data
+            for data in payload
+            if data["shipmentType"] == "parcel" and data["status"] in ("DELIVERED", "READY_TO_PICKUP")
+        ]
+
+    shipment_numbers = frame.column("shipment_number")
+    expected = [data["shipmentNumber"] for data in expected]
+    assert shipment_numbers == expected, f"shipment_numbers: {shipment_numbers} != expected: {expected}"
+
+
+def test_count_by():
+    counts = ParcelFrame.from_payload(payload).count_by("shipment_type")
+    assert counts == {"parcel": 3, "courier": 1}, f"counts: {counts}"
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_puts_missing_last(reverse):
+    stored = ParcelFrame.from_payload(payload).sort("stored_date", reverse=reverse).column("stored_date")
+    present = [value for value in stored if value != NAT]
+    assert stored[-1] == NAT and present == sorted(present, reverse=reverse), f"stored: {stored}"
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_categorical(reverse):
+    statuses = ParcelFrame.from_payload(payload).sort("status", reverse=reverse).column("status")
+    expected = sorted((data["status"] for data in payload), reverse=reverse)
+    assert statuses == expected, f"statuses: {statuses} != expected: {expected}"
+
+
+def test_mask_matches_filter():
+    frame = ParcelFrame.from_payload(payload)
+    mask = frame.mask(shipment_type="parcel")
+    assert mask == [data["shipmentType"] == "parcel" for data in payload], f"mask: {mask}"
+    assert len(frame.filter(mask)) == sum(mask), f"mask: {mask}"
+
+
+def test_to_parcels():
+    parcels = ParcelFrame.from_payload(payload).filter(shipment_type="courier").to_parcels(logging.getLogger(__name__))
+    assert [parcel.shipment_number for parcel in parcels] == [courier_parcel["shipmentNumber"]]
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+# cumulative `import inpost.static` time, reported by `python -X importtime`, relative to `import aiohttp`
+# measured on the same machine, so the check does not depend on how fast the machine running tests is
+IMPORT_BUDGET_RATIO = 0.5
+HEAVY_MODULES = ("aiohttp", "arrow", "qrcode", "PIL", "asyncio")
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True)
+
+
+def _import_time_us(module: str) -> int:
+    stderr = _run(f"import {module}", "-X", "importtime").stderr
+    lines = [line for line in stderr.splitlines() if line.rstrip().endswith(f"| {module}")]
+    return int(lines[-1].split("|")[1])
+
+
+def test_import_time_budget():
+    elapsed = min(_import_time_us("inpost.static") for _ in range(3))
+    baseline = min(_import_time_us("aiohttp") for _ in range(3))
+    assert (
+        elapsed < baseline * IMPORT_BUDGET_RATIO
+    ), f"import inpost.static took {elapsed}us, budget is {IMPORT_BUDGET_RATIO} of import aiohttp ({baseline}us)"
+
+
+def test_heavy_modules_not_imported():
+    loaded = _run(f"import sys, inpost, inpost.static; print([m for m in {HEAVY_MODULES} if m in sys.modules])").stdout
+    assert loaded.strip() == "[]", f"loaded: {loaded.strip()} != expected: []"
+
+
+@pytest.mark.parametrize(
+    "code, module",
+    [
+        ("from inpost import Inpost", "aiohttp"),
+        (
+            "from inpost.static import Friend; Friend({'createdDate': '2022-11-30T06:55:08.000Z'}, __import__('logging').getLogger())",
+            "arrow",
+        ),
+        ("from inpost.static.qr import render_png; render_png('P|524507211|465649')", "qrcode"),
+    ],
+)
+def test_heavy_modules_imported_on_use(code, module):
+    loaded = _run(f"import sys; {code}; print({module!r} in sys.modules)").stdout
+    assert loaded.strip() == "True", f"{module} not imported by: {code}"
+
+
+def test_matrix_paths_do_not_import_pillow():
+    code = (
+        "from inpost.static.qr import cached_compact_png, matrix_to_png, matrix_to_svg, pack_matrix, render_matrix; "
+        "matrix = render_matrix('P|524507211|465649'); matrix_to_svg(matrix); pack_matrix(matrix); "
+        "matrix_to_png(matrix); cached_compact_png('P|524507211|465649')"
+    )
+    loaded = _run(f"import sys; {code}; print([m for m in ('qrcode', 'PIL') if m in sys.modules])").stdout
+    assert loaded.strip() == "[]", f"loaded: {loaded.strip()} != expected: []"
@@ -0,0 +1,70 @@
+import asyncio
+import copy
+
+from inpost.static import Parcel, ParcelStatus, ParcelType, SentParcel, returns_url, sent_url, tracked_url
+from tests.fake_inpost import run
+from tests.test_data import parcel_locker
+from tests.test_send import sent_parcel
+
+
+def tracked(shipment_number, status):
+    return copy.deepcopy(parcel_locker) | {"shipmentNumber": shipment_number, "status": status}
+
+
+ROUTES = {
+    tracked_url: lambda params, data: {
+        "parcels": [tracked("1", "READY_TO_PICKUP"), tracked("2", "DELIVERED"), tracked("3", "READY_TO_PICKUP")]
+    },
+    sent_url: lambda params, data: {"parcels": [sent_parcel() | {"shipmentNumber": "4"}]},
+    returns_url: lambda params, data: {"parcels": []},
+}
+
+
+def collect(**kwargs):
+    async def scenario(inpost):
+        return [parcel async for parcel in inpost.iter_parcels(**kwargs)]
+
+    return run(scenario, ROUTES)
+
+
+def test_iter_parcels_all_types():
+    inpost, parcels = collect()
+    assert sorted(parcel["shipmentNumber"] for parcel in parcels) == ["1", "2", "3", "4"]
+    assert all(isinstance(parcel, dict) for parcel in parcels)
+    assert [inpost.count(url) for url in (tracked_url, sent_url, returns_url)] == [1, 1, 1]
+
+
+def test_iter_parcels_status_filter():
+    inpost, parcels = collect(parcel_type=ParcelType.TRACKED, status=ParcelStatus.READY_TO_PICKUP)
+    assert [parcel["shipmentNumber"] for parcel in parcels] == ["1", "3"], f"parcels: {parcels}"
+    assert inpost.count(sent_url) == 0 and inpost.count(returns_url) == 0
+
+
+def test_iter_parcels_parse():
+    _, parcels = collect(parcel_type=[ParcelType.TRACKED, ParcelType.SENT], parse=True)
+    by_number = {parcel.shipment_number: type(parcel) for parcel in parcels}
+    assert by_number == {"1": Parcel, "2": Parcel, "3": Parcel, "4": SentParcel}, f"types: {by_number}"
+
+
+def test_iter_parcels_early_break_cancels_pending_fetches():
+    cancelled = []
+
+    async def slow(params, data):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(sent_url)
+            raise
+        return {"parcels": []}
+
+    async def scenario(inpost):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async for parcel in inpost.iter_parcels(parcel_type=[ParcelType.TRACKED, ParcelType.SENT]):
+            break
+        await asyncio.sleep(0.01)
+        return parcel, loop.time() - start
+
+    _, (parcel, elapsed) = run(scenario, ROUTES | {sent_url: slow})
+    assert parcel["shipmentNumber"] == "1" and elapsed < 0.5, f"elapsed: {elapsed}"
+    assert cancelled == [sent_url], "pending fetch was not cancelled"
@@ -1,9 +1,10 @@
+import copy
 import logging
 
 import pytest
 
-from inpost.static import CompartmentActualStatus
-from inpost.static.parcels import CompartmentLocation, CompartmentProperties, Parcel
+from inpost.static import CompartmentActualStatus, ParcelStatus
+from inpost.static.parcels import CompartmentLocation, CompartmentProperties, Parcel, PickupPoint, PointRegistry
 from tests.test_data import (
     courier_parcel,
     open_data_result,
@@ -239,4 +240,78 @@ def test_has_airsensor(test_input, expected):
     assert has_airsensor is expected, f"has_airsensor: {has_airsensor} != expected: {expected}"
 
 
+def test_pickup_point_shared():
+    registry = PointRegistry()
+    parcels = [Parcel(parcel_locker, logging.getLogger(__name__), point_registry=registry) for _ in range(3)]
+    assert parcels[0].pickup_point is parcels[1].pickup_point is parcels[2].pickup_point
+
+
+def test_pickup_point_not_shared_between_registries():
+    first = Parcel(parcel_locker, logging.getLogger(__name__), point_registry=PointRegistry())
+    second = Parcel(parcel_locker, logging.getLogger(__name__), point_registry=PointRegistry())
+    unregistered = Parcel(parcel_locker, logging.getLogger(__name__))
+    assert first.pickup_point is not second.pickup_point, "points shared between registries"
+    assert unregistered.pickup_point not in (first.pickup_point, second.pickup_point), "point shared without registry"
+
+
+def test_point_registry_detects_changes():
+    registry = PointRegistry()
+    changed = parcel_locker["pickUpPoint"] | {"openingHours": "8-20"}
+    point = registry.get(PickupPoint, parcel_locker["pickUpPoint"], logging.getLogger(__name__))
+    same = registry.get(PickupPoint, dict(parcel_locker["pickUpPoint"]), logging.getLogger(__name__))
+    other = registry.get(PickupPoint, changed, logging.getLogger(__name__))
+    assert point is same and point is not other, f"registry: {registry}"
+    assert (registry.hits, registry.misses) == (1, 2), f"registry: {registry}"
+
+
+def test_point_registry_ignores_mutated_source():
+    registry = PointRegistry()
+    data = copy.deepcopy(parcel_locker["pickUpPoint"])
+    point = registry.get(PickupPoint, data, logging.getLogger(__name__))
+    data["location"] = {"latitude": 0.0, "longitude": 0.0}
+    other = registry.get(PickupPoint, data, logging.getLogger(__name__))
+    assert point is not other and other.latitude == 0.0, f"stale point returned: {point}"
+
+
+@pytest.mark.parametrize("registry", [None, PointRegistry()])
+def test_update_without_changes(registry):
+    parcel = Parcel(parcel_locker, logging.getLogger(__name__), point_registry=registry)
+    event_log, pickup_point = parcel.event_log, parcel.pickup_point
+    changes = parcel.update(parcel_locker)
+    assert not changes, f"changes: {changes}"
+    assert parcel.event_log[0] is event_log[0] and parcel.pickup_point is pickup_point
+
+
+def test_update_with_changed_point():
+    parcel = Parcel(parcel_locker, logging.getLogger(__name__), point_registry=PointRegistry())
+    pickup_point = parcel.pickup_point
+    changes = parcel.update(parcel_locker | {"pickUpPoint": parcel_locker["pickUpPoint"] | {"openingHours": "8-20"}})
+    assert "pickup_point" in changes.fields, f"changes: {changes}"
+    assert parcel.pickup_point is not pickup_point and parcel.pickup_point.opening_hours == "8-20"
+
+
+def test_update_with_changes():
+    parcel = Parcel(courier_parcel, logging.getLogger(__name__))
+    known_events = list(parcel.event_log)
+    new_data = courier_parcel | {
+        "status": "READY_TO_PICKUP",
+        "expiryDate": "2022-12-20T11:20:59.000Z",
+        "openCode": "123456",
+        "eventLog": [{"type": "PARCEL_STATUS", "name": "READY_TO_PICKUP", "date": "2022-12-14T11:20:59.000Z"}]
+        + courier_parcel["eventLog"],
+    }
+    changes = parcel.update(new_data)
+    assert changes.status_changed and changes.expiry_moved and changes.compartment_assigned, f"changes: {changes}"
+    assert [event.name for event in changes.new_events] == [ParcelStatus.READY_TO_PICKUP]
+    assert parcel.event_log[1:] == known_events and parcel.status == ParcelStatus.READY_TO_PICKUP
+
+
+def test_update_with_rewritten_history():
+    parcel = Parcel(courier_parcel, logging.getLogger(__name__))
+    rewritten = {"type": "PARCEL_STATUS", "name": "CREATED", "date": "2022-12-09T15:16:04.000Z"}
+    changes = parcel.update(courier_parcel | {"eventLog": courier_parcel["eventLog"][:-1] + [rewritten]})
+    assert [event.name for event in changes.new_events] == [ParcelStatus.CREATED], f"changes: {changes}"
+    assert [event.to_dict()["name"] for event in parcel.event_log][-1] == "CREATED"
+
+
 # TODO: Add rest tests!
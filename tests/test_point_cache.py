@@ -0,0 +1,63 @@
+import logging
+
+import pytest
+
+from inpost.points import PointCache
+from inpost.static import ParcelPointOperations
+from tests.test_data import parcel_points
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize(
+    "first, second, same",
+    [
+        ({"query": "GXO05M"}, {"query": "  gxo05m "}, True),
+        ({"query": "GXO05M"}, {"query": "GXO05M", "operation": ParcelPointOperations.SEND}, False),
+        ({"latitude": 51.0775, "longitude": 17.04745}, {"latitude": 51.0771, "longitude": 17.0401}, True),
+        ({"latitude": 51.0775, "longitude": 17.04745}, {"latitude": 51.0875, "longitude": 17.04745}, False),
+    ],
+)
+def test_key(first, second, same):
+    cache = PointCache()
+    assert (cache.key(**first) == cache.key(**second)) is same, f"{cache.key(**first)} vs {cache.key(**second)}"
+
+
+def test_points_parsed_once():
+    cache = PointCache()
+    key = cache.key(query="WRO")
+    assert cache.get_points(key, logger) is None
+    cache.put(key, parcel_points)
+    first, second = cache.get_points(key, logger), cache.get_points(key, logger)
+    assert first is not second and all(a is b for a, b in zip(first, second))
+    assert [point.name for point in first] == [point["name"] for point in parcel_points["points"]]
+    assert (cache.hits, cache.misses) == (2, 1), f"cache: {cache}"
+
+
+def test_get_returns_copy():
+    cache = PointCache()
+    cache.put("key", parcel_points)
+    cache.get("key")["points"].clear()
+    assert cache.get("key") == parcel_points, f"cache: {cache}"
+
+
+def test_ttl_and_eviction():
+    cache = PointCache(ttl=0)
+    cache.put("stale", parcel_points)
+    assert cache.get("stale") is None and cache.purge_expired() == 1
+
+    cache = PointCache(max_entries=2)
+    for key in ("a", "b", "a", "c"):
+        if cache.get(key) is None:
+            cache.put(key, parcel_points)
+    assert list(cache._entries) == ["a", "c"], f"entries: {list(cache._entries)}"
+
+
+def test_persistence(tmp_path):
+    cache = PointCache(path=tmp_path / "points.db")
+    key = cache.key(latitude=51.0775, longitude=17.04745)
+    cache.put(key, parcel_points)
+    cache.close()
+
+    restored = PointCache(path=tmp_path / "points.db")
+    assert restored.get(key) == parcel_points and len(restored) == 1, f"restored: {restored}"
@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+
+from inpost.points import PointDatabase, SyncDelta
+from inpost.static import Point, parcel_points_url
+from tests.fake_inpost import PointPages, run
+from tests.test_data import parcel_points
+
+logger = logging.getLogger(__name__)
+
+
+def _points(payload=parcel_points):
+    return [Point(point_data=data, logger=logger) for data in payload["points"]]
+
+
+@pytest.fixture
+def database():
+    database = PointDatabase(":memory:", logger)
+    database.apply(_points())
+    yield database
+    database.close()
+
+
+def test_delta_sync(database):
+    points = _points()
+    points[1].opening_hours = "pn-pt 08:00-16:00"
+    del points[2]
+    points.append(
+        Point(point_data={"name": "GXO05M", "location": {"latitude": 52.0, "longitude": 21.0}}, logger=logger)
+    )
+
+    assert database.apply(points) == SyncDelta(inserted=1, updated=1, deleted=1, unchanged=4)
+    assert database.apply(points) == SyncDelta(unchanged=6)
+    assert database.get("WRO61M").opening_hours == "pn-pt 08:00-16:00" and database.get("WRO07BAPP") is None
+
+
+def test_queries(database):
+    assert database.get("KRA01N").to_dict() == _points()[-1].to_dict()
+    assert [p.name for p in database.by_city("Warszawa")] == ["WAW104M", "WAW22A"]
+    assert [p.name for p in database.by_post_code("54-203")] == ["WRO61M"]
+    assert [p.name for p, _ in database.within(52.2297, 21.0122, 2_000)] == ["WAW22A", "WAW104M"]
+
+
+def test_sync_from_api(database):
+    pages = PointPages(parcel_points["points"][:4])
+    _, delta = run(lambda inpost: database.sync(inpost, per_page=2), {parcel_points_url: pages})
+    assert delta == SyncDelta(deleted=2, unchanged=4), f"delta: {delta}"
+    assert len(database) == 4
+
+
+def test_failed_sync_deletes_nothing(database):
+    pages = PointPages(parcel_points["points"], fail_on=2)
+    with pytest.raises(ConnectionError):
+        run(lambda inpost: database.sync(inpost, per_page=2, concurrency=1), {parcel_points_url: pages})
+    assert len(database) == 6
+
+
+def test_resumed_sync_deletes_nothing(database, tmp_path):
+    checkpoint = str(tmp_path / "sync.json")
+    pages = PointPages(parcel_points["points"], fail_on=2)
+    with pytest.raises(ConnectionError):
+        run(
+            lambda inpost: database.sync(inpost, per_page=2, concurrency=1, checkpoint=checkpoint),
+            {parcel_points_url: pages},
+        )
+
+    pages.fail_on = None
+    _, delta = run(lambda inpost: database.sync(inpost, per_page=2, checkpoint=checkpoint), {parcel_points_url: pages})
+    assert delta == SyncDelta(unchanged=4), f"delta: {delta}"
+    assert len(database) == 6
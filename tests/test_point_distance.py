@@ -0,0 +1,46 @@
+import logging
+import random
+
+import pytest
+
+from inpost.points import PointIndex, haversine
+from inpost.static import Point
+from tests.test_data import parcel_points
+
+np = pytest.importorskip("numpy")
+from inpost.points.distance import PointDistances  # noqa: E402
+
+logger = logging.getLogger(__name__)
+points = [Point(point_data=data, logger=logger) for data in parcel_points["points"]] + [
+    Point(point_data={"name": "NOWHERE"}, logger=logger)
+]
+distances = PointDistances(points)
+
+
+def test_distances_match_haversine():
+    result = distances.distances(52.2297, 21.0122)
+    expected = [haversine(52.2297, 21.0122, p.latitude, p.longitude) for p in points[:-1]]
+    assert np.allclose(result[:-1], expected) and np.isnan(result[-1]), f"result: {result}"
+
+
+@pytest.mark.parametrize("k", [1, 3, 6, 10])
+def test_nearest(k):
+    result = [(p.name, round(d)) for p, d in distances.nearest(51.1100, 17.0300, k=k)]
+    expected = [(p.name, round(d)) for p, d in PointIndex(points).nearest(51.1100, 17.0300, k=k)]
+    assert result == expected, f"result: {result} != expected: {expected}"
+
+
+def test_within():
+    mask = distances.within_mask(52.2297, 21.0122, 2_000)
+    assert [p.name for p, _ in distances.within(52.2297, 21.0122, 2_000)] == ["WAW22A", "WAW104M"]
+    assert mask.tolist() == [False, False, False, True, True, False, False]
+
+
+def test_assign_matches_brute_force():
+    rng = random.Random(7)
+    users = [(rng.uniform(49, 55), rng.uniform(14, 24)) for _ in range(100)]
+    indices, meters = distances.assign([u[0] for u in users], [u[1] for u in users])
+    assert distances.matrix([u[0] for u in users], [u[1] for u in users]).shape == (100, 7)
+    for (latitude, longitude), index, distance in zip(users, indices, meters):
+        (point, expected), *_ = PointIndex(points).nearest(latitude, longitude)
+        assert points[index] is point and distance == pytest.approx(expected)
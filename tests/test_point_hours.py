@@ -0,0 +1,61 @@
+import logging
+from datetime import datetime, timezone
+
+import pytest
+
+from inpost.points import OpeningHours, OpeningHoursIndex, minute_of_week, parse_opening_hours
+from inpost.static import Point
+from tests.test_data import parcel_points
+
+DAY = 24 * 60
+points = [Point(point_data=data, logger=logging.getLogger(__name__)) for data in parcel_points["points"]]
+index = OpeningHoursIndex(points)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("24/7", OpeningHours([], always=True)),
+        ("pn-nd 00:00-24:00", OpeningHours([], always=True)),
+        (
+            "pn-pt 08:00-20:00, sb 09:00-14:00",
+            OpeningHours([(d * DAY + 480, d * DAY + 1200) for d in range(5)] + [(5 * DAY + 540, 5 * DAY + 840)]),
+        ),
+        (
+            "Pn-Pt: 7-22; Sb: 8-16; Nd: nieczynne",
+            OpeningHours([(d * DAY + 420, d * DAY + 1320) for d in range(5)] + [(5 * DAY + 480, 5 * DAY + 960)]),
+        ),
+        ("Sob, Niedz 10:30-14", OpeningHours([(5 * DAY + 630, 5 * DAY + 840), (6 * DAY + 630, 6 * DAY + 840)])),
+        ("Nd 22:00-02:00", OpeningHours([(0, 120), (6 * DAY + 1320, 7 * DAY)])),
+        ("Śr 10-12", OpeningHours([(2 * DAY + 600, 2 * DAY + 720)])),
+        ("nieczynne", OpeningHours([])),
+        ("zapytaj w sklepie", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_opening_hours(text, expected):
+    result = parse_opening_hours(text)
+    assert result == expected, f"result: {result} != expected: {expected}"
+
+
+def test_minute_of_week():
+    # 2024-01-06 is Saturday, 20:00 UTC is 21:00 in Warsaw
+    assert minute_of_week(datetime(2024, 1, 6, 21, 0)) == 5 * DAY + 21 * 60
+    assert minute_of_week(datetime(2024, 1, 6, 20, 0, tzinfo=timezone.utc)) == 5 * DAY + 21 * 60
+
+
+@pytest.mark.parametrize(
+    "when, expected",
+    [
+        (datetime(2024, 1, 3, 12, 0), ["WRO23A", "WRO61M", "WRO07BAPP", "WAW22A", "WAW104M", "KRA01N"]),
+        (datetime(2024, 1, 3, 21, 30), ["WRO23A", "WRO61M", "WAW22A", "WAW104M", "KRA01N"]),
+        (datetime(2024, 1, 6, 15, 0), ["WRO23A", "WRO61M", "WAW22A", "WAW104M", "KRA01N"]),
+        (datetime(2024, 1, 7, 12, 0), ["WRO23A", "WRO61M", "WAW22A", "KRA01N"]),
+        (datetime(2024, 1, 7, 23, 30), ["WRO23A", "WRO61M", "WAW22A"]),
+    ],
+)
+def test_open_at(when, expected):
+    result = [point.name for point in index.open_at(when)]
+    assert result == expected, f"result: {result} != expected: {expected}"
+    assert index.open_mask(when) == [point.name in expected for point in points]
@@ -0,0 +1,52 @@
+import logging
+import random
+
+import pytest
+
+from inpost.points import PointIndex, haversine
+from inpost.static import ParcelDeliveryType, PaymentType, Point, PointType
+from tests.test_data import parcel_points
+
+logger = logging.getLogger(__name__)
+index = PointIndex.from_payload(parcel_points, logger)
+
+
+def test_haversine():
+    distance = haversine(52.2297, 21.0122, 50.0614, 19.9366)
+    assert 251_000 < distance < 253_000, f"distance: {distance}"
+
+
+@pytest.mark.parametrize(
+    "location, k, filters, expected",
+    [
+        ((51.0780, 17.0470), 1, {}, ["WRO23A"]),
+        ((51.1100, 17.0300), 3, {}, ["WRO07BAPP", "WRO61M", "WRO23A"]),
+        ((51.1100, 17.0300), 1, {"point_type": PointType.PL}, ["WRO61M"]),
+        ((51.1100, 17.0300), 1, {"easy_access_zone": True, "round_the_clock": True}, ["WRO61M"]),
+        ((51.1100, 17.0300), 1, {"point_type": "PL", "round_the_clock": False}, ["WAW104M"]),
+        ((51.1100, 17.0300), 2, {"delivery_type": ParcelDeliveryType.parcel_point}, ["WRO07BAPP", "KRA01N"]),
+        ((51.1100, 17.0300), 1, {"payment_type": PaymentType.NOTSUPPORTED}, ["WRO07BAPP"]),
+        ((52.2300, 21.0100), 10, {"max_distance": 5_000}, ["WAW22A", "WAW104M"]),
+    ],
+)
+def test_nearest(location, k, filters, expected):
+    result = [point.name for point, _ in index.nearest(*location, k=k, **filters)]
+    assert result == expected, f"result: {result} != expected: {expected}"
+
+
+def test_within():
+    result = [(point.name, round(distance)) for point, distance in index.within(52.2297, 21.0122, 2_000)]
+    assert [name for name, _ in result] == ["WAW22A", "WAW104M"] and result[0][1] == 0, f"result: {result}"
+
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(42)
+    points = [
+        Point({"name": str(i), "location": {"latitude": rng.uniform(49, 55), "longitude": rng.uniform(14, 24)}}, logger)
+        for i in range(2000)
+    ]
+    grid = PointIndex(points, cell_size=0.1)
+    for _ in range(50):
+        latitude, longitude = rng.uniform(48, 56), rng.uniform(13, 25)
+        expected = sorted(points, key=lambda p: haversine(latitude, longitude, p.latitude, p.longitude))[:5]
+        assert [p for p, _ in grid.nearest(latitude, longitude, k=5)] == expected
@@ -0,0 +1,49 @@
+import logging
+
+import pytest
+
+from inpost.points import PointSearchIndex, fold
+from tests.test_data import parcel_points
+
+index = PointSearchIndex.from_payload(parcel_points, logging.getLogger(__name__))
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("Łódź", "lodz"), ("Świdnicka", "swidnicka"), ("MARSZAŁKOWSKA", "marszalkowska"), ("Kraków", "krakow")],
+)
+def test_fold(text, expected):
+    assert fold(text) == expected, f"fold: {fold(text)} != expected: {expected}"
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("WRO61M", ["WRO61M"]),
+        ("wro6", ["WRO61M"]),
+        ("swidn", ["WRO07BAPP"]),
+        ("lobzowska", ["KRA01N"]),
+        ("warszawa zie", ["WAW104M"]),
+        ("00-62", ["WAW22A"]),
+        ("00624", ["WAW22A"]),
+        ("marszalkowsak", ["WAW22A"]),
+        ("zabka", ["WRO07BAPP"]),
+        ("gdansk", []),
+    ],
+)
+def test_search(query, expected):
+    result = [point.name for point, _ in index.search(query)]
+    assert result == expected, f"result: {result} != expected: {expected}"
+
+
+def test_name_ranked_above_other_fields():
+    result = [point.name for point, _ in index.search("waw")]
+    assert result == ["WAW104M", "WAW22A"], f"result: {result}"
+
+
+def test_distance_boost():
+    query = "wrocław"
+    plain = [point.name for point, _ in index.search(query)]
+    boosted = [point.name for point, _ in index.search(query, latitude=51.1098, longitude=17.0326)]
+    assert set(plain) == set(boosted) == {"WRO61M", "WRO07BAPP"}, f"plain: {plain}"
+    assert boosted[0] == "WRO07BAPP", f"boosted: {boosted}"
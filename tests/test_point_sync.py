@@ -0,0 +1,47 @@
+import pytest
+
+from inpost.points import PointSync
+from inpost.static import ParcelPointOperations, parcel_points_url
+from tests.fake_inpost import PointPages, run
+from tests.test_data import parcel_points
+
+
+def _sync(pages, per_page, **kwargs):
+    async def scenario(inpost):
+        collected = []
+        report = await PointSync(inpost, per_page=per_page, **kwargs).run(collected.extend)
+        return report, collected
+
+    _, result = run(scenario, {parcel_points_url: pages})
+    return result
+
+
+@pytest.mark.parametrize("total", [True, False])
+def test_sync_all_pages(total):
+    pages = PointPages(parcel_points["points"] * 5, total=total)
+    report, points = _sync(pages, per_page=4, concurrency=3)
+    assert sorted(p.name for p in points) == sorted(p["name"] for p in pages.points), f"report: {report}"
+    assert report.pages == 8 and report.points == 30, f"report: {report}"
+
+
+def test_sync_page_request():
+    pages = PointPages(parcel_points["points"])
+    inpost, _ = run(lambda inpost: PointSync(inpost, per_page=4).run(lambda points: None), {parcel_points_url: pages})
+    params = [params for _, params, _ in inpost.calls]
+    assert params == [
+        {"filter": ParcelPointOperations.CREATE.value, "perPage": 4, "page": 1},
+        {"filter": ParcelPointOperations.CREATE.value, "perPage": 4, "page": 2},
+    ], f"params: {params}"
+
+
+def test_sync_resumes(tmp_path):
+    checkpoint = str(tmp_path / "sync.json")
+    pages = PointPages(parcel_points["points"] * 5, fail_on=5)
+    with pytest.raises(ConnectionError):
+        _sync(pages, per_page=4, concurrency=1, checkpoint=checkpoint)
+
+    pages.fail_on, pages.requested = None, []
+    report, points = _sync(pages, per_page=4, concurrency=2, checkpoint=checkpoint)
+    assert sorted(pages.requested) == [5, 6, 7, 8], f"requested: {pages.requested}"
+    assert report.skipped_pages == 4 and len(points) == 14, f"report: {report}"
+    assert not (tmp_path / "sync.json").exists()
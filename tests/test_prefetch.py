@@ -0,0 +1,168 @@
+import asyncio
+
+from inpost.prefetch import CompartmentPrefetcher
+from inpost.static import Parcel, collect_url, compartment_open_url, terminate_collect_session_url, tracked_url
+from tests.fake_inpost import run
+from tests.test_collect import collect_routes, ready_parcel
+from tests.test_data import parcel_locker, parcel_properties
+
+NEAR = (51.0779, 17.0475)  # ~45 m from pickup point of test parcel
+FAR = (51.1079, 17.0385)
+
+
+def prefetch_routes(lifetime=40000):
+    return collect_routes() | {
+        collect_url: lambda params, data: parcel_properties | {"sessionExpirationTime": lifetime},
+        terminate_collect_session_url: lambda params, data: {},
+    }
+
+
+def parcels(inpost):
+    return [Parcel(ready_parcel(), inpost._log), Parcel(parcel_locker, inpost._log)]
+
+
+def test_prefetch_near_pickup_point():
+    async def scenario(inpost):
+        async with CompartmentPrefetcher(inpost, parcels=parcels(inpost)) as prefetcher:
+            assert await prefetcher.update_location(*FAR) == {}
+            validated = inpost.count(collect_url)
+            sessions = await prefetcher.update_location(*NEAR)
+            await prefetcher.update_location(*NEAR)
+            calls = len(inpost.calls)
+            async with await prefetcher.open(shipment_number="991798006092038618752844") as session:
+                assert len(inpost.calls) - calls == 1, "open was not the only request"
+        return validated, sessions, session
+
+    inpost, (validated, sessions, session) = run(scenario, prefetch_routes())
+    assert validated == 0, "parcel far away was validated"
+    assert list(sessions) == ["991798006092038618752844"], f"sessions: {sessions}"
+    assert list(session.timings.steps) == ["validate", "open", "terminate"]
+    assert inpost.count(collect_url) == 1 and inpost.count(compartment_open_url) == 1
+    assert inpost.count(terminate_collect_session_url) == 1
+
+
+def test_prefetch_terminates_when_user_leaves():
+    async def scenario(inpost):
+        prefetcher = CompartmentPrefetcher(inpost, parcels=parcels(inpost))
+        await prefetcher.update_location(*NEAR)
+        await prefetcher.update_location(*FAR)
+        return prefetcher
+
+    inpost, prefetcher = run(scenario, prefetch_routes())
+    assert prefetcher.sessions == {} and prefetcher._tasks == {}
+    assert inpost.count(terminate_collect_session_url) == 1
+
+
+def test_prefetch_keeps_session_warm():
+    async def scenario(inpost):
+        async with CompartmentPrefetcher(inpost, parcels=parcels(inpost), refresh_margin=0.05) as prefetcher:
+            await prefetcher.update_location(*NEAR)
+            await asyncio.sleep(0.25)
+            session = prefetcher.sessions["991798006092038618752844"]
+            assert not session.expired
+        return prefetcher
+
+    inpost, prefetcher = run(scenario, prefetch_routes(lifetime=100))
+    assert inpost.count(collect_url) >= 4, f"validations: {inpost.count(collect_url)}"
+    assert inpost.count(terminate_collect_session_url) == inpost.count(collect_url)
+    assert prefetcher.sessions == {} and prefetcher._tasks == {}
+
+
+def test_prefetch_stops_keeping_warm():
+    async def scenario(inpost):
+        prefetcher = CompartmentPrefetcher(inpost, parcels=parcels(inpost), refresh_margin=0.0, keep_warm=0.1)
+        await prefetcher.update_location(*NEAR)
+        await asyncio.sleep(0.3)
+        return prefetcher
+
+    inpost, prefetcher = run(scenario, prefetch_routes(lifetime=50))
+    assert prefetcher.sessions == {} and prefetcher._tasks == {}
+    assert 2 <= inpost.count(collect_url) <= 4, f"validations: {inpost.count(collect_url)}"
+
+
+def test_prefetch_open_without_warm_session():
+    async def scenario(inpost):
+        prefetcher = CompartmentPrefetcher(inpost)
+        async with await prefetcher.open(shipment_number="991798006092038618752844") as session:
+            pass
+        return session
+
+    inpost, session = run(scenario, prefetch_routes())
+    assert inpost.count(tracked_url) == 1 and list(session.timings.steps) == ["validate", "open", "terminate"]
+
+
+def slow_prefetch_routes(delay=0.05):
+    async def validate(params, data):
+        await asyncio.sleep(delay)
+        return parcel_properties | {"sessionExpirationTime": 40000}
+
+    return prefetch_routes() | {collect_url: validate}
+
+
+def test_prefetch_overlapping_updates_validate_once():
+    async def scenario(inpost):
+        prefetcher = CompartmentPrefetcher(inpost, parcels=parcels(inpost))
+        await asyncio.gather(prefetcher.update_location(*NEAR), prefetcher.update_location(*NEAR))
+        sessions = dict(prefetcher.sessions)
+        await prefetcher.close()
+        return sessions
+
+    inpost, sessions = run(scenario, slow_prefetch_routes())
+    assert list(sessions) == ["991798006092038618752844"], f"sessions: {sessions}"
+    assert inpost.count(collect_url) == 1 and inpost.count(terminate_collect_session_url) == 1
+
+
+def test_prefetch_terminates_session_validated_after_user_left():
+    async def scenario(inpost):
+        prefetcher = CompartmentPrefetcher(inpost, parcels=parcels(inpost))
+        near = asyncio.create_task(prefetcher.update_location(*NEAR))
+        await asyncio.sleep(0.01)
+        await prefetcher.update_location(*FAR)
+        await near
+        return prefetcher
+
+    inpost, prefetcher = run(scenario, slow_prefetch_routes())
+    assert prefetcher.sessions == {} and prefetcher._tasks == {}
+    assert inpost.count(terminate_collect_session_url) == 1
+
+
+def test_prefetch_open_terminates_expired_session():
+    async def scenario(inpost):
+        prefetcher = CompartmentPrefetcher(inpost, parcels=parcels(inpost))
+        await prefetcher.update_location(*NEAR)
+        prefetcher.sessions["991798006092038618752844"]._expires_at = 0.0
+        async with await prefetcher.open(shipment_number="991798006092038618752844") as session:
+            pass
+        return session
+
+    inpost, session = run(scenario, prefetch_routes())
+    assert inpost.count(collect_url) == 2 and inpost.count(terminate_collect_session_url) == 2
+    assert list(session.timings.steps) == ["validate", "open", "terminate"]
+
+
+def test_prefetch_cancelled_validation_terminates_session():
+    uuids = iter(["first", "second"])
+
+    async def scenario(inpost):
+        collect = inpost.collect_compartment_properties
+
+        async def collect_and_hang(**kwargs):
+            parcel_obj = await collect(**kwargs)
+            if parcel_obj.compartment_properties.session_uuid == "second":
+                await asyncio.sleep(10)
+            return parcel_obj
+
+        inpost.collect_compartment_properties = collect_and_hang
+        prefetcher = CompartmentPrefetcher(inpost, parcels=parcels(inpost), refresh_margin=0.05)
+        await prefetcher.update_location(*NEAR)
+        await asyncio.sleep(0.1)
+        await prefetcher.close()
+        return prefetcher
+
+    routes = prefetch_routes(lifetime=100) | {
+        collect_url: lambda params, data: parcel_properties | {"sessionExpirationTime": 100, "sessionUuid": next(uuids)}
+    }
+    inpost, prefetcher = run(scenario, routes)
+    terminated = [data["sessionUuid"] for url, _, data in inpost.calls if url == terminate_collect_session_url]
+    assert sorted(terminated) == ["first", "second"], f"terminated: {terminated}"
+    assert prefetcher.sessions == {} and prefetcher._tasks == {}
@@ -0,0 +1,132 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+
+from inpost.static import qr
+from inpost.static.qr import (
+    QRImageCache,
+    cached_compact_png,
+    cached_png,
+    matrix_to_png,
+    matrix_to_svg,
+    pack_matrix,
+    render_many,
+    render_matrix,
+    render_png,
+    tile_sheet,
+)
+from tests.test_data import qr_result
+
+
+def test_cached_png_matches_render():
+    cache = QRImageCache()
+    first, second = cached_png("P|524507211|465649", cache=cache), cached_png("P|524507211|465649", cache=cache)
+    assert first is not second and first.read() == second.read() == qr_result
+    assert (cache.hits, cache.misses) == (1, 1), f"cache: {cache}"
+
+
+@pytest.mark.parametrize("options", [{"box_size": 2}, {"border": 1}])
+def test_cached_png_keyed_by_options(options):
+    cache = QRImageCache()
+    image = cached_png("P|524507211|465649", cache=cache, **options).read()
+    assert image == render_png("P|524507211|465649", **options) and image != qr_result
+    assert cache.misses == 1, f"cache: {cache}"
+
+
+def test_eviction_by_size():
+    cache = QRImageCache(max_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    cache.get("a", lambda: b"")
+    cache.put("c", b"12345")
+    cache.put("too big", b"12345678901")
+    assert list(cache._images) == ["a", "c"] and cache.size == 10, f"cache: {cache}"
+    assert cache.evictions == 1, f"cache: {cache}"
+
+
+@pytest.mark.parametrize("module_size", [1, 3])
+def test_compact_png_matches_matrix(module_size):
+    from PIL import Image
+
+    matrix = render_matrix("P|524507211|465649")
+    image = Image.open(BytesIO(matrix_to_png(matrix, module_size=module_size)))
+    side = len(matrix) * module_size
+    assert image.size == (side, side), f"image.size: {image.size} != expected: {(side, side)}"
+    pixels = [[image.getpixel((x, y)) == 0 for x in range(0, side, module_size)] for y in range(0, side, module_size)]
+    assert pixels == matrix
+
+
+def test_compact_png_smaller_than_pillow_render():
+    image = cached_compact_png("P|524507211|465649", cache=QRImageCache()).read()
+    assert len(image) < len(qr_result), f"len(image): {len(image)} >= {len(qr_result)}"
+
+
+@pytest.mark.parametrize("version, error_correction, mask_pattern", [(3, 2, 5), (2, 1, 0), (7, 0, 3), (12, 3, 6)])
+def test_render_matrix_matches_qrcode(version, error_correction, mask_pattern):
+    import qrcode
+
+    qr = qrcode.QRCode(version=version, error_correction=error_correction, border=2, mask_pattern=mask_pattern)
+    qr.add_data("P|524507211|465649")
+    qr.make(fit=False)
+    matrix = render_matrix("P|524507211|465649", version, error_correction, border=2, mask_pattern=mask_pattern)
+    assert matrix == qr.get_matrix(), f"matrix of version {version} differs from qrcode"
+
+
+def test_render_matrix_overflow():
+    with pytest.raises(ValueError):
+        render_matrix("P|524507211|465649" * 10, version=1)
+
+
+def test_pack_matrix():
+    matrix = [[True, False, True], [False, False, True], [True, True, True]]
+    assert pack_matrix(matrix) == bytes([0b10100000, 0b00100000, 0b11100000])
+
+
+def test_matrix_to_svg():
+    svg = matrix_to_svg([[True, True, False], [False, False, False], [False, True, True]], module_size=2)
+    assert 'width="6"' in svg and 'd="M0,0h2v1h-2zM1,2h2v1h-2z"' in svg, f"svg: {svg}"
+
+
+async def _collect(payloads, **kwargs):
+    return [item async for item in render_many(payloads, **kwargs)]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_render_many(compact):
+    cache = QRImageCache()
+    payloads = ["P|524507211|465649", "P|524507211|000000", "P|524507211|465649"]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rendered = asyncio.run(_collect(payloads, executor=executor, compact=compact, cache=cache))
+        again = asyncio.run(_collect(payloads, executor=executor, compact=compact, cache=cache))
+
+    assert sorted(payload for payload, _ in rendered) == sorted(set(payloads)), f"rendered: {rendered}"
+    assert dict(rendered) == dict(again) and (cache.hits, cache.misses) == (2, 2), f"cache: {cache}"
+    if not compact:
+        assert dict(rendered)["P|524507211|465649"] == qr_result
+
+
+@pytest.mark.parametrize("batch, pooled", [(2, False), (5, True)])
+def test_render_many_default_executor(monkeypatch, batch, pooled):
+    monkeypatch.setattr(qr, "PROCESS_POOL_MIN_BATCH", 4)
+    monkeypatch.setattr(qr, "_process_pool", None)
+    payloads = [f"P|524507211|{number:06d}" for number in range(batch)]
+    try:
+        rendered = asyncio.run(_collect(payloads, compact=True, cache=QRImageCache()))
+        pool = qr._process_pool
+        asyncio.run(_collect(payloads, compact=True, cache=QRImageCache()))
+        assert qr._process_pool is pool, "process pool was not reused"
+    finally:
+        if qr._process_pool is not None:
+            qr._process_pool.shutdown()
+
+    assert len(rendered) == batch and (pool is not None) == pooled, f"pool: {pool}"
+
+
+def test_tile_sheet():
+    from PIL import Image
+
+    image = matrix_to_png(render_matrix("P|524507211|465649"), module_size=2)
+    sheet = Image.open(tile_sheet([image] * 5, columns=2, padding=10))
+    assert sheet.size == (2 * 74 + 10, 3 * 74 + 20), f"sheet.size: {sheet.size}"
@@ -0,0 +1,121 @@
+import asyncio
+import copy
+
+import pytest
+
+from inpost.static import (
+    CompartmentActualStatus,
+    CompartmentStatusTimeoutError,
+    MissingParamsError,
+    SentParcel,
+    confirm_sent_url,
+    open_sent_url,
+    sent_url,
+    status_sent_url,
+    terminate_collect_session_url,
+    validate_sent_url,
+)
+from tests.fake_inpost import run
+from tests.test_data import parcel_locker, parcel_properties
+
+
+def sent_parcel():
+    return copy.deepcopy(parcel_locker) | {
+        "status": "CONFIRMED",
+        "confirmationDate": "2022-11-29T12:00:00.000Z",
+        "shipmentType": "parcel",
+        "parcelSize": "A",
+        "quickSendCode": 123456,
+        "dropOffPoint": copy.deepcopy(parcel_locker["pickUpPoint"]),
+    }
+
+
+def send_routes(statuses=("OPENED", "CLOSED")):
+    statuses = iter(statuses)
+    return {
+        sent_url: lambda params, data: sent_parcel(),
+        validate_sent_url: lambda params, data: parcel_properties,
+        open_sent_url: lambda params, data: {},
+        status_sent_url: lambda params, data: {"status": next(statuses)},
+        confirm_sent_url: lambda params, data: {},
+        terminate_collect_session_url: lambda params, data: {},
+    }
+
+
+@pytest.mark.parametrize(
+    "fetch, steps",
+    [
+        (False, ["validate", "open", "status", "confirm"]),
+        (True, ["get_parcel", "validate", "open", "status", "confirm"]),
+    ],
+)
+def test_send(fetch, steps):
+    async def scenario(inpost):
+        if fetch:
+            return await inpost.send(drop_off_point="GXO05M", shipment_number="991798006092038618752844")
+        return await inpost.send(drop_off_point="GXO05M", parcel_obj=SentParcel(sent_parcel(), inpost._log))
+
+    inpost, result = run(scenario, send_routes())
+    assert result.ok and result.status == CompartmentActualStatus.CLOSED, f"result: {result}"
+    assert list(result.timings.steps) == steps, f"steps: {list(result.timings.steps)}"
+    urls = [url for url, _, _ in inpost.calls][int(fetch) :]  # noqa: E203
+    assert urls == [validate_sent_url, open_sent_url, status_sent_url, status_sent_url, confirm_sent_url], urls
+    assert inpost.calls[-1] == (confirm_sent_url, None, {"sessionUuid": parcel_properties["sessionUuid"]})
+
+
+def test_send_not_confirmed_when_compartment_stays_open():
+    async def scenario(inpost):
+        with pytest.raises(CompartmentStatusTimeoutError):
+            await inpost.send(drop_off_point="GXO05M", parcel_obj=SentParcel(sent_parcel(), inpost._log), timeout=0.3)
+
+    inpost, _ = run(scenario, send_routes(["OPENED"] * 10))
+    assert inpost.count(confirm_sent_url) == 0
+    assert inpost.calls[-1] == (
+        terminate_collect_session_url,
+        None,
+        {"sessionUuid": parcel_properties["sessionUuid"]},
+    ), f"last call: {inpost.calls[-1]}"
+
+
+def test_send_terminates_session_when_open_fails():
+    def open_compartment(params, data):
+        raise ConnectionError("compartment did not open")
+
+    async def scenario(inpost):
+        with pytest.raises(ConnectionError):
+            await inpost.send(drop_off_point="GXO05M", parcel_obj=SentParcel(sent_parcel(), inpost._log))
+
+    inpost, _ = run(scenario, send_routes() | {open_sent_url: open_compartment})
+    assert inpost.count(status_sent_url) == 0, f"status calls: {inpost.count(status_sent_url)}"
+    assert inpost.count(terminate_collect_session_url) == 1, f"calls: {inpost.calls}"
+
+
+def test_send_keeps_error_when_terminate_fails():
+    def terminate(params, data):
+        raise ConnectionError("terminate failed")
+
+    async def scenario(inpost):
+        with pytest.raises(CompartmentStatusTimeoutError):
+            await inpost.send(drop_off_point="GXO05M", parcel_obj=SentParcel(sent_parcel(), inpost._log), timeout=0.3)
+
+    inpost, _ = run(scenario, send_routes(["OPENED"] * 10) | {terminate_collect_session_url: terminate})
+    assert inpost.count(confirm_sent_url) == 0
+
+
+def test_send_deadline_covers_requests():
+    async def validate(params, data):
+        await asyncio.sleep(1)
+        return parcel_properties
+
+    async def scenario(inpost):
+        with pytest.raises(asyncio.TimeoutError):
+            await inpost.send(drop_off_point="GXO05M", parcel_obj=SentParcel(sent_parcel(), inpost._log), timeout=0.1)
+
+    inpost, _ = run(scenario, send_routes() | {validate_sent_url: validate})
+    assert inpost.count(open_sent_url) == 0
+    assert inpost.count(terminate_collect_session_url) == 0
+
+
+def test_send_params():
+    with pytest.raises(MissingParamsError):
+        run(lambda inpost: inpost.send(drop_off_point="GXO05M"), {})
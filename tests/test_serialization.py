@@ -0,0 +1,135 @@
+import copy
+import json
+import logging
+import pickle
+
+import pytest
+
+from inpost.static import SerializationError, tracked_url
+from inpost.static.parcels import Parcel, PointRegistry, ReturnParcel, SentParcel
+from inpost.static.serialization import dumps, loads
+from tests.fake_inpost import run
+from tests.test_data import courier_parcel, parcel_locker, parcel_locker_multi, parcel_locker_multi_main
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [parcel_locker, parcel_locker_multi, parcel_locker_multi_main, courier_parcel],
+)
+def test_to_dict_round_trip(test_input):
+    parcel = Parcel(test_input, logging.getLogger(__name__))
+    restored = Parcel.from_dict(parcel.to_dict(), logging.getLogger(__name__))
+    assert repr(restored) == repr(parcel), f"restored: {restored!r} != expected: {parcel!r}"
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [parcel_locker, parcel_locker_multi, parcel_locker_multi_main, courier_parcel],
+)
+def test_binary_round_trip(test_input):
+    parcel = Parcel(test_input, logging.getLogger(__name__))
+    restored = loads(dumps(parcel), logging.getLogger(__name__))
+    assert repr(restored) == repr(parcel), f"restored: {restored!r} != expected: {parcel!r}"
+
+
+def sent_parcel():
+    return copy.deepcopy(parcel_locker) | {
+        "status": "CONFIRMED",
+        "confirmationDate": "2022-11-29T12:00:00.000Z",
+        "shipmentType": "parcel",
+        "parcelSize": "A",
+        "quickSendCode": 123456,
+        "dropOffPoint": copy.deepcopy(parcel_locker["pickUpPoint"]),
+    }
+
+
+def return_parcel():
+    return {
+        "shipmentNumber": "691798006092038618752844",
+        "status": "DELIVERED",
+        "uuid": "5f4e4bfb-2b4c-4f6c-9b5b-1c6d0d3f2f6a",
+        "rma": "RMA123",
+        "organizationName": "Sklep",
+        "createdDate": "2022-11-20T12:00:00.000Z",
+        "acceptedDate": "2022-11-21T12:00:00.000Z",
+        "expiryDate": "2022-12-20T12:00:00.000Z",
+        "sentDate": "2022-11-22T12:00:00.000Z",
+        "deliveredDate": "2022-11-23T12:00:00.000Z",
+        "orderNumber": "ZAM/1",
+        "formType": "DEFAULT",
+        "operations": parcel_locker["operations"],
+        "eventLog": parcel_locker["eventLog"],
+    }
+
+
+@pytest.mark.parametrize(
+    "parcel_class, test_input",
+    [(Parcel, parcel_locker), (SentParcel, sent_parcel()), (ReturnParcel, return_parcel())],
+)
+def test_binary_round_trip_parcel_types(parcel_class, test_input):
+    parcels = [parcel_class(test_input, logging.getLogger(__name__)) for _ in range(2)]
+    restored = loads(dumps(parcels), logging.getLogger(__name__))
+    assert [type(parcel) for parcel in restored] == [parcel_class] * 2, f"restored: {restored!r}"
+    assert [parcel.to_dict() for parcel in restored] == [parcel.to_dict() for parcel in parcels]
+    assert restored[0]._log.name == parcels[0]._log.name, f"logger: {restored[0]._log.name}"
+    assert not restored[0].update(test_input), "restored parcel differs from its source data"
+
+
+def test_binary_keeps_shared_points():
+    registry = PointRegistry()
+    parcels = [Parcel(parcel_locker, logging.getLogger(__name__), point_registry=registry) for _ in range(2)]
+    restored = loads(dumps(parcels), logging.getLogger(__name__), point_registry=PointRegistry())
+    assert restored[0].pickup_point is restored[1].pickup_point, "shared point restored twice"
+    assert not restored[0].update(parcel_locker), "restored point reported as changed"
+
+
+def test_binary_interns_repeated_strings():
+    parcels = [Parcel(parcel_locker, logging.getLogger(__name__)) for _ in range(10)]
+    binary, text = dumps(parcels), json.dumps([parcel.to_dict() for parcel in parcels])
+    assert len(binary) * 4 < len(text), f"len(binary): {len(binary)} not below len(text) / 4: {len(text) / 4}"
+
+    restored = loads(binary, logging.getLogger(__name__))
+    assert restored[0].pickup_point.name is restored[9].pickup_point.name
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [{"a": [1, -1, 2**40, -(2**70), 1.5, None, True, False, "zażółć"]}, [], ""],
+)
+def test_binary_plain_data(test_input):
+    restored = loads(dumps(test_input), logging.getLogger(__name__))
+    assert restored == test_input, f"restored: {restored} != expected: {test_input}"
+
+
+@pytest.mark.parametrize("test_input", [b"", b"JSON", b"IPB\x09\x00\x00", dumps({"a": "b"})[:-1]])
+def test_binary_invalid_payload(test_input):
+    with pytest.raises(SerializationError):
+        loads(test_input, logging.getLogger(__name__))
+
+
+def test_pickle_round_trip():
+    parcel = Parcel(parcel_locker, logging.getLogger(__name__))
+    restored = pickle.loads(pickle.dumps(parcel))
+    assert repr(restored) == repr(parcel), f"restored: {restored!r} != expected: {parcel!r}"
+
+
+def test_pickle_client_parcels():
+    async def scenario(inpost):
+        return await inpost.get_parcels(parse=True)
+
+    inpost, parcels = run(scenario, {tracked_url: lambda params, data: {"parcels": [parcel_locker, parcel_locker]}})
+    restored = pickle.loads(pickle.dumps(parcels))
+    assert parcels[0].pickup_point is parcels[1].pickup_point, "points are not shared by client parcels"
+    assert repr(restored) == repr(parcels), f"restored: {restored!r} != expected: {parcels!r}"
+    assert restored[0]._point_registry is None, "registry of client was pickled"
+
+
+def test_binary_restores_without_parsing(monkeypatch):
+    binary = dumps([Parcel(parcel_locker, logging.getLogger(__name__))])
+
+    def get(*args, **kwargs):
+        raise AssertionError("date parsed again")
+
+    monkeypatch.setattr("inpost.static.parcels.get", get)
+    restored = loads(binary, logging.getLogger(__name__))
+    assert restored[0].shipment_number == parcel_locker["shipmentNumber"], f"restored: {restored!r}"
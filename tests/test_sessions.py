@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from inpost.static import (
+    CollectSessionState,
+    CompartmentActualStatus,
+    Parcel,
+    SessionStateError,
+    collect_url,
+    compartment_open_url,
+    compartment_reopen_url,
+    compartment_status_url,
+    terminate_collect_session_url,
+    tracked_url,
+)
+from tests.fake_inpost import run
+from tests.test_collect import collect_routes, ready_parcel
+from tests.test_data import parcel_properties
+
+
+def session_routes(statuses=("CLOSED",)):
+    statuses = iter(statuses)
+    return collect_routes() | {
+        compartment_status_url: lambda params, data: {"status": next(statuses)},
+        compartment_reopen_url: lambda params, data: {},
+        terminate_collect_session_url: lambda params, data: {},
+    }
+
+
+def test_collect_session():
+    async def scenario(inpost):
+        async with inpost.collect_session(shipment_number="991798006092038618752844") as session:
+            await session.validate()
+            await session.open()
+            assert await session.status() == CompartmentActualStatus.OPENED
+            await session.reopen()
+            assert await session.wait_closed(timeout=5) == CompartmentActualStatus.CLOSED
+            assert session.state == CollectSessionState.CLOSED
+        return session
+
+    inpost, session = run(scenario, session_routes(["OPENED", "CLOSED"]))
+    assert session.state == CollectSessionState.TERMINATED, f"state: {session.state}"
+    assert list(session.timings.steps) == ["validate", "open", "status", "reopen", "terminate"]
+    urls = (tracked_url, compartment_reopen_url, terminate_collect_session_url)
+    assert [inpost.count(url) for url in urls] == [1, 1, 1], f"calls: {inpost.calls}"
+
+
+@pytest.mark.parametrize(
+    "steps, step",
+    [([], "open"), ([], "status"), ([], "terminate"), (["validate"], "validate"), (["validate"], "reopen")],
+)
+def test_collect_session_invalid_transition(steps, step):
+    async def scenario(inpost):
+        session = inpost.collect_session(parcel_obj=Parcel(ready_parcel(), inpost._log))
+        for done in steps:
+            await getattr(session, done)()
+        calls = len(inpost.calls)
+        with pytest.raises(SessionStateError):
+            await getattr(session, step)()
+        return len(inpost.calls) - calls
+
+    _, calls = run(scenario, session_routes())
+    assert calls == 0, f"{step} sent {calls} requests"
+
+
+def test_collect_session_terminates_on_error():
+    async def scenario(inpost):
+        with pytest.raises(RuntimeError):
+            async with inpost.collect_session(parcel_obj=Parcel(ready_parcel(), inpost._log)) as session:
+                await session.validate()
+                raise RuntimeError("user went away")
+        return session
+
+    inpost, session = run(scenario, session_routes())
+    assert session.state == CollectSessionState.TERMINATED
+    assert inpost.count(terminate_collect_session_url) == 1
+
+
+def test_collect_session_timeout_terminates():
+    async def open_slowly(params, data):
+        await asyncio.sleep(1)
+        return parcel_properties
+
+    async def scenario(inpost):
+        with pytest.raises(asyncio.TimeoutError):
+            async with inpost.collect_session(parcel_obj=Parcel(ready_parcel(), inpost._log), timeout=0.1) as session:
+                await session.validate()
+                await session.open()
+        return session
+
+    inpost, session = run(scenario, session_routes() | {compartment_open_url: open_slowly})
+    assert session.state == CollectSessionState.TERMINATED
+    assert inpost.count(terminate_collect_session_url) == 1
+
+
+def test_collect_session_expired():
+    async def scenario(inpost):
+        async with inpost.collect_session(parcel_obj=Parcel(ready_parcel(), inpost._log)) as session:
+            await session.validate()
+            await asyncio.sleep(0.06)
+            assert session.expired
+            with pytest.raises(SessionStateError):
+                await session.open()
+
+    routes = session_routes() | {collect_url: lambda params, data: parcel_properties | {"sessionExpirationTime": 50}}
+    inpost, _ = run(scenario, routes)
+    assert inpost.count(compartment_open_url) == 0 and inpost.count(terminate_collect_session_url) == 1
@@ -0,0 +1,83 @@
+import logging
+
+import pytest
+
+from inpost.static import timeline as timeline_module
+from inpost.static.parcels import Parcel
+from inpost.static.statuses import ParcelStatus
+from inpost.static.timeline import FleetTimeline, Timeline, percentile
+from tests.test_data import courier_parcel, parcel_locker
+
+
+@pytest.fixture(autouse=True, params=["numpy", "loops"])
+def backend(request, monkeypatch):
+    # every test runs against numpy arrays and against the pure python fallback
+    if request.param == "loops":
+        monkeypatch.setattr(timeline_module, "np", None)
+
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "values,q,expected",
+    [
+        ([], 50, None),
+        ([5], 99, 5),
+        ([1, 2, 3, 4], 50, 2.5),
+        ([4, 1, 3, 2], 100, 4),
+        ([1, 2, 3, 4], 0, 1),
+    ],
+)
+def test_percentile(values, q, expected):
+    result = percentile(values, q)
+    assert result == expected, f"percentile: {result} != expected: {expected}"
+
+
+def test_timeline_from_event_log_is_chronological():
+    timeline = Timeline.from_event_log(courier_parcel["eventLog"])
+    assert timeline.statuses[0] == ParcelStatus.CONFIRMED and timeline.statuses[-1] == ParcelStatus.DELIVERED
+    assert list(timeline.timestamps) == sorted(timeline.timestamps)
+
+
+@pytest.mark.parametrize("test_input", [parcel_locker, courier_parcel])
+def test_timeline_from_parcel_matches_payload(test_input):
+    parsed = Timeline.from_parcel(Parcel(test_input, logging.getLogger(__name__)))
+    raw = Timeline.from_event_log(test_input["eventLog"])
+    assert (parsed.codes, parsed.timestamps) == (raw.codes, raw.timestamps)
+
+
+def test_timeline_from_parcel_keeps_milliseconds():
+    event_log = [{"type": "PARCEL_STATUS", "name": "DELIVERED", "date": "2022-12-13T11:20:59.123Z"}]
+    parsed = Timeline.from_parcel(Parcel(courier_parcel | {"eventLog": event_log}, logging.getLogger(__name__)))
+    assert list(parsed.timestamps) == [1670930459123], f"timestamps: {parsed.timestamps}"
+
+
+def test_fleet_metrics_skip_empty_and_unmatched_parcels():
+    empty = courier_parcel | {"eventLog": []}
+    fleet = FleetTimeline.from_payload([empty, courier_parcel, empty])
+    latencies = list(fleet.latencies("ADOPTED_AT_SOURCE_BRANCH", ParcelStatus.DELIVERED))
+    assert len(latencies) == 1, f"latencies: {latencies}"
+    assert sum(fleet.transition_counts().values()) == len(courier_parcel["eventLog"]) - 1
+
+
+def test_fleet_metrics():
+    fleet = FleetTimeline.from_payload([courier_parcel, courier_parcel])
+    assert len(fleet) == 2 and len(fleet[1]) == len(courier_parcel["eventLog"])
+
+    # 2022-12-13T06:41:09 -> 2022-12-13T11:20:59
+    expected = (11 * 3600 + 20 * 60 + 59 - (6 * 3600 + 41 * 60 + 9)) * 1000
+    assert list(fleet.dwell_times(ParcelStatus.OUT_FOR_DELIVERY_TO_ADDRESS)) == [expected, expected]
+    assert "DELIVERED" not in fleet.dwell_time_totals()
+
+    transitions = fleet.transition_counts()
+    assert transitions[("ADOPTED_AT_SOURCE_BRANCH", "SENT_FROM_SOURCE_BRANCH")] == 2
+    assert transitions[("OUT_FOR_DELIVERY_TO_ADDRESS", "DELIVERED")] == 2
+
+    # first ADOPTED_AT_SOURCE_BRANCH is 2022-12-12T15:26:03
+    latency = (24 * 3600 + 11 * 3600 + 20 * 60 + 59 - (15 * 3600 + 26 * 60 + 3)) * 1000
+    assert fleet.latency_percentiles("ADOPTED_AT_SOURCE_BRANCH", ParcelStatus.DELIVERED) == {
+        50: latency,
+        90: latency,
+        99: latency,
+    }
+    assert list(fleet.latencies(ParcelStatus.DELIVERED, ParcelStatus.CONFIRMED)) == []
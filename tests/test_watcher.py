@@ -0,0 +1,194 @@
+import asyncio
+import copy
+import logging
+import time
+
+import arrow
+import pytest
+
+from inpost.static import Notification, Parcel, parcel_notifications_url, tracked_url
+from inpost.watcher import DEFAULT_INTERVAL, FAST_INTERVAL, NotificationWatcher, ParcelWatcher, parcel_interval
+from tests.fake_inpost import run
+from tests.test_data import parcel_locker
+
+NOW = arrow.get("2023-01-10T12:00:00Z").timestamp()
+
+
+def parcel_data(
+    shipment_number="991798006092038618752844", status="READY_TO_PICKUP", expiry=None, refresh=None, now=NOW
+):
+    data = copy.deepcopy(parcel_locker) | {"shipmentNumber": shipment_number, "status": status}
+    data["operations"]["refreshUntil"] = arrow.get(now + (refresh or 86400)).isoformat()
+    if expiry is not None:
+        data["expiryDate"] = arrow.get(now + expiry).isoformat()
+    return data
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, FAST_INTERVAL),
+        ({"status": "DELIVERED"}, None),
+        ({"status": "SENT_FROM_SOURCE_BRANCH"}, DEFAULT_INTERVAL),
+        ({"status": "SENT_FROM_SOURCE_BRANCH", "expiry": 20}, 20),
+        ({"expiry": -20}, FAST_INTERVAL),
+        ({"refresh": -1}, None),
+    ],
+)
+def test_parcel_interval(kwargs, expected):
+    parcel = Parcel(parcel_data(**kwargs), logging.getLogger(__name__))
+    assert parcel_interval(parcel, NOW) == expected, f"interval of {kwargs}"
+
+
+def test_next_interval():
+    async def scenario(inpost):
+        watcher = ParcelWatcher(inpost, min_interval=30, max_interval=3600)
+        empty = watcher.next_interval(NOW)
+        watcher.parcels = {
+            number: Parcel(parcel_data(number, status), inpost._log)
+            for number, status in [("1", "DELIVERED"), ("2", "SENT_FROM_SOURCE_BRANCH")]
+        }
+        transit = watcher.next_interval(NOW)
+        watcher.parcels["3"] = Parcel(parcel_data("3", expiry=5), inpost._log)
+        return empty, transit, watcher.next_interval(NOW)
+
+    _, intervals = run(scenario, {})
+    assert intervals == (3600, DEFAULT_INTERVAL, 30), f"intervals: {intervals}"
+
+
+def test_poll_emits_changes():
+    payloads = iter(
+        [
+            [parcel_data("1", "OUT_FOR_DELIVERY"), parcel_data("2", "DELIVERED")],
+            [parcel_data("1", "OUT_FOR_DELIVERY"), parcel_data("2", "DELIVERED")],
+            [parcel_data("1", "READY_TO_PICKUP")],
+        ]
+    )
+    received = []
+
+    async def on_change_async(event):
+        received.append(event.kind)
+
+    def broken(event):
+        raise RuntimeError("consumer failed")
+
+    async def scenario(inpost):
+        watcher = ParcelWatcher(inpost)
+        for callback in (received.append, broken, on_change_async):
+            watcher.on_change(callback)
+        return [await watcher.poll() for _ in range(3)]
+
+    _, (first, second, third) = run(scenario, {tracked_url: lambda params, data: {"parcels": next(payloads)}})
+    assert [(event.kind, event.parcel.shipment_number) for event in first] == [("added", "1"), ("added", "2")]
+    assert second == [], f"events without change: {second}"
+    assert [(event.kind, event.parcel.shipment_number) for event in third] == [("changed", "1"), ("removed", "2")]
+    assert third[0].changes.status_changed
+    assert [kind for kind in received if not isinstance(kind, str)] == first + third
+    assert [kind for kind in received if isinstance(kind, str)] == ["added", "added", "changed", "removed"]
+
+
+def test_events_iterator_adapts_interval():
+    statuses = iter(["SENT_FROM_SOURCE_BRANCH", "OUT_FOR_DELIVERY", "READY_TO_PICKUP", "DELIVERED"])
+
+    async def scenario(inpost):
+        watcher = ParcelWatcher(
+            inpost, min_interval=0.0, intervals={"SENT_FROM_SOURCE_BRANCH": 0.2, "OUT_FOR_DELIVERY": 0.01}
+        )
+        loop = asyncio.get_running_loop()
+        start, seen = loop.time(), []
+        async for event in watcher:
+            seen.append((event.parcel.status.name, loop.time() - start))
+            if event.parcel.status.name == "READY_TO_PICKUP":
+                watcher.stop()
+        return watcher, seen
+
+    inpost, (watcher, seen) = run(
+        scenario, {tracked_url: lambda params, data: {"parcels": [parcel_data(status=next(statuses), now=time.time())]}}
+    )
+    assert [status for status, _ in seen] == ["SENT_FROM_SOURCE_BRANCH", "OUT_FOR_DELIVERY", "READY_TO_PICKUP"]
+    (_, first), (_, second), (_, third) = seen
+    assert first < 0.1 and 0.2 <= second < 0.3 and third - second < 0.1, f"seen: {seen}"
+    assert watcher.polls == 3 and inpost.count(tracked_url) == 3
+
+
+def test_stop_before_start():
+    async def scenario(inpost):
+        watcher = ParcelWatcher(inpost, min_interval=0.0)
+        watcher.stop()
+        stopped = [event async for event in watcher]
+        restarted = []
+        async for event in watcher:
+            restarted.append(event)
+            watcher.stop()
+        return watcher, stopped, restarted
+
+    inpost, (watcher, stopped, restarted) = run(
+        scenario, {tracked_url: lambda params, data: {"parcels": [parcel_data(now=time.time())]}}
+    )
+    assert stopped == [], f"stopped: {stopped}"
+    assert [event.kind for event in restarted] == ["added"], f"restarted: {restarted}"
+    assert watcher.polls == 1 and inpost.count(tracked_url) == 1
+
+
+def notification(id_, shipment_number=None):
+    return {"id": id_, "type": "PUSH", "title": "Paczka", "shipmentNumber": shipment_number}
+
+
+def test_get_notifications():
+    async def scenario(inpost):
+        return await inpost.get_notifications(parse=True)
+
+    _, notifications = run(
+        scenario, {parcel_notifications_url: lambda params, data: [notification("a"), notification("b")]}
+    )
+    assert all(isinstance(item, Notification) for item in notifications), f"notifications: {notifications}"
+    assert [item.id for item in notifications] == ["a", "b"]
+
+
+def test_notification_watcher_new_notifications():
+    without_id = notification(None, "3") | {"title": "Inna paczka"}
+    windows = iter(
+        [
+            [notification("a"), notification("b", "1"), notification(None, "2")],
+            [notification("c"), notification("b", "1"), notification(None, "2"), without_id],
+            [],
+        ]
+    )
+
+    async def scenario(inpost):
+        watcher = NotificationWatcher(inpost)
+        first = await watcher._new_notifications()
+        second = await watcher._new_notifications()
+        third = await watcher._new_notifications()
+        return first, second, third
+
+    _, (first, second, third) = run(scenario, {parcel_notifications_url: lambda params, data: next(windows)})
+    assert len(first) == 3, f"first: {first}"
+    assert second == [notification("c"), without_id] and third == [], f"second: {second}, third: {third}"
+
+
+def test_notification_watcher():
+    windows = iter([[notification("a", "1")], [notification("a", "1"), notification("b", "2")], []])
+    statuses = {"1": "OUT_FOR_DELIVERY", "2": "OUT_FOR_DELIVERY"}
+
+    async def scenario(inpost):
+        watcher = NotificationWatcher(inpost, interval=15)
+        first = await watcher.poll()
+        statuses.update({"1": "READY_TO_PICKUP", "2": "READY_TO_PICKUP"})
+        second = await watcher.poll()
+        third = await watcher.poll()
+        return watcher, first, second, third
+
+    routes = {
+        f"{tracked_url}/": lambda params, data: parcel_data("2", statuses["2"], now=time.time()),
+        tracked_url: lambda params, data: {
+            "parcels": [parcel_data(number, status, now=time.time()) for number, status in statuses.items()]
+        },
+        parcel_notifications_url: lambda params, data: next(windows),
+    }
+    inpost, (watcher, first, second, third) = run(scenario, routes)
+    assert [event.kind for event in first] == ["added", "added"]
+    assert [(event.kind, event.parcel.shipment_number) for event in second] == [("changed", "2")]
+    assert third == [] and watcher.next_interval() == 15
+    assert inpost.count(f"{tracked_url}/") == 1 and inpost.count(parcel_notifications_url) == 3
+    assert inpost.count(tracked_url) == 2, "list was fetched more than once"